@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: engine construction cost and per-session memory
+
+Compares engines that reference the shared read_bharat.tables registry with
+the baseline behaviour, where every engine instance built and owned its own
+copy of each mapping table (the baseline compiled nothing, so neither does
+the "before" case here).
+
+Usage: python benchmarks/engine_construction.py [sessions]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from read_bharat import (  # noqa: E402
+    AdvancedTransliterationEngine,
+    ReverseTransliterationEngine,
+    TouristTranslationEngine,
+)
+from read_bharat import tables  # noqa: E402
+
+FORWARD_TABLES = [
+    tables.TAMIL_TO_DEVANAGARI, tables.ENGLISH_TO_DEVANAGARI, tables.ENGLISH_TO_TAMIL,
+    tables.ENGLISH_TO_MALAYALAM, tables.ENGLISH_TO_GURMUKHI,
+]
+REVERSE_TABLES = [
+    tables.DEVANAGARI_TO_ENGLISH, tables.TAMIL_TO_ENGLISH,
+    tables.MALAYALAM_TO_ENGLISH, tables.GURMUKHI_TO_ENGLISH,
+]
+
+
+def _literal(table) -> str:
+    """Python source of a table as the dict literal the baseline constructors spelled out"""
+    if hasattr(table, "items"):
+        items = ", ".join(f"{_literal(key)}: {_literal(value)}" for key, value in table.items())
+        return "{" + items + "}"
+    return repr(getattr(table, "value", table))
+
+
+# The baseline __init__ bodies evaluated these literals on every construction
+_OWNED_TABLES = compile(
+    "(" + ", ".join(
+        [f"[{', '.join(_literal(table) for table in FORWARD_TABLES)}]",
+         _literal(tables.PHONETIC_APPROXIMATION),
+         f"[{', '.join(_literal(table) for table in REVERSE_TABLES)}]",
+         _literal(tables.TOURIST_PHRASES)]
+    ) + ")",
+    "<baseline engines>", "eval",
+)
+
+
+def owned_tables_session():
+    """One session's engines as the baseline constructors built them: private table copies"""
+    return eval(_OWNED_TABLES)
+
+
+def shared_tables_session():
+    """One session's engines referencing the process-wide registry"""
+    return AdvancedTransliterationEngine(), ReverseTransliterationEngine(), TouristTranslationEngine()
+
+
+def measure(label: str, factory, sessions: int):
+    factory()  # warm the registry's compiled-trie cache
+    number = 200
+    per_call = min(timeit.repeat(factory, number=number, repeat=5)) / number
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [factory() for _ in range(sessions)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    per_session = (after - before) / sessions
+    print(f"{label:<28} {per_call * 1e6:>10.1f} µs/construct {per_session / 1024:>10.1f} KiB/session")
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"Engine construction ({sessions} sessions held in memory)")
+    measure("before: per-engine tables", owned_tables_session, sessions)
+    measure("after: shared registry", shared_tables_session, sessions)
+
+
+if __name__ == "__main__":
+    main()
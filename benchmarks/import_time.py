@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import cost of the text-only path
+
+Runs `python -X importtime` in fresh interpreters that import read_bharat and
+transliterate one word, and reports the best cumulative import time of the
+package with its most expensive modules. Fails when the time is over budget
+or when any heavy dependency (numpy, the OCR stack, Streamlit) was loaded.
+
+Usage: python benchmarks/import_time.py [budget_ms] [runs]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_BUDGET_MS = 80.0
+
+# Modules the text-only path must never import
+HEAVY_MODULES = ("numpy", "torch", "cv2", "easyocr", "PIL", "pytesseract", "streamlit", "sqlite3")
+
+SNIPPET = """
+import sys
+import read_bharat
+engine = read_bharat.AdvancedTransliterationEngine()
+engine.transliterate("namaste", "tamil")
+engine.cross_script_transliterate_all("नमस्ते", "devanagari", ["tamil"])
+print(",".join(sorted({name.split(".")[0] for name in sys.modules})))
+"""
+
+
+def run_once():
+    """Import timings (module -> (self µs, cumulative µs)) and the top-level modules loaded"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SNIPPET],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # header line
+        timings[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    loaded = set(completed.stdout.strip().split(","))
+    return timings, loaded
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    results = [run_once() for _ in range(runs)]
+    timings, loaded = min(results, key=lambda result: result[0]["read_bharat"][1])
+    total_ms = timings["read_bharat"][1] / 1000
+
+    print(f"import read_bharat: {total_ms:.1f} ms (best of {runs}, budget {budget_ms:.0f} ms)")
+    print("Most expensive modules (self time):")
+    for name, (self_us, cumulative_us) in sorted(timings.items(), key=lambda item: -item[1][0])[:10]:
+        print(f"  {name:<32} {self_us / 1000:>7.1f} ms self {cumulative_us / 1000:>7.1f} ms cumulative")
+
+    heavy = sorted(set(HEAVY_MODULES) & loaded)
+    if heavy:
+        print(f"❌ Heavy modules imported on the text-only path: {', '.join(heavy)}")
+    if total_ms > budget_ms:
+        print(f"❌ Import time over budget: {total_ms:.1f} ms > {budget_ms:.0f} ms")
+    if heavy or total_ms > budget_ms:
+        return 1
+    print("✅ Within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
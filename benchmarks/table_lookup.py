@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hot-path table lookups
+
+Converts the same English words and Devanagari text through three versions
+of the mapping tables:
+
+- dict tries: MappingTrie over dicts read from read_bharat/data/*.tsv, as
+  the engines compiled them before the binary artifact existed;
+- mapped arrays: the artifact's MappedTable, walking the memory-mapped
+  uint32 arrays on every character;
+- registry: what the engines use now, read_bharat.tables decoding each
+  artifact table into a dict trie on first use, once per process, and
+  reading whole-word entries from that trie.
+
+The registry should match the dict tries; the mapped arrays are shown for
+reference.
+
+Usage: python benchmarks/table_lookup.py [repeat]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from read_bharat import tables  # noqa: E402
+from read_bharat.artifact import load_sources  # noqa: E402
+from read_bharat.matcher import MappingTrie  # noqa: E402
+from read_bharat.scripts import Script  # noqa: E402
+
+# Timing noise allowed before the registry counts as a regression
+TOLERANCE = 1.15
+
+ENGLISH_WORDS = (
+    "namaste welcome thank you please water food hotel station ticket market temple "
+    "doctor hospital police help taxi bus train how much cheap expensive left right "
+    "mumbai delhi chennai kolkata bangalore hyderabad jaipur amritsar kochi madurai"
+).split() * 200
+
+
+def devanagari_text() -> str:
+    phrases = [
+        translations[Script.DEVANAGARI]
+        for category in tables.TOURIST_PHRASES.values()
+        for translations in category.values()
+    ]
+    return " ".join(phrases * 200)
+
+
+def english_lookup(mapping, trie):
+    """transliterate_with_mapping without the word cache: whole-word entry, else trie"""
+    def run():
+        for word in ENGLISH_WORDS:
+            if word in mapping:
+                mapping[word]
+            else:
+                trie.convert(word)
+    return run
+
+
+def registry_lookup(trie):
+    """transliterate_with_mapping as the engine runs it: whole-word entry from the trie, else convert"""
+    def run():
+        for word in ENGLISH_WORDS:
+            if trie.get(word) is None:
+                trie.convert(word)
+    return run
+
+
+def compare(title: str, runs, repeat: int) -> bool:
+    """Time the versions in interleaved rounds (best of repeat); True if the registry kept up"""
+    best = dict.fromkeys(runs, float("inf"))
+    for _ in range(repeat):
+        for label, run in runs.items():
+            best[label] = min(best[label], timeit.timeit(run, number=1))
+    print(title)
+    for label, seconds in best.items():
+        print(f"  {label:<16} {seconds * 1000:8.2f} ms")
+    return best["registry"] <= best["dict tries"] * TOLERANCE
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    sources = load_sources()
+    text = devanagari_text()
+
+    english = sources["english_to_devanagari"]
+    english_mapped = tables.ENGLISH_TO_DEVANAGARI
+    ok = compare(f"English words ({len(ENGLISH_WORDS)} words → Devanagari)", {
+        "dict tries": english_lookup(english, MappingTrie(english)),
+        "mapped arrays": english_lookup(english_mapped, english_mapped),
+        "registry": registry_lookup(tables.compiled(tables.ENGLISH_TO_DEVANAGARI)),
+    }, repeat)
+
+    reverse = MappingTrie(sources["devanagari_to_english"])
+    reverse_mapped = tables.DEVANAGARI_TO_ENGLISH
+    reverse_registry = tables.compiled(tables.DEVANAGARI_TO_ENGLISH)
+    ok &= compare(f"devanagari_to_english ({len(text):,} chars)", {
+        "dict tries": lambda: reverse.convert(text),
+        "mapped arrays": lambda: reverse_mapped.convert(text),
+        "registry": lambda: reverse_registry.convert(text),
+    }, repeat)
+
+    if not ok:
+        print(f"❌ Registry lookups are more than {TOLERANCE - 1:.0%} slower than the dict tries")
+        return 1
+    print("✅ Registry lookups match the dict tries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
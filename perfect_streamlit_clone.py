@@ -8,17 +8,24 @@ import streamlit as st
 import requests
 import json
 import time
-import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from enum import Enum
 import io
-from PIL import Image
-import numpy as np
-import cv2
-import easyocr
-import pytesseract
-from pathlib import Path
+from read_bharat import detection, routing
+from read_bharat.engine import (
+    AdvancedTransliterationEngine,
+    ReverseTransliterationEngine,
+    TouristTranslationEngine,
+)
+from read_bharat.ocr import ImageProcessingEngine, cascade_counters
+from read_bharat.ocr_cache import CachedOCR, shared_ocr_cache
+from read_bharat.readers import shared_reader_pool
+from read_bharat.routing import Route, route_counters
+from read_bharat.scripts import Script
+from read_bharat.store import TransliterationStore
+
+if TYPE_CHECKING:
+    from read_bharat.imaging import ImageSource
 
 # Page configuration
 st.set_page_config(
@@ -247,13 +254,7 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Script Types and Data Classes (matching React app structure)
-class Script(str, Enum):
-    DEVANAGARI = "devanagari"
-    TAMIL = "tamil"
-    MALAYALAM = "malayalam"
-    GURMUKHI = "gurmukhi"
-
+# Data Classes (matching React app structure)
 @dataclass
 class TransliterationResult:
     text: str
@@ -336,460 +337,6 @@ SCRIPTS = {
     }
 }
 
-# Advanced Transliteration Engine (Complete replica from React app)
-class AdvancedTransliterationEngine:
-    """Advanced transliteration engine matching the React app implementation"""
-
-    def __init__(self):
-        # Enhanced Tamil to Devanagari mapping (from your React app)
-        self.tamil_to_devanagari_map = {
-            # Vowels
-            'அ': 'अ', 'ஆ': 'आ', 'இ': 'इ', 'ஈ': 'ई', 'உ': 'उ', 'ஊ': 'ऊ',
-            'எ': 'ए', 'ஏ': 'ऐ', 'ஐ': 'ऐ', 'ஒ': 'ओ', 'ஓ': 'औ', 'ஔ': 'औ',
-
-            # Consonants
-            'க': 'क', 'ங': 'ङ', 'ச': 'च', 'ஞ': 'ञ', 'ட': 'ट', 'ண': 'ण',
-            'த': 'त', 'ந': 'न', 'ப': 'प', 'ம': 'म', 'ய': 'य', 'ர': 'र',
-            'ல': 'ल', 'வ': 'व', 'ழ': 'ष', 'ள': 'ळ', 'ற': 'र', 'ன': 'न',
-
-            # Special characters
-            'ஸ': 'स', 'ஶ': 'श', 'ஜ': 'ज', 'ஹ': 'ह',
-
-            # Common combinations (matching React app)
-            'கா': 'का', 'கி': 'कि', 'கீ': 'की', 'கு': 'कु', 'கூ': 'कू',
-            'தா': 'ता', 'தி': 'ति', 'தீ': 'ती', 'து': 'तु', 'தூ': 'तू',
-            'நா': 'ना', 'நி': 'नि', 'நீ': 'नी', 'நு': 'नु', 'நூ': 'नू',
-            'மா': 'मा', 'மி': 'मि', 'மீ': 'मी', 'மு': 'मु', 'மூ': 'मू',
-            'வா': 'वा', 'வி': 'वि', 'வீ': 'वी', 'வு': 'वु', 'வூ': 'वू',
-            # Extended combinations
-            'கே': 'के', 'கை': 'कै', 'கோ': 'को', 'கௌ': 'कौ',
-            'தே': 'ते', 'தை': 'तै', 'தோ': 'तो', 'தௌ': 'तौ',
-            'நே': 'ने', 'நை': 'नै', 'நோ': 'नो', 'நௌ': 'नौ',
-            'மே': 'मे', 'மை': 'मै', 'மோ': 'मो', 'மௌ': 'मौ',
-            'வே': 'वे', 'வை': 'वै', 'வோ': 'वो', 'வௌ': 'वौ'
-        }
-
-        # English to Devanagari mapping (complete from React app)
-        self.english_to_devanagari_map = {
-            # Basic consonants
-            'ka': 'क', 'kha': 'ख', 'ga': 'ग', 'gha': 'घ', 'nga': 'ङ',
-            'cha': 'च', 'chha': 'छ', 'ja': 'ज', 'jha': 'झ', 'nya': 'ञ',
-            'ta': 'ट', 'tha': 'ठ', 'da': 'ड', 'dha': 'ढ', 'na': 'ण',
-            'th': 'त', 'thh': 'थ', 'dh': 'द', 'dhh': 'ध', 'n': 'न',
-            'pa': 'प', 'pha': 'फ', 'ba': 'ब', 'bha': 'भ', 'ma': 'म',
-            'ya': 'य', 'ra': 'र', 'la': 'ल', 'va': 'व', 'wa': 'व',
-            'sha': 'श', 'shha': 'ष', 'sa': 'स', 'ha': 'ह',
-
-            # Vowels
-            'a': 'अ', 'aa': 'आ', 'i': 'इ', 'ee': 'ई', 'u': 'उ', 'oo': 'ऊ',
-            'ri': 'ऋ', 'e': 'ए', 'ai': 'ऐ', 'o': 'ओ', 'au': 'औ',
-
-            # Special combinations
-            'ksh': 'क्ष', 'tr': 'त्र', 'gy': 'ज्ञ',
-
-            # Numbers
-            '0': '०', '1': '१', '2': '२', '3': '३', '4': '४',
-            '5': '५', '6': '६', '7': '७', '8': '८', '9': '९',
-
-            # Common words
-            'hello': 'हैलो', 'namaste': 'नमस्ते', 'dhanyawad': 'धन्यवाद',
-            'mumbai': 'मुंबई', 'delhi': 'दिल्ली', 'bangalore': 'बंगलोर',
-            'hyderabad': 'हैदराबाद', 'chennai': 'चेन्नै', 'kolkata': 'कोलकाता',
-            'ahmedabad': 'अहमदाबाद', 'pune': 'पुणे', 'surat': 'सूरत',
-            'jaipur': 'जयपुर', 'lucknow': 'लखनऊ', 'kanpur': 'कानपुर',
-            'nagpur': 'नागपुर', 'indore': 'इंदौर', 'thane': 'ठाणे',
-            'bhopal': 'भोपाल', 'visakhapatnam': 'विशाखापत्तनम', 'pimpri': 'पिंपरी',
-            'patna': 'पटना', 'vadodara': 'वडोदरा', 'ghaziabad': 'गाज़ियाबाद',
-            'ludhiana': 'लुधियाना', 'agra': 'आगरा', 'nashik': 'नासिक',
-            'faridabad': 'फरीदाबाद', 'meerut': 'मेरठ', 'rajkot': 'राजकोट'
-        }
-
-        # English to Tamil mapping
-        self.english_to_tamil_map = {
-            'a': 'அ', 'aa': 'ஆ', 'i': 'இ', 'ii': 'ஈ', 'u': 'உ', 'uu': 'ஊ',
-            'e': 'எ', 'ee': 'ஏ', 'ai': 'ஐ', 'o': 'ஒ', 'oo': 'ஓ', 'au': 'ஔ',
-            'ka': 'க', 'kha': 'க', 'ga': 'க', 'gha': 'க', 'nga': 'ங',
-            'cha': 'ச', 'chha': 'ச', 'ja': 'ஜ', 'jha': 'ஜ', 'nya': 'ஞ',
-            'ta': 'த', 'tha': 'த', 'da': 'த', 'dha': 'த', 'na': 'ந',
-            'tta': 'ட', 'ttha': 'ட', 'dda': 'ட', 'ddha': 'ட', 'nna': 'ண',
-            'pa': 'ப', 'pha': 'ப', 'ba': 'ப', 'bha': 'ப', 'ma': 'ம',
-            'ya': 'ய', 'ra': 'ர', 'la': 'ல', 'va': 'வ', 'sha': 'ஶ',
-            'ssa': 'ஷ', 'sa': 'ஸ', 'ha': 'ஹ',
-            'chennai': 'சென்னை', 'madurai': 'மதுரை', 'coimbatore': 'கோயம்புத்தூர',
-            'salem': 'சேலம்', 'tirupur': 'திருப்பூர', 'erode': 'ஈரோடு',
-            'vellore': 'வேலூர்', 'thoothukudi': 'தூத்துக்குடி', 'dindigul': 'திண்டுக்கல்',
-            'thanjavur': 'தஞ்சாவூர்', 'tirunelveli': 'திருநெல்வேலி', 'karur': 'கரூர்'
-        }
-
-        # English to Malayalam mapping
-        self.english_to_malayalam_map = {
-            'a': 'അ', 'aa': 'ആ', 'i': 'ഇ', 'ii': 'ഈ', 'u': 'ഉ', 'uu': 'ഊ',
-            'e': 'എ', 'ee': 'ഏ', 'ai': 'ഐ', 'o': 'ഒ', 'oo': 'ഓ', 'au': 'ഔ',
-            'ka': 'ക', 'kha': 'ഖ', 'ga': 'ഗ', 'gha': 'ഘ', 'nga': 'ങ',
-            'cha': 'ച', 'chha': 'ഛ', 'ja': 'ജ', 'jha': 'ഝ', 'nya': 'ഞ',
-            'ta': 'ത', 'tha': 'ഥ', 'da': 'ദ', 'dha': 'ധ', 'na': 'ന',
-            'tta': 'ട', 'ttha': 'ഠ', 'dda': 'ഡ', 'ddha': 'ഢ', 'nna': 'ണ',
-            'pa': 'പ', 'pha': 'ഫ', 'ba': 'ബ', 'bha': 'ഭ', 'ma': 'മ',
-            'ya': 'യ', 'ra': 'ര', 'la': 'ല', 'va': 'വ', 'sha': 'ശ',
-            'ssa': 'ഷ', 'sa': 'സ', 'ha': 'ഹ',
-            'kochi': 'കൊച്ചി', 'thiruvananthapuram': 'തിരുവനന്തപുരം', 'kozhikode': 'കോഴിക്കോട്',
-            'kollam': 'കൊല്ലം', 'thrissur': 'തൃശൂർ', 'alappuzha': 'ആലപ്പുഴ',
-            'kannur': 'കണ്ണൂർ', 'kottayam': 'കോട്ടയം', 'palakkad': 'പാലക്കാട്'
-        }
-
-        # English to Gurmukhi mapping
-        self.english_to_gurmukhi_map = {
-            'a': 'ਅ', 'aa': 'ਆ', 'i': 'ਇ', 'ii': 'ਈ', 'u': 'ਉ', 'uu': 'ਊ',
-            'e': 'ਏ', 'ai': 'ਐ', 'o': 'ਓ', 'au': 'ਔ',
-            'ka': 'ਕ', 'kha': 'ਖ', 'ga': 'ਗ', 'gha': 'ਘ', 'nga': 'ਙ',
-            'cha': 'ਚ', 'chha': 'ਛ', 'ja': 'ਜ', 'jha': 'ਝ', 'nya': 'ਞ',
-            'ta': 'ਤ', 'tha': 'ਥ', 'da': 'ਦ', 'dha': 'ਧ', 'na': 'ਨ',
-            'tta': 'ਟ', 'ttha': 'ਠ', 'dda': 'ਡ', 'ddha': 'ਢ', 'nna': 'ਣ',
-            'pa': 'ਪ', 'pha': 'ਫ', 'ba': 'ਬ', 'bha': 'ਭ', 'ma': 'ਮ',
-            'ya': 'ਯ', 'ra': 'ਰ', 'la': 'ਲ', 'va': 'ਵ', 'wa': 'ਵ',
-            'sha': 'ਸ਼', 'sa': 'ਸ', 'ha': 'ਹ',
-            'amritsar': 'ਅੰਮ੍ਰਿਤਸਰ', 'ludhiana': 'ਲੁਧਿਆਣਾ', 'jalandhar': 'ਜਲੰਧਰ',
-            'patiala': 'ਪਟਿਆਲਾ', 'bathinda': 'ਬਠਿੰਡਾ', 'mohali': 'ਮੋਹਾਲੀ',
-            'pathankot': 'ਪਠਾਨਕੋਟ', 'hoshiarpur': 'ਹੁਸ਼ਿਆਰਪੁਰ', 'moga': 'ਮੋਗਾ'
-        }
-
-    def detect_script(self, text: str) -> str:
-        """Detect the script of input text (matching React app logic)"""
-        if not text.strip():
-            return "unknown"
-
-        # Count characters from different scripts
-        devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
-        tamil_chars = len(re.findall(r'[\u0B80-\u0BFF]', text))
-        malayalam_chars = len(re.findall(r'[\u0D00-\u0D7F]', text))
-        gurmukhi_chars = len(re.findall(r'[\u0A00-\u0A7F]', text))
-        latin_chars = len(re.findall(r'[a-zA-Z]', text))
-
-        # Determine dominant script
-        script_counts = {
-            Script.DEVANAGARI: devanagari_chars,
-            Script.TAMIL: tamil_chars,
-            Script.MALAYALAM: malayalam_chars,
-            Script.GURMUKHI: gurmukhi_chars,
-            'latin': latin_chars
-        }
-
-        detected = max(script_counts.items(), key=lambda x: x[1])
-        return detected[0] if detected[1] > 0 else "latin"
-
-    def tamil_to_devanagari_direct(self, text: str) -> str:
-        """Direct Tamil to Devanagari conversion (matching React app)"""
-        result = ""
-        i = 0
-        while i < len(text):
-            # Try 2-character combinations first
-            if i < len(text) - 1:
-                two_char = text[i:i+2]
-                if two_char in self.tamil_to_devanagari_map:
-                    result += self.tamil_to_devanagari_map[two_char]
-                    i += 2
-                    continue
-
-            # Single character mapping
-            char = text[i]
-            if char in self.tamil_to_devanagari_map:
-                result += self.tamil_to_devanagari_map[char]
-            else:
-                result += char
-            i += 1
-
-        return result
-
-    def english_to_devanagari(self, text: str) -> str:
-        """Convert English to Devanagari (matching React app)"""
-        # Simple word-based conversion for now
-        words = text.lower().split()
-        result_words = []
-
-        for word in words:
-            if word in self.english_to_devanagari_map:
-                result_words.append(self.english_to_devanagari_map[word])
-            else:
-                # Character by character conversion for unknown words
-                converted = ""
-                i = 0
-                while i < len(word):
-                    # Try 3-character combinations first
-                    if i <= len(word) - 3:
-                        three_char = word[i:i+3]
-                        if three_char in self.english_to_devanagari_map:
-                            converted += self.english_to_devanagari_map[three_char]
-                            i += 3
-                            continue
-
-                    # Try 2-character combinations
-                    if i <= len(word) - 2:
-                        two_char = word[i:i+2]
-                        if two_char in self.english_to_devanagari_map:
-                            converted += self.english_to_devanagari_map[two_char]
-                            i += 2
-                            continue
-
-                    # Single character
-                    char = word[i]
-                    if char in self.english_to_devanagari_map:
-                        converted += self.english_to_devanagari_map[char]
-                    else:
-                        converted += char
-                    i += 1
-
-                result_words.append(converted if converted else word)
-
-        return " ".join(result_words)
-
-    def transliterate(self, text: str, target_script: str) -> str:
-        """Universal transliterate method (matching React app)"""
-        if target_script == Script.DEVANAGARI:
-            return self.english_to_devanagari(text)
-        elif target_script == Script.TAMIL:
-            return self.transliterate_with_mapping(text, self.english_to_tamil_map)
-        elif target_script == Script.MALAYALAM:
-            return self.transliterate_with_mapping(text, self.english_to_malayalam_map)
-        elif target_script == Script.GURMUKHI:
-            return self.transliterate_with_mapping(text, self.english_to_gurmukhi_map)
-        else:
-            return text
-
-    def transliterate_with_mapping(self, text: str, mapping: Dict[str, str]) -> str:
-        """Generic transliteration method"""
-        words = text.lower().split()
-        result_words = []
-
-        for word in words:
-            if word in mapping:
-                result_words.append(mapping[word])
-            else:
-                converted = ""
-                i = 0
-                while i < len(word):
-                    # Try longest matches first
-                    found = False
-                    for length in range(min(4, len(word) - i), 0, -1):
-                        substring = word[i:i+length]
-                        if substring in mapping:
-                            converted += mapping[substring]
-                            i += length
-                            found = True
-                            break
-                    if not found:
-                        converted += word[i]
-                        i += 1
-                result_words.append(converted if converted else word)
-
-        return " ".join(result_words)
-
-    def cross_script_transliterate(self, text: str, source_script: str, target_script: str) -> str:
-        """Cross-script transliteration (matching React app logic)"""
-        print(f"🔀 Cross-script: {source_script} → {target_script}, text: '{text}'")
-
-        try:
-            # Special handling for common conversions
-            if source_script == Script.TAMIL and target_script == Script.DEVANAGARI:
-                result = self.tamil_to_devanagari_direct(text)
-                print(f"📝 Tamil→Devanagari direct: '{text}' → '{result}'")
-                if result and result != text:
-                    return result
-
-            # Use reverse transliteration approach for other cases
-            reverse_engine = ReverseTransliterationEngine()
-
-            # First convert the source script to English phonetics
-            english_phonetics = ""
-            if source_script == Script.DEVANAGARI:
-                english_phonetics = reverse_engine.devanagari_to_english(text)
-            elif source_script == Script.TAMIL:
-                english_phonetics = reverse_engine.tamil_to_english(text)
-            elif source_script == Script.MALAYALAM:
-                english_phonetics = reverse_engine.malayalam_to_english(text)
-            elif source_script == Script.GURMUKHI:
-                english_phonetics = reverse_engine.gurmukhi_to_english(text)
-            else:
-                english_phonetics = text
-
-            print(f"🔄 {source_script} → English: '{text}' → '{english_phonetics}'")
-
-            # Then convert English phonetics to target script
-            if english_phonetics and english_phonetics != text and english_phonetics.strip():
-                final_result = self.transliterate(english_phonetics, target_script)
-                print(f"🔄 English → {target_script}: '{english_phonetics}' → '{final_result}'")
-                return final_result
-
-            # If reverse transliteration failed, try phonetic approximation
-            print("⚠️ Reverse failed, trying phonetic approximation")
-            return self.phonetic_approximation(text, source_script, target_script)
-
-        except Exception as error:
-            print(f"Cross-script transliteration failed: {error}")
-            return self.phonetic_approximation(text, source_script, target_script)
-
-    def phonetic_approximation(self, text: str, source: str, target: str) -> str:
-        """Basic phonetic approximation for cross-script transliteration"""
-        # Basic mappings between scripts
-        if target == Script.TAMIL:
-            basic_mapping = {
-                'क': 'க', 'ख': 'க', 'ग': 'க', 'घ': 'க',
-                'च': 'ச', 'छ': 'ச', 'ज': 'ச', 'झ': 'ச',
-                'ट': 'ட', 'ठ': 'ட', 'ड': 'ட', 'ढ': 'ட',
-                'त': 'த', 'थ': 'த', 'द': 'த', 'ध': 'த',
-                'न': 'ந', 'प': 'ப', 'फ': 'ப', 'ब': 'ப', 'भ': 'ப',
-                'म': 'ம', 'य': 'ய', 'र': 'ர', 'ल': 'ல', 'व': 'வ',
-                'श': 'ஶ', 'ष': 'ஷ', 'स': 'ஸ', 'ह': 'ஹ'
-            }
-        elif target == Script.MALAYALAM:
-            basic_mapping = {
-                'क': 'ക', 'ख': 'ഖ', 'ग': 'ഗ', 'घ': 'ഘ',
-                'च': 'ച', 'छ': 'ഛ', 'ज': 'ജ', 'झ': 'ഝ',
-                'ट': 'ട', 'ठ': 'ഠ', 'ड': 'ഡ', 'ढ': 'ഢ',
-                'त': 'ത', 'थ': 'ഥ', 'द': 'ദ', 'ध': 'ധ',
-                'न': 'ന', 'प': 'പ', 'फ': 'ഫ', 'ब': 'ബ', 'भ': 'ഭ',
-                'म': 'മ', 'य': 'യ', 'र': 'ര', 'ल': 'ല', 'व': 'വ',
-                'श': 'ശ', 'ष': 'ഷ', 'स': 'സ', 'ह': 'ഹ'
-            }
-        elif target == Script.GURMUKHI:
-            basic_mapping = {
-                'क': 'ਕ', 'ख': 'ਖ', 'ग': 'ਗ', 'घ': 'ਘ',
-                'च': 'ਚ', 'छ': 'ਛ', 'ज': 'ਜ', 'झ': 'ਝ',
-                'ट': 'ਟ', 'ठ': 'ਠ', 'ड': 'ਡ', 'ढ': 'ਢ',
-                'त': 'ਤ', 'थ': 'ਥ', 'द': 'ਦ', 'ध': 'ਧ',
-                'न': 'ਨ', 'प': 'ਪ', 'फ': 'ਫ', 'ब': 'ਬ', 'भ': 'ਭ',
-                'म': 'ਮ', 'य': 'ਯ', 'र': 'ਰ', 'ल': 'ਲ', 'व': 'ਵ',
-                'श': 'ਸ਼', 'ष': 'ਸ਼', 'स': 'ਸ', 'ह': 'ਹ'
-            }
-        else:
-            return text
-
-        result = ""
-        for char in text:
-            result += basic_mapping.get(char, char)
-        return result
-
-class ReverseTransliterationEngine:
-    """Reverse transliteration engine (matching React app)"""
-
-    def __init__(self):
-        # Devanagari to English mapping
-        self.devanagari_to_english_map = {
-            'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo',
-            'ऋ': 'ri', 'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au',
-            'क': 'ka', 'ख': 'kha', 'ग': 'ga', 'घ': 'gha', 'ङ': 'nga',
-            'च': 'cha', 'छ': 'chha', 'ज': 'ja', 'झ': 'jha', 'ञ': 'nya',
-            'ट': 'ta', 'ठ': 'tha', 'ड': 'da', 'ढ': 'dha', 'ण': 'na',
-            'त': 'ta', 'थ': 'tha', 'द': 'da', 'ध': 'dha', 'न': 'na',
-            'प': 'pa', 'फ': 'pha', 'ब': 'ba', 'भ': 'bha', 'म': 'ma',
-            'य': 'ya', 'र': 'ra', 'ल': 'la', 'व': 'va', 'श': 'sha',
-            'ष': 'shha', 'स': 'sa', 'ह': 'ha', '्': '', 'ं': 'n', 'ः': 'h',
-            '।': '.', '॥': '..', 'क्ष': 'ksha', 'त्र': 'tra', 'ज्ञ': 'gya'
-        }
-
-        # Tamil to English mapping
-        self.tamil_to_english_map = {
-            'அ': 'a', 'ஆ': 'aa', 'இ': 'i', 'ஈ': 'ee', 'உ': 'u', 'ஊ': 'oo',
-            'எ': 'e', 'ஏ': 'ae', 'ஐ': 'ai', 'ஒ': 'o', 'ஓ': 'oo', 'ஔ': 'au',
-            'க': 'ka', 'ங': 'nga', 'ச': 'cha', 'ஞ': 'nya', 'ட': 'ta',
-            'ண': 'na', 'த': 'tha', 'ந': 'na', 'ப': 'pa', 'ம': 'ma',
-            'ய': 'ya', 'ர': 'ra', 'ல': 'la', 'வ': 'va', 'ழ': 'zha',
-            'ள': 'la', 'ற': 'ra', 'ன': 'na', 'ஜ': 'ja', 'ஶ': 'sha',
-            'ஷ': 'sha', 'ஸ': 'sa', 'ஹ': 'ha', '்': ''
-        }
-
-        # Malayalam to English mapping
-        self.malayalam_to_english_map = {
-            'അ': 'a', 'ആ': 'aa', 'ഇ': 'i', 'ഈ': 'ee', 'ഉ': 'u', 'ഊ': 'oo',
-            'എ': 'e', 'ഏ': 'ae', 'ഐ': 'ai', 'ഒ': 'o', 'ഓ': 'oo', 'ഔ': 'au',
-            'ക': 'ka', 'ഖ': 'kha', 'ഗ': 'ga', 'ഘ': 'gha', 'ങ': 'nga',
-            'ച': 'cha', 'ഛ': 'chha', 'ജ': 'ja', 'ഝ': 'jha', 'ഞ': 'nya',
-            'ട': 'ta', 'ഠ': 'tha', 'ഡ': 'da', 'ഢ': 'dha', 'ണ': 'na',
-            'ത': 'tha', 'ഥ': 'thha', 'ദ': 'da', 'ധ': 'dha', 'ന': 'na',
-            'പ': 'pa', 'ഫ': 'pha', 'ബ': 'ba', 'ഭ': 'bha', 'മ': 'ma',
-            'യ': 'ya', 'ര': 'ra', 'ല': 'la', 'വ': 'va', 'ശ': 'sha',
-            'ഷ': 'shha', 'സ': 'sa', 'ഹ': 'ha', '്': ''
-        }
-
-        # Gurmukhi to English mapping
-        self.gurmukhi_to_english_map = {
-            'ਅ': 'a', 'ਆ': 'aa', 'ਇ': 'i', 'ਈ': 'ee', 'ਉ': 'u', 'ਊ': 'oo',
-            'ਏ': 'e', 'ਐ': 'ai', 'ਓ': 'o', 'ਔ': 'au',
-            'ਕ': 'ka', 'ਖ': 'kha', 'ਗ': 'ga', 'ਘ': 'gha', 'ਙ': 'nga',
-            'ਚ': 'cha', 'ਛ': 'chha', 'ਜ': 'ja', 'ਝ': 'jha', 'ਞ': 'nya',
-            'ਟ': 'ta', 'ਠ': 'tha', 'ਡ': 'da', 'ਢ': 'dha', 'ਣ': 'na',
-            'ਤ': 'ta', 'ਥ': 'tha', 'ਦ': 'da', 'ਧ': 'dha', 'ਨ': 'na',
-            'ਪ': 'pa', 'ਫ': 'pha', 'ਬ': 'ba', 'ਭ': 'bha', 'ਮ': 'ma',
-            'ਯ': 'ya', 'ਰ': 'ra', 'ਲ': 'la', 'ਵ': 'va', 'ਸ਼': 'sha',
-            'ਸ': 'sa', 'ਹ': 'ha'
-        }
-
-    def devanagari_to_english(self, text: str) -> str:
-        """Convert Devanagari to English phonetics"""
-        result = ""
-        i = 0
-        while i < len(text):
-            # Try 3-character combinations first
-            if i <= len(text) - 3:
-                three_char = text[i:i+3]
-                if three_char in self.devanagari_to_english_map:
-                    result += self.devanagari_to_english_map[three_char]
-                    i += 3
-                    continue
-
-            # Try 2-character combinations
-            if i <= len(text) - 2:
-                two_char = text[i:i+2]
-                if two_char in self.devanagari_to_english_map:
-                    result += self.devanagari_to_english_map[two_char]
-                    i += 2
-                    continue
-
-            # Single character
-            char = text[i]
-            if char in self.devanagari_to_english_map:
-                result += self.devanagari_to_english_map[char]
-            else:
-                result += char
-            i += 1
-
-        return result.strip()
-
-    def tamil_to_english(self, text: str) -> str:
-        """Convert Tamil to English phonetics"""
-        result = ""
-        i = 0
-        while i < len(text):
-            # Try 2-character combinations first
-            if i <= len(text) - 2:
-                two_char = text[i:i+2]
-                if two_char in self.tamil_to_english_map:
-                    result += self.tamil_to_english_map[two_char]
-                    i += 2
-                    continue
-
-            char = text[i]
-            if char in self.tamil_to_english_map:
-                result += self.tamil_to_english_map[char]
-            else:
-                result += char
-            i += 1
-
-        return result.strip()
-
-    def malayalam_to_english(self, text: str) -> str:
-        """Convert Malayalam to English phonetics"""
-        result = ""
-        for char in text:
-            result += self.malayalam_to_english_map.get(char, char)
-        return result.strip()
-
-    def gurmukhi_to_english(self, text: str) -> str:
-        """Convert Gurmukhi to English phonetics"""
-        result = ""
-        for char in text:
-            result += self.gurmukhi_to_english_map.get(char, char)
-        return result.strip()
-
 class AdvancedTextProcessor:
     """Text processing utilities (matching React app)"""
 
@@ -813,449 +360,117 @@ class AdvancedTextProcessor:
         """Format Indian text (matching React app)"""
         return text.strip()
 
-class TouristTranslationEngine:
-    """Tourist translation engine (matching React app)"""
-
-    def __init__(self):
-        self.phrases = {
-            "greetings": {
-                "Hello": {
-                    Script.DEVANAGARI: "नमस्ते",
-                    Script.TAMIL: "வணக்கம்",
-                    Script.MALAYALAM: "നമസ്കാരം",
-                    Script.GURMUKHI: "ਸਤ ਸ੍ਰੀ ਅਕਾਲ"
-                },
-                "Thank you": {
-                    Script.DEVANAGARI: "धन्यवाद",
-                    Script.TAMIL: "நன்றி",
-                    Script.MALAYALAM: "നന്ദി",
-                    Script.GURMUKHI: "ਧੰਨਵਾਦ"
-                },
-                "Please": {
-                    Script.DEVANAGARI: "कृपया",
-                    Script.TAMIL: "தயவுசெய்து",
-                    Script.MALAYALAM: "ദയവായി",
-                    Script.GURMUKHI: "ਕਿਰਪਾ ਕਰਕੇ"
-                },
-                "Excuse me": {
-                    Script.DEVANAGARI: "माफ कीजिए",
-                    Script.TAMIL: "மன்னிக்கவும்",
-                    Script.MALAYALAM: "ക്ഷമിക്കണം",
-                    Script.GURMUKHI: "ਮਾਫ ਕਰਨਾ"
-                }
-            },
-            "directions": {
-                "Where is...?": {
-                    Script.DEVANAGARI: "कहाँ है...?",
-                    Script.TAMIL: "எங்கே இருக்கிறது...?",
-                    Script.MALAYALAM: "എവിടെയാണ്...?",
-                    Script.GURMUKHI: "ਕਿੱਥੇ ਹੈ...?"
-                },
-                "Left": {
-                    Script.DEVANAGARI: "बाएं",
-                    Script.TAMIL: "இடது",
-                    Script.MALAYALAM: "ഇടത്",
-                    Script.GURMUKHI: "ਖੱਬੇ"
-                },
-                "Right": {
-                    Script.DEVANAGARI: "दाएं",
-                    Script.TAMIL: "வலது",
-                    Script.MALAYALAM: "വലത്",
-                    Script.GURMUKHI: "ਸੱਜੇ"
-                },
-                "Straight": {
-                    Script.DEVANAGARI: "सीधे",
-                    Script.TAMIL: "நேராக",
-                    Script.MALAYALAM: "നേരെ",
-                    Script.GURMUKHI: "ਸਿੱਧਾ"
-                }
-            },
-            "food": {
-                "Water": {
-                    Script.DEVANAGARI: "पानी",
-                    Script.TAMIL: "தண்ணீர்",
-                    Script.MALAYALAM: "വെള്ളം",
-                    Script.GURMUKHI: "ਪਾਣੀ"
-                },
-                "Food": {
-                    Script.DEVANAGARI: "खाना",
-                    Script.TAMIL: "உணவு",
-                    Script.MALAYALAM: "ഭക്ഷണം",
-                    Script.GURMUKHI: "ਖਾਣਾ"
-                },
-                "Restaurant": {
-                    Script.DEVANAGARI: "रेस्तरां",
-                    Script.TAMIL: "உணவகம்",
-                    Script.MALAYALAM: "റെസ്റ്റോറന്റ്",
-                    Script.GURMUKHI: "ਰੈਸਟੋਰੈਂਟ"
-                }
-            },
-            "emergency": {
-                "Help!": {
-                    Script.DEVANAGARI: "मदद!",
-                    Script.TAMIL: "உதவி!",
-                    Script.MALAYALAM: "സഹായം!",
-                    Script.GURMUKHI: "ਮਦਦ!"
-                },
-                "Call police": {
-                    Script.DEVANAGARI: "पुलिस को बुलाओ",
-                    Script.TAMIL: "காவல்துறையை அழைக்கவும்",
-                    Script.MALAYALAM: "പോലീസിനെ വിളിക്കുക",
-                    Script.GURMUKHI: "ਪੁਲਿਸ ਨੂੰ ਬੁਲਾਓ"
-                },
-                "Hospital": {
-                    Script.DEVANAGARI: "अस्पताल",
-                    Script.TAMIL: "மருத்துவமனை",
-                    Script.MALAYALAM: "ആശുപത്രി",
-                    Script.GURMUKHI: "ਹਸਪਤਾਲ"
-                }
-            },
-            "transport": {
-                "Taxi": {
-                    Script.DEVANAGARI: "टैक्सी",
-                    Script.TAMIL: "டாக்ஸி",
-                    Script.MALAYALAM: "ടാക്സി",
-                    Script.GURMUKHI: "ਟੈਕਸੀ"
-                },
-                "Bus": {
-                    Script.DEVANAGARI: "बस",
-                    Script.TAMIL: "பஸ்",
-                    Script.MALAYALAM: "ബസ്",
-                    Script.GURMUKHI: "ਬੱਸ"
-                },
-                "Train": {
-                    Script.DEVANAGARI: "रेलगाड़ी",
-                    Script.TAMIL: "ரயில்",
-                    Script.MALAYALAM: "ട്രെയിൻ",
-                    Script.GURMUKHI: "ਰੇਲਗੱਡੀ"
-                }
-            },
-            "shopping": {
-                "How much?": {
-                    Script.DEVANAGARI: "कितना?",
-                    Script.TAMIL: "எவ்வளவு?",
-                    Script.MALAYALAM: "എത്ര?",
-                    Script.GURMUKHI: "ਕਿੰਨਾ?"
-                },
-                "Cheap": {
-                    Script.DEVANAGARI: "सस्ता",
-                    Script.TAMIL: "மலிவான",
-                    Script.MALAYALAM: "ചെലവുകുറഞ്ഞ",
-                    Script.GURMUKHI: "ਸਸਤਾ"
-                },
-                "Expensive": {
-                    Script.DEVANAGARI: "महंगा",
-                    Script.TAMIL: "விலையான",
-                    Script.MALAYALAM: "അതിവിപുലമായ",
-                    Script.GURMUKHI: "ਮਹਿੰਗਾ"
-                }
-            }
-        }
-
-    def get_all_translations(self, phrase: str) -> Dict[str, str]:
-        """Get all translations for a phrase"""
-        for category, phrases in self.phrases.items():
-            if phrase in phrases:
-                return phrases[phrase]
-        return {}
-
-    def get_suggestions(self, query: str) -> List[str]:
-        """Get phrase suggestions based on query"""
-        query_lower = query.lower()
-        suggestions = []
-
-        for category, phrases in self.phrases.items():
-            for phrase in phrases.keys():
-                if query_lower in phrase.lower():
-                    suggestions.append(phrase)
-
-        return suggestions[:5]  # Limit to 5 suggestions
-
-    def is_translatable(self, phrase: str) -> bool:
-        """Check if a phrase is translatable"""
-        for category, phrases in self.phrases.items():
-            if phrase in phrases:
-                return True
-        return False
-
-@dataclass
-class OCRResult:
-    text: str
-    confidence: float
-    bounding_boxes: List[Tuple[int, int, int, int]]
-    script_detected: str
-    processing_time: int
-
-class ImageProcessingEngine:
-    """Advanced image processing and OCR engine for Indian scripts"""
-
-    def __init__(self):
-        # Initialize OCR readers for different scripts
-        self.readers = {}
-        self._initialize_ocr_readers()
-
-        # Configure Tesseract for Indian scripts
-        self._configure_tesseract()
-
-    def _initialize_ocr_readers(self):
-        """Initialize EasyOCR readers for different Indian scripts"""
-        try:
-            # Devanagari (Hindi)
-            self.readers['devanagari'] = easyocr.Reader(['hi', 'en'])
-
-            # Tamil
-            self.readers['tamil'] = easyocr.Reader(['ta', 'en'])
-
-            # Malayalam
-            self.readers['malayalam'] = easyocr.Reader(['ml', 'en'])
+def process_image_and_transliterate(image_engine: ImageProcessingEngine, image: "ImageSource", transliteration_engine: AdvancedTransliterationEngine) -> Dict[str, any]:
+    """Complete pipeline: OCR → Script Detection → Transliteration"""
+    results = {}
 
-            # Gurmukhi (Punjabi)
-            self.readers['gurmukhi'] = easyocr.Reader(['pa', 'en'])
+    # Step 1: OCR Processing
+    st.markdown("### 📷 Step 1: Image Processing & OCR")
+    ocr_progress = st.progress(0)
+    ocr_status = st.empty()
 
-            # Multi-script reader for auto-detection
-            self.readers['multi'] = easyocr.Reader(['hi', 'ta', 'ml', 'pa', 'en'])
+    # Repeat uploads (reruns, other sessions) are answered from the shared cache
+    raw = image.getvalue() if hasattr(image, "getvalue") else image if isinstance(image, bytes) else None
+    cached = shared_ocr_cache.get_file(raw) if raw is not None else None
+    cache_key = None
+    if cached is None:
+        ocr_status.text("🔍 Analyzing image and extracting text...")
+        prepared = image_engine.preprocess_image(raw if raw is not None else image)
+        cache_key = shared_ocr_cache.key(prepared.pixels)
+        cached = shared_ocr_cache.get(cache_key)
+    if cached is not None:
+        ocr_result = cached.ocr
+        ocr_status.text("⚡ Cached result for this image")
+    else:
+        ocr_result = image_engine.extract_text_from_prepared(prepared)
+    ocr_progress.progress(50)
 
-            st.info("✅ OCR engines initialized successfully")
-        except Exception as e:
-            st.warning(f"⚠️ OCR initialization warning: {str(e)}")
-            # Fallback to basic readers
-            try:
-                self.readers['multi'] = easyocr.Reader(['en'])
-            except:
-                st.error("❌ Failed to initialize OCR engines")
-
-    def _configure_tesseract(self):
-        """Configure Tesseract OCR for Indian scripts"""
-        try:
-            # Set Tesseract data path if available
-            tesseract_path = self._find_tesseract_path()
-            if tesseract_path:
-                pytesseract.pytesseract.tesseract_cmd = tesseract_path
-                st.info("✅ Tesseract OCR configured")
-            else:
-                st.warning("⚠️ Tesseract not found, using EasyOCR only")
-        except Exception as e:
-            st.warning(f"⚠️ Tesseract configuration failed: {str(e)}")
-
-    def _find_tesseract_path(self) -> Optional[str]:
-        """Find Tesseract executable path"""
-        common_paths = [
-            r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-            r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-            '/usr/bin/tesseract',
-            '/usr/local/bin/tesseract'
-        ]
-
-        for path in common_paths:
-            if Path(path).exists():
-                return path
-        return None
+    if not ocr_result.text.strip():
+        ocr_status.error("❌ No text detected in the image")
+        return {"error": "No text found in image"}
 
-    def preprocess_image(self, image: Image.Image) -> Image.Image:
-        """Preprocess image for better OCR results"""
-        # Convert to numpy array
-        img_array = np.array(image)
+    ocr_status.success(f"✅ Text extracted: '{ocr_result.text}' (Confidence: {ocr_result.confidence:.1%})")
+    ocr_progress.progress(100)
 
-        # Convert to grayscale if needed
-        if len(img_array.shape) == 3:
-            img_array = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+    results['ocr'] = ocr_result
 
-        # Apply image enhancement techniques
-        # 1. Noise reduction
-        img_array = cv2.medianBlur(img_array, 3)
+    # Step 2: Script Detection
+    st.markdown("### 🔤 Step 2: Script Detection")
+    script_progress = st.progress(0)
+    script_status = st.empty()
 
-        # 2. Contrast enhancement
-        img_array = cv2.convertScaleAbs(img_array, alpha=1.2, beta=10)
+    script_status.text(f"🔍 Detected script: {ocr_result.script_detected.title()}")
+    script_progress.progress(100)
 
-        # 3. Thresholding for better text extraction
-        _, img_array = cv2.threshold(img_array, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    results['detected_script'] = ocr_result.script_detected
 
-        # Convert back to PIL Image
-        processed_image = Image.fromarray(img_array)
+    # Step 3: Transliteration
+    st.markdown("### 🌈 Step 3: Transliteration")
+    transliteration_progress = st.progress(0)
+    transliteration_status = st.empty()
 
-        return processed_image
+    transliteration_status.text("🔄 Translating to all Indian scripts...")
 
-    def detect_script_from_image(self, image: Image.Image) -> str:
-        """Detect the script in the image"""
-        try:
-            # Convert to numpy array
-            img_array = np.array(image)
-
-            # Use multi-script reader for detection
-            if 'multi' in self.readers:
-                results = self.readers['multi'].readtext(img_array, detail=0)
-
-                if results:
-                    detected_text = ' '.join(results)
-
-                    # Analyze detected text to determine script
-                    devanagari_chars = len(re.findall(r'[\u0900-\u097F]', detected_text))
-                    tamil_chars = len(re.findall(r'[\u0B80-\u0BFF]', detected_text))
-                    malayalam_chars = len(re.findall(r'[\u0D00-\u0D7F]', detected_text))
-                    gurmukhi_chars = len(re.findall(r'[\u0A00-\u0A7F]', detected_text))
-
-                    script_counts = {
-                        'devanagari': devanagari_chars,
-                        'tamil': tamil_chars,
-                        'malayalam': malayalam_chars,
-                        'gurmukhi': gurmukhi_chars
-                    }
-
-                    detected_script = max(script_counts.items(), key=lambda x: x[1])
-                    if detected_script[1] > 0:
-                        return detected_script[0]
-
-            return 'unknown'
-        except Exception as e:
-            st.warning(f"Script detection failed: {str(e)}")
-            return 'unknown'
+    # Transliterate to all target scripts
+    transliteration_results = dict(cached.transliterations) if cached is not None else {}
+    failed = False
 
-    def extract_text_from_image(self, image: Image.Image, target_script: str = 'auto') -> OCRResult:
-        """Extract text from image using OCR"""
-        start_time = time.time()
+    all_scripts = [Script.DEVANAGARI, Script.TAMIL, Script.MALAYALAM, Script.GURMUKHI]
+    total_steps = len(all_scripts)
+    cross_script_results = None
 
+    for i, target_script in enumerate(all_scripts):
+        if target_script in transliteration_results:
+            transliteration_progress.progress((i + 1) / total_steps)
+            continue
         try:
-            # Preprocess image
-            processed_image = self.preprocess_image(image)
-            img_array = np.array(processed_image)
-
-            # Determine which OCR reader to use
-            if target_script == 'auto':
-                target_script = self.detect_script_from_image(image)
-
-            reader_key = target_script if target_script in self.readers else 'multi'
-            reader = self.readers.get(reader_key, self.readers.get('multi'))
-
-            if not reader:
-                raise Exception("No OCR reader available")
-
-            # Perform OCR
-            results = reader.readtext(img_array, detail=1)  # detail=1 gives bounding boxes
-
-            # Extract text and confidence
-            extracted_text = ""
-            total_confidence = 0.0
-            bounding_boxes = []
-
-            for (bbox, text, confidence) in results:
-                extracted_text += text + " "
-                total_confidence += confidence
-                # Convert bbox to integer coordinates
-                bounding_boxes.append(tuple(map(int, [bbox[0][0], bbox[0][1], bbox[2][0], bbox[2][1]])))
-
-            extracted_text = extracted_text.strip()
-            avg_confidence = total_confidence / len(results) if results else 0.0
-
-            processing_time = int((time.time() - start_time) * 1000)
+            if ocr_result.script_detected == 'latin' or ocr_result.script_detected == 'unknown':
+                # English to Indian script
+                result_text = transliteration_engine.transliterate(ocr_result.text, target_script)
+            elif ocr_result.script_detected == target_script:
+                # Same script
+                result_text = ocr_result.text
+            else:
+                # Cross-script transliteration: parse once, render every target
+                if cross_script_results is None:
+                    cross_script_results = transliteration_engine.cross_script_transliterate_all(
+                        ocr_result.text, ocr_result.script_detected, all_scripts
+                    )
+                result_text = cross_script_results[target_script]
 
-            return OCRResult(
-                text=extracted_text,
-                confidence=avg_confidence,
-                bounding_boxes=bounding_boxes,
-                script_detected=target_script,
-                processing_time=processing_time
-            )
+            transliteration_results[target_script] = result_text
+            transliteration_progress.progress((i + 1) / total_steps)
 
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
-            st.error(f"OCR processing failed: {str(e)}")
+            st.warning(f"Transliteration to {target_script} failed: {str(e)}")
+            transliteration_results[target_script] = f"Error: {str(e)}"
+            failed = True
 
-            return OCRResult(
-                text="",
-                confidence=0.0,
-                bounding_boxes=[],
-                script_detected="error",
-                processing_time=processing_time
-            )
-
-    def process_image_and_transliterate(self, image: Image.Image, transliteration_engine: AdvancedTransliterationEngine) -> Dict[str, any]:
-        """Complete pipeline: OCR → Script Detection → Transliteration"""
-        results = {}
-
-        # Step 1: OCR Processing
-        st.markdown("### 📷 Step 1: Image Processing & OCR")
-        ocr_progress = st.progress(0)
-        ocr_status = st.empty()
-
-        ocr_status.text("🔍 Analyzing image and extracting text...")
-        ocr_result = self.extract_text_from_image(image)
-        ocr_progress.progress(50)
-
-        if not ocr_result.text.strip():
-            ocr_status.error("❌ No text detected in the image")
-            return {"error": "No text found in image"}
+    if cache_key is not None and not failed:
+        shared_ocr_cache.put(cache_key, CachedOCR(ocr_result, transliteration_results), data=raw)
 
-        ocr_status.success(f"✅ Text extracted: '{ocr_result.text}' (Confidence: {ocr_result.confidence:.1%})")
-        ocr_progress.progress(100)
+    transliteration_status.success("✅ Transliteration completed!")
+    transliteration_progress.progress(100)
 
-        results['ocr'] = ocr_result
+    results['transliterated'] = transliteration_results
 
-        # Step 2: Script Detection
-        st.markdown("### 🔤 Step 2: Script Detection")
-        script_progress = st.progress(0)
-        script_status = st.empty()
+    # Step 4: Quality Assessment
+    st.markdown("### 📊 Step 4: Quality Assessment")
+    quality_metrics = AdvancedTextProcessor.assess_text_quality(ocr_result.text)
 
-        script_status.text(f"🔍 Detected script: {ocr_result.script_detected.title()}")
-        script_progress.progress(100)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("OCR Confidence", ".1f")
+    with col2:
+        st.metric("Text Quality", ".1f")
+    with col3:
+        st.metric("Completeness", ".1f")
+    with col4:
+        st.metric("Readability", ".1f")
 
-        results['detected_script'] = ocr_result.script_detected
+    results['quality'] = quality_metrics
 
-        # Step 3: Transliteration
-        st.markdown("### 🌈 Step 3: Transliteration")
-        transliteration_progress = st.progress(0)
-        transliteration_status = st.empty()
-
-        transliteration_status.text("🔄 Translating to all Indian scripts...")
-
-        # Transliterate to all target scripts
-        transliteration_results = {}
-
-        all_scripts = [Script.DEVANAGARI, Script.TAMIL, Script.MALAYALAM, Script.GURMUKHI]
-        total_steps = len(all_scripts)
-
-        for i, target_script in enumerate(all_scripts):
-            try:
-                if ocr_result.script_detected == 'latin' or ocr_result.script_detected == 'unknown':
-                    # English to Indian script
-                    result_text = transliteration_engine.transliterate(ocr_result.text, target_script)
-                elif ocr_result.script_detected == target_script:
-                    # Same script
-                    result_text = ocr_result.text
-                else:
-                    # Cross-script transliteration
-                    result_text = transliteration_engine.cross_script_transliterate(
-                        ocr_result.text, ocr_result.script_detected, target_script
-                    )
-
-                transliteration_results[target_script] = result_text
-                transliteration_progress.progress((i + 1) / total_steps)
-
-            except Exception as e:
-                st.warning(f"Transliteration to {target_script} failed: {str(e)}")
-                transliteration_results[target_script] = f"Error: {str(e)}"
-
-        transliteration_status.success("✅ Transliteration completed!")
-        transliteration_progress.progress(100)
-
-        results['transliterated'] = transliteration_results
-
-        # Step 4: Quality Assessment
-        st.markdown("### 📊 Step 4: Quality Assessment")
-        quality_metrics = AdvancedTextProcessor.assess_text_quality(ocr_result.text)
-
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("OCR Confidence", ".1f")
-        with col2:
-            st.metric("Text Quality", ".1f")
-        with col3:
-            st.metric("Completeness", ".1f")
-        with col4:
-            st.metric("Readability", ".1f")
-
-        results['quality'] = quality_metrics
-
-        return results
+    return results
 
 # Main application logic
 def main():
@@ -1295,6 +510,56 @@ def main():
             index=4
         )
 
+        # Route usage across all sessions of this process
+        route_stats = route_counters.snapshot()
+        if route_stats:
+            with st.expander("📈 Route Statistics"):
+                for route, stats in sorted(route_stats.items(), key=lambda item: -item[1].calls):
+                    st.markdown(
+                        f"**{route.value}**: {stats.calls} calls, {stats.failures} failed, "
+                        f"{stats.average_ms:.1f} ms avg"
+                    )
+
+        # OCR readers loaded in this process
+        reader_stats = shared_reader_pool.stats()
+        if reader_stats.builds:
+            with st.expander("🧠 OCR Readers"):
+                st.markdown(f"**Loaded**: {', '.join(reader_stats.readers) or 'none'}")
+                st.markdown(
+                    f"**Memory**: {reader_stats.bytes / 1024 / 1024:.0f} / "
+                    f"{reader_stats.max_bytes / 1024 / 1024:.0f} MB"
+                )
+                st.markdown(
+                    f"**Reuses**: {reader_stats.hits}, **Loads**: {reader_stats.builds}, "
+                    f"**Evictions**: {reader_stats.evictions}"
+                )
+
+        # Tesseract → EasyOCR cascade across all sessions of this process
+        cascade_stats = cascade_counters.snapshot()
+        if cascade_stats.images:
+            with st.expander("🪜 OCR Cascade"):
+                st.markdown(
+                    f"**Escalated to EasyOCR**: {cascade_stats.escalated}/{cascade_stats.regions} regions "
+                    f"({cascade_stats.escalation_rate:.0%}), {cascade_stats.full_fallbacks} full fallbacks"
+                )
+                st.markdown(
+                    f"**Avg per image**: Tesseract {cascade_stats.tesseract_ms / cascade_stats.images:.0f} ms, "
+                    f"EasyOCR {cascade_stats.easyocr_ms / cascade_stats.images:.0f} ms"
+                )
+
+        cache_stats = shared_ocr_cache.stats()
+        if cache_stats.hits + cache_stats.near_hits + cache_stats.misses:
+            with st.expander("⚡ OCR Cache"):
+                st.markdown(
+                    f"**Hit rate**: {cache_stats.hit_rate:.1%} "
+                    f"({cache_stats.hits} exact, {cache_stats.near_hits} near-duplicate, {cache_stats.misses} misses)"
+                )
+                st.markdown(
+                    f"**Entries**: {cache_stats.size}/{cache_stats.max_entries}, "
+                    f"{cache_stats.bytes / 1024:.0f} KB of {cache_stats.max_bytes / (1024 * 1024):.0f} MB, "
+                    f"{cache_stats.evictions} evicted"
+                )
+
     # Main content area
     if active_tab == "Transliterate":
         st.markdown("## 🔤 Advanced Transliteration")
@@ -1334,16 +599,15 @@ def main():
         )
 
         if uploaded_file is not None:
-            # Display uploaded image
-            image = Image.open(uploaded_file)
-            st.image(image, caption="Uploaded Image", use_column_width=True)
+            # Display uploaded image; the OCR engine decodes the file itself at reduced size
+            st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
 
             # Process button
             if st.button("🔍 Extract & Transliterate", type="primary", use_container_width=True):
                 with st.spinner("Processing image... This may take a few moments."):
                     try:
                         # Process image and transliterate
-                        results = image_engine.process_image_and_transliterate(image, transliteration_engine)
+                        results = process_image_and_transliterate(image_engine, uploaded_file, transliteration_engine)
 
                         if 'error' in results:
                             st.error(f"❌ Processing failed: {results['error']}")
@@ -1539,13 +803,25 @@ def main():
                 else:
                     st.warning("Please enter text in an Indian script (Devanagari, Tamil, Malayalam, or Gurmukhi)")
 
+@st.cache_resource
+def get_result_store() -> Optional[TransliterationStore]:
+    """Process-wide persistent result store, enabled by READ_BHARAT_RESULT_DB"""
+    return TransliterationStore.from_env()
+
 def transliterate_text(input_text: str, source_script: str, quality_mode: str, show_analysis: bool, engine: AdvancedTransliterationEngine):
     """Handle text transliteration with progress tracking"""
 
     # Detect script if auto-detect is selected
+    script_runs = None
     if source_script == "Auto-detect":
         detected_script = engine.detect_script(input_text)
-        st.info(f"🔍 Detected script: **{detected_script.title()}**")
+        script_runs = detection.segment_runs(input_text)
+        if detection.is_mixed_script(script_runs):
+            scripts = dict.fromkeys(label for label, _, _ in script_runs if label != "other")
+            st.info(f"🔍 Mixed scripts detected: **{', '.join(label.title() for label in scripts)}**")
+        else:
+            script_runs = None
+            st.info(f"🔍 Detected script: **{detected_script.title()}**")
     else:
         detected_script = source_script
 
@@ -1588,6 +864,10 @@ def transliterate_text(input_text: str, source_script: str, quality_mode: str, s
 
     # Process each script
     results = {}
+    cross_script_results = None
+    mixed_results = None
+    result_store = get_result_store()
+    route_table = get_route_table()
 
     for i, target_script in enumerate(all_scripts):
         # Update progress
@@ -1613,42 +893,66 @@ def transliterate_text(input_text: str, source_script: str, quality_mode: str, s
                 """, unsafe_allow_html=True)
 
         start_time = time.time()
+        if script_runs is not None:
+            route = Route.MIXED_SCRIPT
+        else:
+            route = routing.resolve(route_table, detected_script, target_script, quality_mode)
+        method = route.value
+        route_failed = False
 
         try:
-            # Handle transliteration logic (matching React app)
-            if detected_script == target_script:
+            # Dispatch on the route planned at startup (matching React app logic)
+            if route is Route.SAME_SCRIPT:
                 # Same script - just copy
                 result_text = input_text
                 confidence = 0.95
                 st.info(f"📋 Same script detected: '{input_text}' is already in {target_script}")
-            elif detected_script == 'latin' and target_script == Script.DEVANAGARI:
+            elif route is Route.MIXED_SCRIPT:
+                # Each script run goes to its own converter; spacing and punctuation are kept
+                if mixed_results is None:
+                    mixed_results = engine.transliterate_mixed_all(input_text, all_scripts, script_runs)
+                result_text = mixed_results[target_script]
+                confidence = 0.8
+            elif route is Route.ENGLISH_TO_DEVANAGARI:
                 # English to Devanagari
                 result_text = engine.english_to_devanagari(input_text)
                 confidence = 0.9
             else:
-                # Cross-script transliteration
                 st.info(f"🔄 Transliteration needed: {detected_script} → {target_script}")
+                result_text = None
 
-                # Try API first (simulated)
-                try:
-                    # Simulate API call - in real app this would call your backend
-                    api_result = simulate_api_call(input_text, detected_script, target_script, quality_mode)
-                    if api_result:
-                        result_text = api_result
+                if route is Route.API:
+                    # Persistent store first: API results survive restarts and are shared by workers
+                    result_text = result_store.get(input_text, detected_script, target_script) if result_store else None
+                    if result_text is not None:
                         confidence = 0.85
+                        method = "cache"
                     else:
-                        raise Exception("API returned empty result")
-                except Exception as api_error:
-                    st.warning(f"API failed, using fallback: {str(api_error)}")
+                        # Simulate API call - in real app this would call your backend
+                        result_text = simulate_api_call(input_text, detected_script, target_script, quality_mode)
+                        if result_text:
+                            confidence = 0.85
+                            if result_store:
+                                result_store.put(input_text, detected_script, target_script, result_text)
+                        else:
+                            route_failed = True
+                            st.warning("API returned empty result, using client-side transliteration")
 
-                    # Fallback to client-side transliteration
+                if not result_text:
+                    # Client-side transliteration
                     if detected_script == 'latin':
                         result_text = engine.transliterate(input_text, target_script)
                         confidence = 0.75
+                        method = Route.ENGLISH.value
                     else:
-                        # Cross-script conversion
-                        result_text = engine.cross_script_transliterate(input_text, detected_script, target_script)
+                        # Cross-script conversion: one call serves every target
+                        if cross_script_results is None:
+                            cross_script_results = engine.cross_script_transliterate_all(
+                                input_text, detected_script, all_scripts
+                            )
+                        result_text = cross_script_results[target_script]
                         confidence = 0.7
+                        method = Route.CROSS_SCRIPT.value
 
             duration = int((time.time() - start_time) * 1000)  # milliseconds
 
@@ -1656,16 +960,19 @@ def transliterate_text(input_text: str, source_script: str, quality_mode: str, s
             results[target_script] = TransliterationResult(
                 text=result_text,
                 confidence=confidence,
-                method="api" if 'api_result' in locals() else "fallback",
+                method=method,
                 duration=duration
             )
 
+            route_counters.record(route, (time.time() - start_time) * 1000, failed=route_failed)
+
             # Update progress
             progress_steps[i].status = "completed"
             progress_steps[i].confidence = confidence
             progress_steps[i].duration = duration
 
         except Exception as error:
+            route_counters.record(route, (time.time() - start_time) * 1000, failed=True)
             st.error(f"Error processing {target_script}: {str(error)}")
             progress_steps[i].status = "error"
             results[target_script] = TransliterationResult(
@@ -1709,6 +1016,14 @@ def transliterate_text(input_text: str, source_script: str, quality_mode: str, s
             </div>
             """, unsafe_allow_html=True)
 
+# (source, target) pairs the transliteration backend serves
+API_PAIRS = {(Script.TAMIL, Script.DEVANAGARI)}
+
+@st.cache_resource
+def get_route_table() -> Dict[Tuple[str, str, str], Route]:
+    """Route of every (source, target, quality mode), resolved once per process"""
+    return routing.build_route_table(api_pairs=API_PAIRS)
+
 def simulate_api_call(text: str, source_script: str, target_script: str, quality_mode: str) -> Optional[str]:
     """Simulate API call (replace with actual API integration)"""
     # This is a placeholder - replace with actual API call to your backend
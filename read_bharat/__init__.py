@@ -0,0 +1,54 @@
+"""
+🌈 Read Bharat - shared transliteration building blocks
+Streamlit-free helpers used by the Read Bharat apps
+
+The result store (sqlite3) and the OCR engine and reader pool are loaded on first access,
+so importing the package for text transliteration stays cheap.
+"""
+
+from .cache import CacheStats, WordCache, shared_word_cache
+from .matcher import MappingTrie
+from .scripts import Script
+from .engine import (
+    AdvancedTransliterationEngine,
+    BatchTransliterationResult,
+    ReverseTransliterationEngine,
+    TouristTranslationEngine,
+)
+
+# Exported name -> submodule, imported on first attribute access
+_LAZY = {
+    "ImageProcessingEngine": "ocr",
+    "OCRCache": "ocr_cache",
+    "OCRResult": "ocr",
+    "ReaderPool": "readers",
+    "TransliterationStore": "store",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "AdvancedTransliterationEngine",
+    "BatchTransliterationResult",
+    "CacheStats",
+    "ImageProcessingEngine",
+    "MappingTrie",
+    "OCRCache",
+    "OCRResult",
+    "ReaderPool",
+    "ReverseTransliterationEngine",
+    "Script",
+    "TouristTranslationEngine",
+    "TransliterationStore",
+    "WordCache",
+    "shared_word_cache",
+]
@@ -0,0 +1,181 @@
+"""
+🌈 Read Bharat command line transliteration
+
+    python -m read_bharat --to tamil shops.csv > shops.ta.csv
+    python -m read_bharat --from devanagari --to tamil -j 0 -o shops.ta.csv shops.csv
+    cat signs.txt | python -m read_bharat --from devanagari --to gurmukhi --lines
+
+Input is streamed in bounded chunks (or line by line with --lines); chunk
+edges are moved back to a newline, a space or a grapheme-cluster boundary so
+no akshara is ever split. With --from auto (the default) every script run is
+detected and converted on its own. --jobs memory-maps file inputs and
+converts newline-aligned ranges in a process pool (read_bharat.corpus).
+"""
+
+import argparse
+import io
+import logging
+import sys
+import time
+import unicodedata
+from typing import Iterator, List, TextIO
+
+from . import corpus
+from .corpus import convert_block
+from .detection import INDIAN_SCRIPTS
+from .engine import AdvancedTransliterationEngine
+
+DEFAULT_CHUNK_CHARS = 1 << 20
+
+# Characters that never start a grapheme cluster
+_JOINERS = ("‌", "‍")
+
+
+def _extends_cluster(text: str, index: int) -> bool:
+    """True if text[index] belongs to the cluster of the character before it"""
+    char = text[index]
+    if unicodedata.category(char) in ("Mn", "Mc", "Me") or char in _JOINERS:
+        return True
+    # A consonant after a virama or joiner continues the conjunct
+    previous = text[index - 1]
+    return unicodedata.combining(previous) == 9 or previous in _JOINERS
+
+
+def safe_split(text: str) -> int:
+    """Index at which text can be cut without splitting a line, word or grapheme cluster
+
+    Prefers the last newline, then the last whitespace, then the last cluster
+    boundary. Returns 0 when the text is a single cluster.
+    """
+    cut = text.rfind("\n") + 1
+    if cut:
+        return cut
+    for index in range(len(text) - 1, 0, -1):
+        if text[index].isspace():
+            return index + 1
+    index = len(text) - 1
+    while index > 0 and _extends_cluster(text, index):
+        index -= 1
+    return index
+
+
+def iter_blocks(stream: TextIO, chunk_chars: int, lines: bool = False) -> Iterator[str]:
+    """Yield text blocks of at most about chunk_chars, each ending on a safe boundary"""
+    carry = ""
+    while True:
+        block = stream.readline(chunk_chars) if lines else stream.read(chunk_chars)
+        if not block:
+            break
+        text = carry + block
+        if text.endswith("\n"):
+            carry = ""
+        else:
+            cut = safe_split(text)
+            if cut == 0:
+                carry = text
+                continue
+            text, carry = text[:cut], text[cut:]
+        yield text
+    if carry:
+        yield carry
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m read_bharat",
+        description="Transliterate UTF-8 text between Indian scripts, streaming from files or stdin.",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], help="input files ('-' or none for stdin)")
+    parser.add_argument("--to", dest="target", required=True, choices=INDIAN_SCRIPTS, help="target script")
+    parser.add_argument("--from", dest="source", default="auto", choices=("auto", "latin") + INDIAN_SCRIPTS,
+                        help="source script (default: detect every script run)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_CHARS,
+                        help=f"characters read per block (default: {DEFAULT_CHUNK_CHARS})")
+    parser.add_argument("--lines", action="store_true", help="read and flush line by line (for pipes)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes for file inputs (0: one per CPU); input is memory-mapped")
+    parser.add_argument("--range-size", type=int, default=corpus.DEFAULT_RANGE_BYTES,
+                        help=f"bytes per worker task with --jobs (default: {corpus.DEFAULT_RANGE_BYTES})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log the engine's debug messages to stderr")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print the summary")
+    return parser.parse_args(argv)
+
+
+def _open_input(path: str) -> TextIO:
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _open_output(path: str) -> TextIO:
+    if path == "-":
+        return io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="", write_through=False)
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _run_corpus(args: argparse.Namespace) -> int:
+    """Parallel mode: each input file is memory-mapped and converted by a process pool"""
+    if "-" in args.files:
+        print("❌ --jobs needs input files; stdin cannot be memory-mapped", file=sys.stderr)
+        return 2
+
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for path in args.files:
+            result = corpus.transliterate_corpus(
+                path, output, args.source, args.target,
+                workers=args.jobs or None, range_bytes=args.range_size, verbose=args.verbose,
+            )
+            if not args.quiet:
+                print(f"✅ {path}: {result.rows:,} rows, {result.bytes_in:,} bytes in {result.duration:.2f}s "
+                      f"({result.rows_per_second:,.0f} rows/sec, {result.workers} workers, "
+                      f"{result.ranges} ranges)", file=sys.stderr)
+    finally:
+        output.flush()
+        if args.output != "-":
+            output.close()
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format=corpus.LOG_FORMAT)
+    if args.chunk_size < 1:
+        print("❌ --chunk-size must be positive", file=sys.stderr)
+        return 2
+
+    if args.jobs != 1:
+        return _run_corpus(args)
+
+    engine = AdvancedTransliterationEngine()
+    output = _open_output(args.output)
+    characters = 0
+    start_time = time.time()
+
+    try:
+        for path in args.files:
+            stream = _open_input(path)
+            try:
+                for block in iter_blocks(stream, args.chunk_size, args.lines):
+                    output.write(convert_block(engine, block, args.source, args.target))
+                    characters += len(block)
+                    if args.lines:
+                        output.flush()
+            finally:
+                if path != "-":
+                    stream.close()
+    finally:
+        output.flush()
+        if args.output != "-":
+            output.close()
+
+    if not args.quiet:
+        elapsed = time.time() - start_time
+        rate = characters / elapsed if elapsed > 0 else 0.0
+        print(f"✅ {characters:,} characters in {elapsed:.2f}s ({rate:,.0f} chars/sec)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Akshara-level intermediate representation for the Brahmic scripts
+
+Text is parsed once into script-neutral aksharas (block offsets of the
+consonant, vowel sign and modifier); every target script then renders from
+that IR with a single table walk.
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .scripts import SCRIPT_BLOCKS
+
+# Offset ranges inside a 128-codepoint block (shared ISCII-derived layout)
+MODIFIERS = range(0x01, 0x04)
+VOWELS = tuple(range(0x05, 0x15)) + (0x60, 0x61)
+CONSONANTS = range(0x15, 0x3A)
+VOWEL_SIGNS = tuple(range(0x3E, 0x4D)) + (0x62, 0x63)
+DIGITS = range(0x66, 0x70)
+AVAGRAHA = 0x3D
+NUKTA = 0x3C
+VIRAMA = 0x4D
+ANUSVARA = 0x02
+
+
+class Akshara(NamedTuple):
+    consonant: int = 0      # consonant offset, 0 for none
+    nukta: bool = False
+    vowel: int = 0          # independent vowel or vowel-sign offset, 0 for the inherent vowel
+    virama: bool = False
+    modifier: int = 0       # candrabindu / anusvara / visarga offset
+    sign: int = 0           # digits and avagraha, rendered by offset when the target has them
+    literal: str = ""       # text outside the Brahmic blocks, copied verbatim
+
+
+# Precomposed nukta consonants (Devanagari and Gurmukhi) -> base consonant
+_NUKTA_FORMS = {0x58: 0x15, 0x59: 0x16, 0x5A: 0x17, 0x5B: 0x1C, 0x5C: 0x21, 0x5D: 0x22, 0x5E: 0x2B, 0x5F: 0x2F}
+
+# Consonant + nukta pairs that are letters in their own right (e.g. Gurmukhi sha, lla)
+_NUKTA_LETTERS = {0x38: 0x36, 0x32: 0x33, 0x28: 0x29, 0x30: 0x31, 0x33: 0x34}
+
+# Malayalam chillus -> consonant with an implicit virama
+_CHILLUS = {0x7A: 0x23, 0x7B: 0x28, 0x7C: 0x30, 0x7D: 0x32, 0x7E: 0x33, 0x7F: 0x15, 0x54: 0x2E, 0x55: 0x2F, 0x56: 0x34}
+
+# Scripts that write nukta forms; elsewhere the nukta is dropped
+_NUKTA_SCRIPTS = ("devanagari", "gurmukhi")
+
+# Gurmukhi tippi and addak
+_TIPPI = 0x70
+_ADDAK = 0x71
+
+# Fallbacks for letters a target block lacks: a nearer offset, or a sequence
+# of offsets composed in the target (e.g. vocalic r -> ra + i sign)
+Fallback = Union[int, Tuple[int, ...]]
+_FALLBACKS: Dict[int, Fallback] = {
+    # Candrabindu
+    0x01: ANUSVARA,
+    # Independent vowels
+    0x0B: (0x30, 0x3F), 0x60: (0x30, 0x40), 0x0C: (0x32, 0x3F), 0x61: (0x32, 0x40),
+    0x0D: 0x0F, 0x0E: 0x0F, 0x11: 0x13, 0x12: 0x13,
+    # Consonants: aspirated -> plain, voiced -> voiceless, rare letters -> common
+    0x16: 0x15, 0x17: 0x15, 0x18: 0x17,
+    0x1B: 0x1A, 0x1C: 0x1A, 0x1D: 0x1C,
+    0x20: 0x1F, 0x21: 0x1F, 0x22: 0x21,
+    0x25: 0x24, 0x26: 0x24, 0x27: 0x26,
+    0x2B: 0x2A, 0x2C: 0x2A, 0x2D: 0x2C,
+    0x19: 0x28, 0x1E: 0x28, 0x23: 0x28, 0x29: 0x28,
+    0x31: 0x30, 0x34: 0x33, 0x33: 0x32, 0x37: 0x36, 0x36: 0x38,
+    # Vowel signs
+    0x43: (VIRAMA, 0x30, 0x3F), 0x44: (VIRAMA, 0x30, 0x40),
+    0x62: (VIRAMA, 0x32, 0x3F), 0x63: (VIRAMA, 0x32, 0x40),
+    0x45: 0x47, 0x46: 0x47, 0x49: 0x4B, 0x4A: 0x4B,
+}
+
+# Target-specific spellings that differ from the offset-for-offset letter
+_OVERRIDES: Dict[str, Dict[int, Fallback]] = {
+    "tamil": {ANUSVARA: (0x2E, VIRAMA)},
+}
+
+
+def _assigned(base: int, offset: int) -> bool:
+    return bool(unicodedata.name(chr(base + offset), ""))
+
+
+def _build_parse_table() -> Dict[str, tuple]:
+    """Character -> parse action for every codepoint of the supported blocks"""
+    table = {}
+    for script, base in SCRIPT_BLOCKS.items():
+        for offset in range(0x80):
+            char = chr(base + offset)
+            if not _assigned(base, offset):
+                continue
+            if offset in MODIFIERS:
+                table[char] = ("M", offset)
+            elif offset in VOWELS:
+                table[char] = ("V", offset)
+            elif offset in CONSONANTS:
+                table[char] = ("C", offset, False)
+            elif offset in VOWEL_SIGNS:
+                table[char] = ("S", offset)
+            elif offset == NUKTA:
+                table[char] = ("N",)
+            elif offset == VIRAMA:
+                table[char] = ("H",)
+            elif offset in DIGITS or offset == AVAGRAHA:
+                table[char] = ("X", offset)
+            elif script in _NUKTA_SCRIPTS and offset in _NUKTA_FORMS:
+                table[char] = ("C", _NUKTA_FORMS[offset], True)
+            elif script in ("tamil", "malayalam") and offset == 0x57:
+                table[char] = ("S", 0x4C)
+            elif script == "malayalam" and offset in _CHILLUS:
+                table[char] = ("CH", _CHILLUS[offset])
+            elif script == "gurmukhi" and offset == _TIPPI:
+                table[char] = ("M", ANUSVARA)
+            elif script == "gurmukhi" and offset == _ADDAK:
+                table[char] = ("G",)
+    return table
+
+
+def _resolve(script: str, offset: int) -> Optional[str]:
+    """Spell one offset in the target block, following fallbacks for missing letters"""
+    base = SCRIPT_BLOCKS[script]
+    overrides = _OVERRIDES.get(script, {})
+    choice = overrides.get(offset, offset)
+    seen = set()
+    while isinstance(choice, int):
+        if _assigned(base, choice):
+            return chr(base + choice)
+        if choice in seen or choice not in _FALLBACKS:
+            return None
+        seen.add(choice)
+        choice = _FALLBACKS[choice]
+        if isinstance(choice, int):
+            choice = overrides.get(choice, choice)
+    return "".join(chr(base + part) for part in choice)
+
+
+def _build_glyphs(script: str) -> List[Optional[str]]:
+    """Offset -> rendered string for one target script"""
+    glyphs: List[Optional[str]] = [None] * 0x80
+    for offset in list(MODIFIERS) + list(VOWELS) + list(CONSONANTS) + list(VOWEL_SIGNS) + list(DIGITS):
+        glyphs[offset] = _resolve(script, offset)
+    glyphs[AVAGRAHA] = _resolve(script, AVAGRAHA)
+    glyphs[VIRAMA] = chr(SCRIPT_BLOCKS[script] + VIRAMA)
+    glyphs[NUKTA] = chr(SCRIPT_BLOCKS[script] + NUKTA) if script in _NUKTA_SCRIPTS else ""
+    return glyphs
+
+
+_PARSE = _build_parse_table()
+_GLYPHS = {script: _build_glyphs(script) for script in SCRIPT_BLOCKS}
+
+
+def table_fingerprint() -> str:
+    """Hash of the parse and render tables; changes whenever IR output could change"""
+    import hashlib
+
+    digest = hashlib.sha256(repr(sorted(_PARSE.items())).encode("utf-8"))
+    digest.update(repr(sorted(_GLYPHS.items())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def parse(text: str) -> List[Akshara]:
+    """Parse Brahmic text into aksharas; other characters become literal runs"""
+    text = unicodedata.normalize("NFC", text)
+    units: List[Akshara] = []
+    literal: List[str] = []
+    # Open akshara being built: [consonant, nukta, vowel, virama, modifier]
+    pending: Optional[list] = None
+    geminate = False
+
+    def flush():
+        nonlocal pending
+        if pending is not None:
+            units.append(Akshara(pending[0], pending[1], pending[2], pending[3], pending[4]))
+            pending = None
+        if literal:
+            units.append(Akshara(literal="".join(literal)))
+            literal.clear()
+
+    for char in text:
+        action = _PARSE.get(char)
+        kind = action[0] if action else None
+        open_consonant = (pending is not None and pending[0] and not pending[2] and not pending[3])
+
+        if kind == "C":
+            flush()
+            if geminate:
+                units.append(Akshara(consonant=action[1], nukta=action[2], virama=True))
+                geminate = False
+            pending = [action[1], action[2], 0, False, 0]
+        elif kind == "CH":
+            flush()
+            units.append(Akshara(consonant=action[1], virama=True))
+        elif kind == "V":
+            flush()
+            pending = [0, False, action[1], False, 0]
+        elif kind == "S" and open_consonant:
+            pending[2] = action[1]
+        elif kind == "S":
+            flush()
+            units.append(Akshara(vowel=action[1]))
+        elif kind == "N" and open_consonant and not pending[1]:
+            if pending[0] in _NUKTA_LETTERS:
+                pending[0] = _NUKTA_LETTERS[pending[0]]
+            else:
+                pending[1] = True
+        elif kind == "H" and open_consonant:
+            pending[3] = True
+        elif kind == "M" and pending is not None and not pending[4]:
+            pending[4] = action[1]
+        elif kind == "M":
+            flush()
+            units.append(Akshara(modifier=action[1]))
+        elif kind == "X":
+            flush()
+            units.append(Akshara(sign=action[1], literal=char))
+        elif kind == "G":
+            flush()
+            geminate = True
+        else:
+            if pending is not None:
+                flush()
+            literal.append(char)
+
+    flush()
+    return units
+
+
+def render(units: Iterable[Akshara], script: str) -> str:
+    """Render parsed aksharas in a target script with one table walk"""
+    glyphs = _GLYPHS[script]
+    nukta = glyphs[NUKTA]
+    virama = glyphs[VIRAMA]
+    out = []
+    append = out.append
+    for consonant, has_nukta, vowel, has_virama, modifier, sign, literal in units:
+        if sign:
+            append(glyphs[sign] or literal)
+            continue
+        if literal:
+            append(literal)
+            continue
+        if consonant:
+            append(glyphs[consonant])
+            if has_nukta:
+                append(nukta)
+        if vowel:
+            append(glyphs[vowel] or "")
+        if has_virama:
+            append(virama)
+        if modifier:
+            append(glyphs[modifier] or "")
+    return "".join(out)
+
+
+def transliterate_all(text: str, targets: Iterable[str]) -> Dict[str, str]:
+    """Parse text once and render it in every target script"""
+    units = parse(text)
+    return {target: render(units, target) for target in targets}
@@ -0,0 +1,330 @@
+"""
+Precompiled binary mapping artifact
+
+The mapping tables live as TSV files in read_bharat/data. A build step
+(`python -m read_bharat.build`) compiles them into one little-endian
+file holding, per table, the sorted keys, their values and a longest-match
+trie, all as flat uint32 arrays over a shared UTF-8 string pool. At runtime
+the file is memory-mapped read-only, so every worker process shares the same
+page-cache pages and loading it does not grow with the size of the tables.
+The engines' hot paths use dict tries that read_bharat.tables decodes from
+it per process, on first use of each table (see that module).
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .scripts import digit_mapping
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+ARTIFACT_PATH = os.path.join(DATA_DIR, "mappings.bin")
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RBTABLES"
+FORMAT_VERSION = 1
+
+# magic, format version, table count, pool offset, digest of everything after the header
+_HEADER = struct.Struct("<8sIII32s")
+# name offset/length in the pool, key count, keys/values offset arrays,
+# node count and arrays, edge count and arrays, longest key length
+_ENTRY = struct.Struct("<10I")
+
+# Native digits merged into tables at build time: table name -> digit target
+_DIGITS = {
+    "devanagari_to_tamil_approx": "tamil",
+    "devanagari_to_malayalam_approx": "malayalam",
+    "devanagari_to_gurmukhi_approx": "gurmukhi",
+    "devanagari_to_english": "latin",
+    "tamil_to_english": "latin",
+    "malayalam_to_english": "latin",
+    "gurmukhi_to_english": "latin",
+}
+
+
+def read_tsv(path: str) -> Dict[str, str]:
+    """Parse a `key<TAB>value` table; blank lines and # comments are skipped, later keys win"""
+    table: Dict[str, str] = {}
+    with open(path, encoding="utf-8") as handle:
+        for number, line in enumerate(handle, 1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("\t")
+            if not sep or not key:
+                raise ValueError(f"{path}:{number}: expected 'key<TAB>value'")
+            table[key] = value
+    return table
+
+
+def load_sources(data_dir: str = DATA_DIR) -> Dict[str, Dict[str, str]]:
+    """Read every TSV table in data_dir, with the derived digit entries merged in"""
+    tables = {}
+    for filename in sorted(os.listdir(data_dir)):
+        if filename.endswith(".tsv"):
+            name = filename[:-len(".tsv")]
+            table = read_tsv(os.path.join(data_dir, filename))
+            if name in _DIGITS:
+                table.update(digit_mapping(_DIGITS[name]))
+            tables[name] = table
+    return tables
+
+
+class _Writer:
+    """Accumulates uint32 arrays and the string pool of one artifact"""
+
+    def __init__(self):
+        self.arrays = array("I")
+        self.pool = bytearray()
+
+    def string(self, text: str) -> Tuple[int, int]:
+        data = text.encode("utf-8")
+        start = len(self.pool)
+        self.pool += data
+        return start, len(data)
+
+    def extend(self, values: List[int]) -> int:
+        """Append an array and return its index (in uint32 units)"""
+        start = len(self.arrays)
+        self.arrays.extend(values)
+        return start
+
+
+def _compile_table(writer: _Writer, name: str, table: Dict[str, str]) -> Tuple[int, ...]:
+    keys = sorted(table, key=lambda key: key.encode("utf-8"))
+
+    key_offsets, value_offsets = [], []
+    for key in keys:
+        key_offsets.append(writer.string(key)[0])
+    key_offsets.append(len(writer.pool))
+    for key in keys:
+        value_offsets.append(writer.string(table[key])[0])
+    value_offsets.append(len(writer.pool))
+
+    # Trie laid out breadth-first so each node's children are one sorted edge range
+    children: List[Dict[int, int]] = [{}]
+    terminal: List[int] = [0]
+    for index, key in enumerate(keys):
+        node = 0
+        for char in key:
+            child = children[node].get(ord(char))
+            if child is None:
+                child = len(children)
+                children[node][ord(char)] = child
+                children.append({})
+                terminal.append(0)
+            node = child
+        terminal[node] = index + 1  # 0 marks a node without a value
+
+    order = [0]
+    position = {0: 0}
+    for node in order:
+        for _, child in sorted(children[node].items()):
+            position[child] = len(order)
+            order.append(child)
+
+    node_first, node_count, node_value, edge_char, edge_child = [], [], [], [], []
+    for node in order:
+        node_first.append(len(edge_char))
+        node_count.append(len(children[node]))
+        node_value.append(terminal[node])
+        for char, child in sorted(children[node].items()):
+            edge_char.append(char)
+            edge_child.append(position[child])
+
+    name_offset, name_length = writer.string(name)
+    return (
+        name_offset, name_length, len(keys),
+        writer.extend(key_offsets), writer.extend(value_offsets),
+        len(order), writer.extend(node_first + node_count + node_value),
+        len(edge_char), writer.extend(edge_char + edge_child),
+        max((len(key) for key in keys), default=0),
+    )
+
+
+def build(tables: Mapping[str, Mapping[str, str]]) -> bytes:
+    """Compile tables into the binary artifact format"""
+    import hashlib
+
+    writer = _Writer()
+    entries = [_compile_table(writer, name, dict(tables[name])) for name in sorted(tables)]
+
+    directory_size = _ENTRY.size * len(entries)
+    arrays_offset = _HEADER.size + directory_size
+    pool_offset = arrays_offset + writer.arrays.itemsize * len(writer.arrays)
+
+    arrays = array("I", writer.arrays)
+    if sys.byteorder != "little":
+        arrays.byteswap()
+
+    body = bytearray()
+    for entry in entries:
+        # Array indexes become absolute byte offsets into the file
+        fields = list(entry)
+        for slot in (3, 4, 6, 8):
+            fields[slot] = arrays_offset + 4 * fields[slot]
+        body += _ENTRY.pack(*fields)
+    body += arrays.tobytes()
+    body += writer.pool
+
+    digest = hashlib.sha256(body).digest()
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(entries), pool_offset, digest) + bytes(body)
+
+
+def _uint32s(buffer: memoryview, offset: int, count: int):
+    """Zero-copy uint32 view on little-endian hosts, a swapped copy elsewhere"""
+    view = buffer[offset:offset + 4 * count]
+    if sys.byteorder == "little":
+        return view.cast("I")
+    values = array("I", view.tobytes())
+    values.byteswap()
+    return values
+
+
+class MappedTable(Mapping[str, str]):
+    """Read-only mapping and longest-match trie over one table of a mapped artifact
+
+    Exposes the same match()/convert() interface as MappingTrie for tools
+    that read an artifact directly; read_bharat.tables decodes each table
+    into a dict and a MappingTrie once per process for the engines' hot paths.
+    """
+
+    def __init__(self, buffer: memoryview, pool_offset: int, entry: Tuple[int, ...]):
+        (name_offset, name_length, self._size, keys_offset, values_offset,
+         node_total, nodes_offset, edge_total, edges_offset, self.max_key_length) = entry
+        self._buffer = buffer
+        self._pool = pool_offset
+        self.name = str(buffer[pool_offset + name_offset:pool_offset + name_offset + name_length], "utf-8")
+        self._keys = _uint32s(buffer, keys_offset, self._size + 1)
+        self._values = _uint32s(buffer, values_offset, self._size + 1)
+        nodes = _uint32s(buffer, nodes_offset, 3 * node_total)
+        self._node_first = nodes[:node_total]
+        self._node_count = nodes[node_total:2 * node_total]
+        self._node_value = nodes[2 * node_total:]
+        edges = _uint32s(buffer, edges_offset, 2 * edge_total)
+        self._edge_char = edges[:edge_total]
+        self._edge_child = edges[edge_total:]
+
+        # Single-codepoint tables also get a str.translate table, built on first convert()
+        self._translation: Optional[Dict[int, str]] = None
+
+    @property
+    def translation(self) -> Optional[Dict[int, str]]:
+        if self._translation is None and self.max_key_length == 1:
+            self._translation = str.maketrans(dict(self.items()))
+        return self._translation
+
+    def initials(self) -> frozenset:
+        """First characters of every key, read from the trie root without decoding any key"""
+        first = self._node_first[0]
+        return frozenset(chr(code) for code in self._edge_char[first:first + self._node_count[0]])
+
+    def _string(self, offsets, index: int) -> str:
+        return str(self._buffer[self._pool + offsets[index]:self._pool + offsets[index + 1]], "utf-8")
+
+    def _child(self, node: int, char: str) -> int:
+        first = self._node_first[node]
+        last = first + self._node_count[node]
+        code = ord(char)
+        edge = bisect.bisect_left(self._edge_char, code, first, last)
+        if edge < last and self._edge_char[edge] == code:
+            return self._edge_child[edge]
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        node = 0
+        for char in key:
+            node = self._child(node, char)
+            if node < 0:
+                raise KeyError(key)
+        value = self._node_value[node]
+        if not value:
+            raise KeyError(key)
+        return self._string(self._values, value - 1)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._size):
+            yield self._string(self._keys, index)
+
+    def match(self, text: str, start: int = 0) -> Optional[Tuple[int, str]]:
+        """Return (end, value) of the longest key starting at `start`, or None"""
+        node = 0
+        best = 0
+        end = start
+        i = start
+        n = len(text)
+        while i < n:
+            node = self._child(node, text[i])
+            if node < 0:
+                break
+            i += 1
+            if self._node_value[node]:
+                best = self._node_value[node]
+                end = i
+        if not best:
+            return None
+        return end, self._string(self._values, best - 1)
+
+    def convert(self, text: str) -> str:
+        """Replace every longest match; unmapped characters are copied through"""
+        if self.translation is not None:
+            return text.translate(self.translation)
+
+        out = []
+        append = out.append
+        i = 0
+        n = len(text)
+        while i < n:
+            found = self.match(text, i)
+            if found is None:
+                append(text[i])
+                i += 1
+            else:
+                i, value = found
+                append(value)
+        return "".join(out)
+
+
+class MappedArtifact:
+    """All tables of one artifact, backed by a read-only mmap (or an in-memory build)"""
+
+    def __init__(self, data, source: str):
+        self._data = data
+        self.source = source
+        buffer = memoryview(data)
+        magic, version, count, pool_offset, self.digest = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{source}: not a version {FORMAT_VERSION} mapping artifact")
+
+        self.tables: Dict[str, MappedTable] = {}
+        for index in range(count):
+            entry = _ENTRY.unpack_from(buffer, _HEADER.size + index * _ENTRY.size)
+            table = MappedTable(buffer, pool_offset, entry)
+            self.tables[table.name] = table
+
+    def __getitem__(self, name: str) -> MappedTable:
+        return self.tables[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tables
+
+
+def load(path: str = ARTIFACT_PATH) -> MappedArtifact:
+    """Memory-map the compiled artifact; compile the TSV sources in memory if it is missing"""
+    try:
+        with open(path, "rb") as handle:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        logger.warning("%s not found, compiling mapping tables in memory "
+                       "(run `python -m read_bharat.build` to build it)", path)
+        return MappedArtifact(build(load_sources()), source="<memory>")
+    return MappedArtifact(data, source=path)
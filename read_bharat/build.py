@@ -0,0 +1,41 @@
+"""
+Build step for the binary mapping artifact
+
+    python -m read_bharat.build           # compile read_bharat/data/*.tsv
+    python -m read_bharat.build --check   # fail if mappings.bin is stale
+"""
+
+import os
+import sys
+from typing import List, Optional
+
+from .artifact import ARTIFACT_PATH, build, load_sources
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build the artifact from read_bharat/data, or verify it with --check"""
+    args = sys.argv[1:] if argv is None else argv
+    compiled = build(load_sources())
+
+    if "--check" in args:
+        try:
+            with open(ARTIFACT_PATH, "rb") as handle:
+                current = handle.read()
+        except FileNotFoundError:
+            current = b""
+        if current != compiled:
+            print(f"❌ {ARTIFACT_PATH} is out of date; run `python -m read_bharat.build`")
+            return 1
+        print(f"✅ {ARTIFACT_PATH} is up to date")
+        return 0
+
+    temporary = ARTIFACT_PATH + ".tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(compiled)
+    os.replace(temporary, ARTIFACT_PATH)
+    print(f"✅ Wrote {ARTIFACT_PATH} ({len(compiled):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
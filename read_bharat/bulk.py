@@ -0,0 +1,127 @@
+"""
+Vectorized bulk conversion between the Brahmic Unicode blocks
+
+Devanagari, Gurmukhi, Tamil and Malayalam share the ISCII-derived layout,
+so nearly every character converts by its offset within the block. Text is
+decoded to a uint32 array and mapped through a per-target table (one
+128-entry row of up to three output codepoints per source block, built from
+read_bharat.direct) with numpy indexing. Words whose output depends on context the table cannot express
+(stray virama or nukta, Gurmukhi addak, marks reordered after a modifier)
+are found with vectorized neighbour checks and re-rendered through the
+akshara IR. The result is identical to rendering each whitespace-separated
+word with akshara.parse/render.
+"""
+
+import unicodedata
+from typing import Dict, Iterable
+
+import numpy as np
+
+from . import akshara, direct
+from .scripts import SCRIPT_BLOCKS
+
+# Codepoint range covered by the tables (Devanagari .. Malayalam)
+_LOW = 0x0900
+_HIGH = 0x0D80
+
+# Longest rendering of one source character (e.g. Tamil vocalic r sign -> virama + ra + i)
+_WIDTH = 3
+
+# Character classes for the context checks
+_OTHER, _CONSONANT, _NUKTA_LETTER, _CONSONANT_NUKTA, _NUKTA, _VIRAMA, _SIGN, _MODIFIER, _FIXUP = range(9)
+_CLASS_CODES = {
+    direct.CONSONANT: _CONSONANT, direct.NUKTA_LETTER: _NUKTA_LETTER, direct.CONSONANT_NUKTA: _CONSONANT_NUKTA,
+    direct.NUKTA: _NUKTA, direct.VIRAMA: _VIRAMA, direct.SIGN: _SIGN, direct.MODIFIER: _MODIFIER,
+    direct.FIXUP: _FIXUP,
+}
+
+# Whitespace as matched by the engine's word splitter (str.isspace stops at U+3000);
+# codepoints are clamped to the last, non-space entry
+_IS_SPACE = np.array([chr(code).isspace() for code in range(0x3002)], dtype=bool)
+
+# Classes a virama can attach to
+_VIRAMA_BASES = np.zeros(_FIXUP + 1, dtype=bool)
+_VIRAMA_BASES[[_CLASS_CODES[cls] for cls in direct.VIRAMA_BASES]] = True
+
+
+def _build_classes() -> np.ndarray:
+    classes = np.full(_HIGH - _LOW, _OTHER, dtype=np.uint8)
+    for char, cls in direct.CHAR_CLASSES.items():
+        classes[ord(char) - _LOW] = _CLASS_CODES[cls]
+    return classes
+
+
+def _build_table(script: str):
+    """Codepoint -> rendered codepoints (zero padded) and their count, for one target script"""
+    size = _HIGH - _LOW
+    table = np.zeros((size, _WIDTH), dtype=np.uint32)
+    table[:, 0] = np.arange(_LOW, _HIGH, dtype=np.uint32)
+    lengths = np.ones(size, dtype=np.uint8)
+
+    for code, rendered in direct.TRANSLATIONS[script].items():
+        index = code - _LOW
+        lengths[index] = len(rendered)
+        table[index] = 0
+        for position, out in enumerate(rendered):
+            table[index, position] = ord(out)
+    return table, lengths
+
+
+_CLASSES = _build_classes()
+_TABLES = {script: _build_table(script) for script in SCRIPT_BLOCKS}
+
+
+def convert(text: str, target: str) -> str:
+    """Render text in the target script, vectorized with a per-word IR fix-up pass"""
+    target = str(getattr(target, "value", target))
+    if not text:
+        return text
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    table, lengths = _TABLES[target]
+
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    inside = (codes >= _LOW) & (codes < _HIGH)
+    index = np.where(inside, codes - _LOW, 0)
+    classes = np.where(inside, _CLASSES[index], _OTHER)
+
+    # Context the table cannot express: marks that only attach to a preceding consonant
+    previous = np.empty_like(classes)
+    previous[0] = _OTHER
+    previous[1:] = classes[:-1]
+    fixup = classes == _FIXUP
+    fixup |= (classes == _NUKTA) & (previous != _CONSONANT)
+    fixup |= (classes == _VIRAMA) & ~_VIRAMA_BASES[previous]
+    fixup |= (classes == _SIGN) & (previous == _MODIFIER)
+
+    rows = table[index]
+    counts = lengths[index]
+    rows[~inside, 0] = codes[~inside]
+    counts = np.where(inside, counts, 1)
+    keep = np.arange(_WIDTH) < counts[:, None]
+
+    if not fixup.any():
+        return rows[keep].astype("<u4").tobytes().decode("utf-32-le")
+
+    # Re-render the whole words that contain a fix-up position through the IR
+    word = ~_IS_SPACE[np.minimum(codes, len(_IS_SPACE) - 1)]
+    edges = np.diff(np.concatenate(([0], word.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    flagged = np.unique(np.searchsorted(starts, np.flatnonzero(fixup), side="right") - 1)
+
+    pieces = []
+    position = 0
+    for start, end in zip(starts[flagged].tolist(), ends[flagged].tolist()):
+        if start > position:
+            pieces.append(rows[position:start][keep[position:start]].astype("<u4").tobytes().decode("utf-32-le"))
+        pieces.append(akshara.render(akshara.parse(text[start:end]), target))
+        position = end
+    if position < len(codes):
+        pieces.append(rows[position:][keep[position:]].astype("<u4").tobytes().decode("utf-32-le"))
+    return "".join(pieces)
+
+
+def convert_all(text: str, targets: Iterable[str]) -> Dict[str, str]:
+    """Bulk-convert text to every target script"""
+    return {target: convert(text, target) for target in targets}
@@ -0,0 +1,130 @@
+"""
+Parallel corpus transliteration over a memory-mapped input file
+
+The input is memory-mapped and cut into newline-aligned byte ranges; each
+range is converted by a ProcessPoolExecutor worker that builds its engine
+once, and the results are written back in input order with a bounded
+number of ranges in flight.
+"""
+
+import logging
+import mmap
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from .engine import AdvancedTransliterationEngine
+from .scripts import Script
+
+DEFAULT_RANGE_BYTES = 4 << 20
+
+# Library messages go to stderr through logging; stdout carries only converted text
+LOG_FORMAT = "%(levelname)s %(name)s: %(message)s"
+
+# Ranges queued per worker; bounds the converted output held in memory
+_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass
+class CorpusResult:
+    rows: int
+    bytes_in: int
+    bytes_out: int
+    ranges: int
+    workers: int
+    duration: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.duration if self.duration > 0 else 0.0
+
+
+def convert_block(engine: AdvancedTransliterationEngine, text: str, source: str, target: str) -> str:
+    """Convert one block, keeping every character the converters do not touch"""
+    if source == "auto":
+        return engine.transliterate_mixed(text, target)
+    if source == target:
+        return text
+    if source == "latin":
+        # transliterate() trims its input, so put the surrounding whitespace back
+        core = text.strip()
+        if not core:
+            return text
+        start = text.index(core[0])
+        return text[:start] + engine.transliterate(core, target) + text[start + len(core):]
+    return engine.cross_script_transliterate_all(text, Script(source), [target])[target]
+
+
+def newline_ranges(data, range_bytes: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) byte ranges of about range_bytes, each ending after a newline"""
+    size = len(data)
+    start = 0
+    while start < size:
+        end = data.find(b"\n", min(start + range_bytes, size) - 1)
+        end = size if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+# Worker process state, built once by the pool initializer
+_engine: Optional[AdvancedTransliterationEngine] = None
+
+
+def _init_worker(log_level: int):
+    global _engine
+    # Spawned workers do not inherit the parent's logging setup
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    _engine = AdvancedTransliterationEngine()
+
+
+def _convert_range(path: str, start: int, end: int, source: str, target: str) -> Tuple[bytes, int]:
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        chunk = data[start:end]
+    rows = chunk.count(b"\n") + (not chunk.endswith(b"\n"))
+    text = chunk.decode("utf-8")
+    return convert_block(_engine, text, source, target).encode("utf-8"), rows
+
+
+def transliterate_corpus(path: str, output: BinaryIO, source: str, target: str,
+                         workers: Optional[int] = None, range_bytes: int = DEFAULT_RANGE_BYTES,
+                         verbose: bool = False) -> CorpusResult:
+    """Transliterate a UTF-8 file in parallel and write the result to a binary stream in order"""
+    workers = workers or os.cpu_count() or 1
+    start_time = time.time()
+    rows = bytes_in = bytes_out = ranges = 0
+
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return CorpusResult(0, 0, 0, 0, workers)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+                ProcessPoolExecutor(workers, initializer=_init_worker,
+                                    initargs=(logging.DEBUG if verbose else logging.WARNING,)) as pool:
+            pending = deque()
+
+            def drain():
+                nonlocal rows, bytes_out
+                converted, range_rows = pending.popleft().result()
+                output.write(converted)
+                rows += range_rows
+                bytes_out += len(converted)
+
+            for start, end in newline_ranges(data, range_bytes):
+                pending.append(pool.submit(_convert_range, path, start, end, source, target))
+                bytes_in += end - start
+                ranges += 1
+                if len(pending) >= workers * _IN_FLIGHT_PER_WORKER:
+                    drain()
+            while pending:
+                drain()
+
+    return CorpusResult(
+        rows=rows,
+        bytes_in=bytes_in,
+        bytes_out=bytes_out,
+        ranges=ranges,
+        workers=workers,
+        duration=time.time() - start_time,
+    )
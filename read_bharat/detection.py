@@ -0,0 +1,136 @@
+"""
+Single-pass script detector shared by the text and OCR paths
+
+numpy is imported on the first detection call, so importing the package for
+text conversion alone stays cheap.
+"""
+
+import functools
+from typing import Dict, List, Optional, Tuple
+
+from .scripts import SCRIPT_BLOCKS
+
+# Class index 0 is "not a script character"; the remaining order is also the
+# tie-break order (first maximum wins), matching the React app logic
+SCRIPT_LABELS = ("other", "devanagari", "tamil", "malayalam", "gurmukhi", "latin")
+INDIAN_SCRIPTS = SCRIPT_LABELS[1:5]
+
+# Chunk size (in characters) used when scanning large inputs incrementally
+CHUNK_CHARS = 1 << 16
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup():
+    """Codepoint -> script class table; the final entry catches everything above it"""
+    import numpy as np
+
+    top = max(SCRIPT_BLOCKS.values()) + 0x80
+    lookup = np.zeros(top + 1, dtype=np.uint8)
+    for script, base in SCRIPT_BLOCKS.items():
+        lookup[base:base + 0x80] = SCRIPT_LABELS.index(script)
+    latin = SCRIPT_LABELS.index("latin")
+    lookup[ord('A'):ord('Z') + 1] = latin
+    lookup[ord('a'):ord('z') + 1] = latin
+    lookup.setflags(write=False)
+    return lookup
+
+
+def _classes(text: str):
+    """Script class of every character of text"""
+    import numpy as np
+
+    lookup = _lookup()
+    codepoints = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+    return lookup[np.minimum(codepoints, lookup.size - 1)]
+
+
+def _classify(text: str):
+    """Per-class character counts for one chunk of text"""
+    import numpy as np
+
+    return np.bincount(_classes(text), minlength=len(SCRIPT_LABELS))
+
+
+def count_scripts(text: str, sample: Optional[int] = None) -> Dict[str, int]:
+    """Count characters per script in a single vectorized pass
+
+    Large inputs are scanned in chunks and stop as soon as the leading
+    script can no longer be overtaken. With `sample`, at most that many
+    characters are classified, taken as evenly spaced chunks of the text.
+    """
+    import numpy as np
+
+    n = len(text)
+    if n <= CHUNK_CHARS:
+        counts = _classify(text)
+    else:
+        counts = np.zeros(len(SCRIPT_LABELS), dtype=np.int64)
+        starts = range(0, n, CHUNK_CHARS)
+        if sample is not None and sample < n:
+            wanted = max(1, -(-sample // CHUNK_CHARS))
+            stride = max(1, len(starts) // wanted)
+            starts = starts[::stride][:wanted]
+        remaining = n
+        for start in starts:
+            chunk = text[start:start + CHUNK_CHARS]
+            counts += _classify(chunk)
+            remaining -= len(chunk)
+            ranked = np.sort(counts[1:])
+            if ranked[-1] - ranked[-2] > remaining:
+                break
+
+    return {label: int(count) for label, count in zip(SCRIPT_LABELS[1:], counts[1:])}
+
+
+def dominant_script(counts: Dict[str, int], include_latin: bool = True) -> Optional[str]:
+    """Return the script with the most characters, or None when nothing matched"""
+    labels = SCRIPT_LABELS[1:] if include_latin else INDIAN_SCRIPTS
+    best = max(labels, key=lambda label: counts.get(label, 0))
+    return best if counts.get(best, 0) > 0 else None
+
+
+def detect_script(text: str, sample: Optional[int] = None) -> str:
+    """Detect the dominant script of text: an Indian script, 'latin' or 'unknown'"""
+    if not text.strip():
+        return "unknown"
+    return dominant_script(count_scripts(text, sample)) or "latin"
+
+
+def segment_runs(text: str) -> List[Tuple[str, int, int]]:
+    """Split text into (script, start, end) runs in one vectorized pass
+
+    Neutral characters (spaces, punctuation, ASCII digits) between letters of
+    the same script stay inside that run; neutral stretches at a script
+    change, or at either end, become "other" runs. The runs cover the text
+    exactly, in order.
+    """
+    import numpy as np
+
+    if not text:
+        return []
+    classes = _classes(text)
+    letters = np.flatnonzero(classes)
+    if not letters.size:
+        return [("other", 0, len(text))]
+
+    letter_classes = classes[letters]
+    change = np.flatnonzero(letter_classes[1:] != letter_classes[:-1])
+    firsts = letters[np.concatenate(([0], change + 1))].tolist()
+    lasts = (letters[np.concatenate((change, [letters.size - 1]))] + 1).tolist()
+    labels = [SCRIPT_LABELS[label] for label in letter_classes[np.concatenate(([0], change + 1))].tolist()]
+
+    runs = []
+    position = 0
+    for label, first, last in zip(labels, firsts, lasts):
+        if first > position:
+            runs.append(("other", position, first))
+        runs.append((label, first, last))
+        position = last
+    if position < len(text):
+        runs.append(("other", position, len(text)))
+    return runs
+
+
+def is_mixed_script(runs: List[Tuple[str, int, int]]) -> bool:
+    """True when the runs contain letters of more than one script"""
+    return len({label for label, _, _ in runs if label != "other"}) > 1
@@ -0,0 +1,104 @@
+"""
+Direct per-target translation tables compiled from the akshara IR
+
+Nearly every Brahmic character renders the same way whatever surrounds it,
+so the IR glyph tables are compiled into one str.translate table per target
+script (covering every source block). Words whose marks need context are
+detected with a regex and rendered through the IR instead. Pure Python, so
+the per-word path never imports numpy; read_bharat.bulk vectorizes the same
+tables for whole documents.
+"""
+
+import re
+import unicodedata
+from typing import Dict
+
+from . import akshara
+from .scripts import SCRIPT_BLOCKS
+
+# Context classes of the characters that matter for direct conversion
+CONSONANT = "consonant"
+NUKTA_LETTER = "nukta_letter"            # consonant that a nukta turns into another letter
+CONSONANT_NUKTA = "consonant_nukta"      # precomposed consonant + nukta
+NUKTA = "nukta"
+VIRAMA = "virama"
+SIGN = "sign"
+MODIFIER = "modifier"
+FIXUP = "fixup"                          # always needs the IR (Gurmukhi addak)
+
+# Classes a virama can attach to
+VIRAMA_BASES = (CONSONANT, NUKTA_LETTER, CONSONANT_NUKTA, NUKTA)
+
+
+def _char_class(action: tuple):
+    kind = action[0]
+    if kind == "C" and action[2]:
+        return CONSONANT_NUKTA
+    if kind == "C":
+        return NUKTA_LETTER if action[1] in akshara._NUKTA_LETTERS else CONSONANT
+    return {"N": NUKTA, "H": VIRAMA, "S": SIGN, "M": MODIFIER, "G": FIXUP}.get(kind)
+
+
+def _render_char(char: str, action: tuple, script: str):
+    """Context-free rendering of one character, or None for characters the IR copies"""
+    kind = action[0]
+    if kind == "C":
+        units = [akshara.Akshara(consonant=action[1], nukta=action[2])]
+    elif kind == "CH":
+        units = [akshara.Akshara(consonant=action[1], virama=True)]
+    elif kind in ("V", "S"):
+        units = [akshara.Akshara(vowel=action[1])]
+    elif kind == "M":
+        units = [akshara.Akshara(modifier=action[1])]
+    elif kind == "X":
+        units = [akshara.Akshara(sign=action[1], literal=char)]
+    elif kind in ("N", "H"):
+        # Render after a placeholder consonant and keep only the mark
+        units = [akshara.Akshara(consonant=0x15, nukta=kind == "N", virama=kind == "H")]
+        return akshara.render(units, script)[1:]
+    else:
+        return None
+    return akshara.render(units, script)
+
+
+def _build_translation(script: str) -> Dict[int, str]:
+    translation = {}
+    for char, action in akshara._PARSE.items():
+        rendered = _render_char(char, action, script)
+        if rendered is not None and rendered != char:
+            translation[ord(char)] = rendered
+    return translation
+
+
+CHAR_CLASSES: Dict[str, str] = {
+    char: cls for char, cls in ((char, _char_class(action)) for char, action in akshara._PARSE.items()) if cls
+}
+
+# Per-target direct tables: every source script goes straight to the target
+TRANSLATIONS: Dict[str, Dict[int, str]] = {script: _build_translation(script) for script in SCRIPT_BLOCKS}
+
+
+def _build_context_pattern() -> "re.Pattern":
+    """Regex matching the positions whose rendering depends on their neighbours"""
+    def chars(*wanted):
+        return "".join(char for char, cls in CHAR_CLASSES.items() if cls in wanted)
+
+    return re.compile(
+        f"[{chars(FIXUP)}]"
+        f"|(?<![{chars(CONSONANT)}])[{chars(NUKTA)}]"
+        f"|(?<![{chars(*VIRAMA_BASES)}])[{chars(VIRAMA)}]"
+        f"|[{chars(MODIFIER)}][{chars(SIGN)}]"
+    )
+
+
+_CONTEXT = _build_context_pattern()
+
+
+def convert_word(word: str, target: str) -> str:
+    """Convert one word with its direct table, or through the IR when marks need context"""
+    target = str(getattr(target, "value", target))
+    if not unicodedata.is_normalized("NFC", word):
+        word = unicodedata.normalize("NFC", word)
+    if _CONTEXT.search(word):
+        return akshara.render(akshara.parse(word), target)
+    return word.translate(TRANSLATIONS[target])
@@ -0,0 +1,356 @@
+"""
+Transliteration engines (matching the React app implementation)
+Streamlit-free, so they can be used from the apps, scripts and batch jobs
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from . import detection, direct, tables
+from .cache import WordCache, shared_word_cache
+from .scripts import Script
+
+# Splits text into words and the whitespace runs between them
+_WHITESPACE = re.compile(r'(\s+)')
+
+logger = logging.getLogger(__name__)
+
+# Inputs at least this long are converted with the vectorized bulk converter
+BULK_MIN_CHARS = 4096
+
+
+@dataclass
+class BatchTransliterationResult:
+    texts: List[str]
+    columns: Dict[str, List[str]]  # target script -> one output per input text
+    sources: List[str]
+    unique_tokens: int
+    total_tokens: int
+    duration: int = 0
+
+
+class AdvancedTransliterationEngine:
+    """Advanced transliteration engine matching the React app implementation"""
+
+    def __init__(self, word_cache: Optional[WordCache] = None):
+        # Per-word results, shared process-wide unless a dedicated cache is given
+        self.word_cache = word_cache if word_cache is not None else shared_word_cache
+
+        # Mapping tables are shared read-only registry entries (read_bharat.tables)
+        self.tamil_to_devanagari_map = tables.TAMIL_TO_DEVANAGARI
+        self.english_to_devanagari_map = tables.ENGLISH_TO_DEVANAGARI
+        self.english_to_tamil_map = tables.ENGLISH_TO_TAMIL
+        self.english_to_malayalam_map = tables.ENGLISH_TO_MALAYALAM
+        self.english_to_gurmukhi_map = tables.ENGLISH_TO_GURMUKHI
+        self.phonetic_maps = tables.PHONETIC_APPROXIMATION
+
+        # Longest-match tries, compiled once per process and shared
+        self.tamil_to_devanagari_trie = tables.compiled(self.tamil_to_devanagari_map)
+        self.english_to_devanagari_trie = tables.compiled(self.english_to_devanagari_map)
+        self.phonetic_tables = {
+            target: tables.compiled(basic_mapping)
+            for target, basic_mapping in self.phonetic_maps.items()
+        }
+
+    def detect_script(self, text: str) -> str:
+        """Detect the script of input text (matching React app logic)"""
+        detected = detection.detect_script(text)
+        return Script(detected) if detected in detection.INDIAN_SCRIPTS else detected
+
+    def tamil_to_devanagari_direct(self, text: str) -> str:
+        """Direct Tamil to Devanagari conversion (matching React app)"""
+        return self.tamil_to_devanagari_trie.convert(text)
+
+    def english_to_devanagari(self, text: str) -> str:
+        """Convert English to Devanagari (matching React app)"""
+        return self.transliterate_with_mapping(text, self.english_to_devanagari_map, Script.DEVANAGARI)
+
+    def transliterate(self, text: str, target_script: str) -> str:
+        """Universal transliterate method (matching React app)"""
+        if target_script == Script.DEVANAGARI:
+            return self.english_to_devanagari(text)
+        elif target_script == Script.TAMIL:
+            return self.transliterate_with_mapping(text, self.english_to_tamil_map, target_script)
+        elif target_script == Script.MALAYALAM:
+            return self.transliterate_with_mapping(text, self.english_to_malayalam_map, target_script)
+        elif target_script == Script.GURMUKHI:
+            return self.transliterate_with_mapping(text, self.english_to_gurmukhi_map, target_script)
+        else:
+            return text
+
+    def transliterate_with_mapping(self, text: str, mapping: Mapping[str, str],
+                                   target_script: Optional[str] = None) -> str:
+        """Generic transliteration method
+
+        Whole-word entries win, otherwise longest-match character conversion.
+        With a target script, per-word results go through the word cache,
+        keyed by the mapping as well so different tables never share entries.
+        Whitespace between words is kept as it appears in the input.
+        """
+        trie = tables.compiled(mapping)
+        cache = self.word_cache if target_script is not None else None
+        mapping_key = tables.table_key(mapping) if cache is not None else None
+        result_words = []
+
+        for piece in _WHITESPACE.split(text.strip()):
+            if not piece or piece.isspace():
+                result_words.append(piece)
+                continue
+            # Tables are keyed in lowercase; letters they leave unmapped keep their case
+            word = piece.lower()
+            original = piece if len(word) == len(piece) else word
+            if cache is not None:
+                key = (original, 'latin', target_script, mapping_key)
+                converted = cache.get(key)
+                if converted is not None:
+                    result_words.append(converted)
+                    continue
+
+            # Whole-word entries come from the trie too, so artifact tables are never walked per character
+            converted = trie.get(word)
+            if converted is None:
+                converted = trie.convert(word, original) or original
+
+            if cache is not None:
+                cache.put(key, converted)
+            result_words.append(converted)
+
+        return "".join(result_words)
+
+    def cross_script_transliterate(self, text: str, source_script: str, target_script: str) -> str:
+        """Cross-script transliteration (matching React app logic)"""
+        return self.cross_script_transliterate_all(text, source_script, [target_script])[target_script]
+
+    def cross_script_transliterate_all(self, text: str, source_script: str, target_scripts: List[str]) -> Dict[str, str]:
+        """Cross-script transliteration to several targets, word by word through the word cache"""
+        # Called per token by the batch and mixed-script paths, so this stays off stdout
+        logger.debug("Cross-script: %s → %s, %d chars", source_script, ", ".join(target_scripts), len(text))
+
+        results: Dict[str, str] = {}
+        word_targets = list(target_scripts)
+        if len(text) >= BULK_MIN_CHARS:
+            # Whole documents: vectorized block-offset conversion instead of per-word lookups
+            from . import bulk  # numpy-backed; imported on first use to keep imports light
+            word_targets = []
+            for target in target_scripts:
+                if target == source_script:
+                    results[target] = text
+                elif source_script == Script.TAMIL and target == Script.DEVANAGARI:
+                    word_targets.append(target)  # the direct table is word-level
+                else:
+                    results[target] = bulk.convert(text, target)
+
+        if word_targets:
+            parts: Dict[str, List[str]] = {target: [] for target in word_targets}
+            for piece in _WHITESPACE.split(text):
+                if not piece or piece.isspace():
+                    converted = dict.fromkeys(word_targets, piece)
+                else:
+                    converted = self._cross_script_word(piece, source_script, word_targets)
+                for target in word_targets:
+                    parts[target].append(converted[target])
+            for target, pieces in parts.items():
+                results[target] = "".join(pieces)
+
+        return {target: results[target] for target in target_scripts}
+
+    def _cross_script_word(self, word: str, source_script: str, target_scripts: List[str]) -> Dict[str, str]:
+        """Convert one word to every uncached target"""
+        results = {}
+        for target_script in target_scripts:
+            key = (word, source_script, target_script)
+            cached = self.word_cache.get(key)
+            if cached is not None:
+                results[target_script] = cached
+                continue
+
+            try:
+                result = word if target_script == source_script else None
+
+                # Special handling for common conversions: the direct table serves every
+                # word containing one of its letters (each key's first letter is a key too)
+                if (result is None and source_script == Script.TAMIL and target_script == Script.DEVANAGARI
+                        and not tables.TAMIL_TO_DEVANAGARI_INITIALS.isdisjoint(word)):
+                    result = self.tamil_to_devanagari_direct(word)
+
+                # Direct source→target table in one pass; the IR only for context-dependent marks
+                if result is None:
+                    result = direct.convert_word(word, target_script)
+            except Exception as error:
+                logger.warning("Cross-script transliteration of %r failed: %s", word, error)
+                result = self.phonetic_approximation(word, source_script, target_script)
+
+            self.word_cache.put(key, result)
+            results[target_script] = result
+
+        return results
+
+    def transliterate_mixed_all(self, text: str, target_scripts: List[str],
+                                runs: Optional[List[Tuple[str, int, int]]] = None) -> Dict[str, str]:
+        """Transliterate mixed-script text, dispatching each script run to its own converter
+
+        Text is segmented once into (script, span) runs (or `runs` from
+        detection.segment_runs is reused); neutral runs and runs already in
+        the target script are copied, so spacing and punctuation are preserved.
+        """
+        if runs is None:
+            runs = detection.segment_runs(text)
+        buffers: Dict[str, List[str]] = {target: [] for target in target_scripts}
+        for script, start, end in runs:
+            run = text[start:end]
+            if script in detection.INDIAN_SCRIPTS:
+                converted = self.cross_script_transliterate_all(run, Script(script), target_scripts)
+            elif script == "latin":
+                converted = {target: self.transliterate(run, target) for target in target_scripts}
+            else:
+                converted = dict.fromkeys(target_scripts, run)
+            for target in target_scripts:
+                buffers[target].append(converted[target])
+        return {target: "".join(pieces) for target, pieces in buffers.items()}
+
+    def transliterate_mixed(self, text: str, target_script: str) -> str:
+        """Transliterate mixed-script text to one target script"""
+        return self.transliterate_mixed_all(text, [target_script])[target_script]
+
+    def transliterate_batch(self, texts: List[str], source: Optional[str] = None,
+                            targets: Optional[List[str]] = None) -> BatchTransliterationResult:
+        """Transliterate many strings at once, converting each unique word once per target
+
+        With no source, each text's script is detected individually. Inputs
+        already in a target script are passed through unchanged, and the
+        whitespace between words is kept as it appears in each input.
+        """
+        start_time = time.time()
+        if targets is None:
+            targets = [Script.DEVANAGARI, Script.TAMIL, Script.MALAYALAM, Script.GURMUKHI]
+
+        sources = [source or self.detect_script(text) for text in texts]
+
+        # Intern every (source, word) pair so repeated words share one conversion (case kept:
+        # letters the tables leave unmapped are copied as written)
+        token_ids: Dict[Tuple[str, str], int] = {}
+        unique_tokens: List[Tuple[str, str]] = []
+        # Per text: token ids for words, the original whitespace runs between them
+        encoded: List[List[Union[int, str]]] = []
+        total_tokens = 0
+        for text, text_source in zip(texts, sources):
+            pieces: List[Union[int, str]] = []
+            for piece in _WHITESPACE.split(text):
+                if not piece or piece.isspace():
+                    if piece:
+                        pieces.append(piece)
+                    continue
+                key = (text_source, piece)
+                token_id = token_ids.get(key)
+                if token_id is None:
+                    token_id = token_ids[key] = len(unique_tokens)
+                    unique_tokens.append(key)
+                pieces.append(token_id)
+                total_tokens += 1
+            encoded.append(pieces)
+
+        converted: Dict[str, List[str]] = {target: [] for target in targets}
+        for token_source, word in unique_tokens:
+            for target, result in self._convert_token(word, token_source, targets).items():
+                converted[target].append(result)
+
+        columns = {}
+        for target in targets:
+            column = converted[target]
+            columns[target] = [
+                text if text_source == target else "".join(
+                    [piece if isinstance(piece, str) else column[piece] for piece in pieces]
+                )
+                for text, text_source, pieces in zip(texts, sources, encoded)
+            ]
+
+        return BatchTransliterationResult(
+            texts=list(texts),
+            columns=columns,
+            sources=sources,
+            unique_tokens=len(unique_tokens),
+            total_tokens=total_tokens,
+            duration=int((time.time() - start_time) * 1000)
+        )
+
+    def _convert_token(self, word: str, source: str, targets: List[str]) -> Dict[str, str]:
+        """Convert a single whitespace-free token from source to every target script"""
+        if source in detection.INDIAN_SCRIPTS:
+            return self.cross_script_transliterate_all(word, source, targets)
+        return {target: self.transliterate(word, target) for target in targets}
+
+    def phonetic_approximation(self, text: str, source: str, target: str) -> str:
+        """Basic phonetic approximation for cross-script transliteration"""
+        table = self.phonetic_tables.get(target)
+        if table is None:
+            return text
+        return table.convert(text)
+
+
+class ReverseTransliterationEngine:
+    """Reverse transliteration engine (matching React app)"""
+
+    def __init__(self):
+        # Mapping tables are shared read-only registry entries (read_bharat.tables)
+        self.devanagari_to_english_map = tables.DEVANAGARI_TO_ENGLISH
+        self.tamil_to_english_map = tables.TAMIL_TO_ENGLISH
+        self.malayalam_to_english_map = tables.MALAYALAM_TO_ENGLISH
+        self.gurmukhi_to_english_map = tables.GURMUKHI_TO_ENGLISH
+
+        # Single-codepoint tables compile to str.translate, the rest to tries
+        self.devanagari_to_english_trie = tables.compiled(self.devanagari_to_english_map)
+        self.tamil_to_english_trie = tables.compiled(self.tamil_to_english_map)
+        self.malayalam_to_english_trie = tables.compiled(self.malayalam_to_english_map)
+        self.gurmukhi_to_english_trie = tables.compiled(self.gurmukhi_to_english_map)
+
+    def devanagari_to_english(self, text: str) -> str:
+        """Convert Devanagari to English phonetics"""
+        return self.devanagari_to_english_trie.convert(text).strip()
+
+    def tamil_to_english(self, text: str) -> str:
+        """Convert Tamil to English phonetics"""
+        return self.tamil_to_english_trie.convert(text).strip()
+
+    def malayalam_to_english(self, text: str) -> str:
+        """Convert Malayalam to English phonetics"""
+        return self.malayalam_to_english_trie.convert(text).strip()
+
+    def gurmukhi_to_english(self, text: str) -> str:
+        """Convert Gurmukhi to English phonetics"""
+        return self.gurmukhi_to_english_trie.convert(text).strip()
+
+
+class TouristTranslationEngine:
+    """Tourist translation engine (matching React app)"""
+
+    def __init__(self):
+        self.phrases = tables.TOURIST_PHRASES
+
+    def get_all_translations(self, phrase: str) -> Dict[str, str]:
+        """Get all translations for a phrase"""
+        for category, phrases in self.phrases.items():
+            if phrase in phrases:
+                return phrases[phrase]
+        return {}
+
+    def get_suggestions(self, query: str) -> List[str]:
+        """Get phrase suggestions based on query"""
+        query_lower = query.lower()
+        suggestions = []
+
+        for category, phrases in self.phrases.items():
+            for phrase in phrases.keys():
+                if query_lower in phrase.lower():
+                    suggestions.append(phrase)
+
+        return suggestions[:5]  # Limit to 5 suggestions
+
+    def is_translatable(self, phrase: str) -> bool:
+        """Check if a phrase is translatable"""
+        for category, phrases in self.phrases.items():
+            if phrase in phrases:
+                return True
+        return False
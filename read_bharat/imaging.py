@@ -0,0 +1,165 @@
+"""
+Reduced-resolution, copy-free image preparation for OCR
+
+Sign photos arrive at 12MP and more, while the text on them is read just as
+well at a few dozen pixels of line height. Images are decoded once, straight
+to grayscale and (for JPEG) at a reduced DCT scale via PIL's draft(), then
+downscaled so text lines are about TARGET_TEXT_HEIGHT pixels tall. Denoising,
+contrast and thresholding then run in place on that single uint8 buffer, and
+detection and recognition both read the same array.
+"""
+
+import io
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Longest side decoded from the file; larger images are reduced while decoding
+MAX_SIDE = 2048
+
+# Longest side kept when the image will be read in tiles (see read_bharat.tiling)
+TILED_MAX_SIDE = 8192
+
+# Only panoramas and banners (long side at least this many times the short
+# side) are kept at TILED_MAX_SIDE; at MAX_SIDE their text would be too small
+PANORAMA_ASPECT = 3.0
+
+# Line height text is scaled down to (never up); the detector and the
+# recognizers work at this scale without losing small print
+TARGET_TEXT_HEIGHT = 40
+
+# Stride of the sparse view used to estimate the line height
+_ESTIMATE_STRIDE = 4
+
+# A row belongs to a text line when at least this share of it is ink
+_TEXT_ROW_INK = 0.02
+
+ImageSource = Union["Image.Image", np.ndarray, bytes, str, BinaryIO]
+
+
+@dataclass
+class PreparedImage:
+    pixels: np.ndarray  # 2-D uint8, C-contiguous, processed in place
+    scale: float  # pixels per pixel of the original image
+
+    def to_original(self, value: float) -> int:
+        """Map a coordinate in pixels back to the original image"""
+        return int(round(value / self.scale))
+
+
+def needs_tiling(width: int, height: int) -> bool:
+    """True for images whose text would be too small at MAX_SIDE: large panoramas and banners"""
+    long_side, short_side = max(width, height), max(1, min(width, height))
+    return long_side > MAX_SIDE and long_side >= PANORAMA_ASPECT * short_side
+
+
+def decode(source: ImageSource, max_side: int = MAX_SIDE, tiled_max_side: Optional[int] = None) -> PreparedImage:
+    """Grayscale uint8 array of an image, decoded once at reduced size
+
+    With tiled_max_side, images that need_tiling() (judged from the header
+    size, before any pixels are decoded) are kept at up to that size instead.
+    """
+    if isinstance(source, np.ndarray):
+        if tiled_max_side and needs_tiling(source.shape[1], source.shape[0]):
+            max_side = tiled_max_side
+        return _from_array(source, max_side)
+
+    from PIL import Image
+
+    if isinstance(source, Image.Image):
+        image = source
+    else:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        elif hasattr(source, "seek"):
+            source.seek(0)
+        image = Image.open(source)
+
+    original_width = image.width
+    if tiled_max_side and needs_tiling(image.width, image.height):
+        max_side = tiled_max_side
+    # JPEG decodes straight to grayscale at 1/2, 1/4 or 1/8 scale; no effect once loaded
+    image.draft("L", (max_side, max_side))
+    if image.mode != "L":
+        image = image.convert("L")
+    if max(image.size) > max_side:
+        ratio = max_side / max(image.size)
+        size = (max(1, round(image.width * ratio)), max(1, round(image.height * ratio)))
+        image = image.resize(size, Image.Resampling.BOX, reducing_gap=2.0)
+
+    pixels = np.array(image, dtype=np.uint8)
+    return PreparedImage(pixels, image.width / original_width)
+
+
+def _from_array(array: np.ndarray, max_side: int) -> PreparedImage:
+    if array.ndim == 3:
+        import cv2
+
+        code = cv2.COLOR_RGBA2GRAY if array.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+        pixels = cv2.cvtColor(array, code)
+    else:
+        # The caller's array is never modified
+        pixels = np.array(array, dtype=np.uint8, order="C")
+    if max(pixels.shape) > max_side:
+        return resize(PreparedImage(pixels, 1.0), max_side / max(pixels.shape))
+    return PreparedImage(pixels, 1.0)
+
+
+def resize(prepared: PreparedImage, factor: float) -> PreparedImage:
+    """Downscale by factor (< 1) with area averaging"""
+    import cv2
+
+    height, width = prepared.pixels.shape
+    size = (max(1, round(width * factor)), max(1, round(height * factor)))
+    pixels = cv2.resize(prepared.pixels, size, interpolation=cv2.INTER_AREA)
+    return PreparedImage(pixels, prepared.scale * size[0] / width)
+
+
+def estimate_text_height(pixels: np.ndarray) -> Optional[float]:
+    """Median text line height in pixels from the row ink profile of a sparse view; None if unclear"""
+    view = pixels[::_ESTIMATE_STRIDE, ::_ESTIMATE_STRIDE]
+    if view.shape[0] < 4:
+        return None
+    dark = view < view.mean()
+    ink = dark if dark.mean() <= 0.5 else ~dark
+    text_rows = ink.mean(axis=1) >= _TEXT_ROW_INK
+    edges = np.diff(np.concatenate(([0], text_rows.view(np.int8), [0])))
+    heights = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+    heights = heights[heights >= 2]
+    if not len(heights):
+        return None
+    height = float(np.median(heights)) * _ESTIMATE_STRIDE
+    # A "line" spanning most of the image is background, not text
+    if height > 0.8 * pixels.shape[0]:
+        return None
+    return height
+
+
+def fit_text_height(prepared: PreparedImage, target: int = TARGET_TEXT_HEIGHT) -> PreparedImage:
+    """Downscale so text lines are about target pixels tall; never upscales"""
+    height = estimate_text_height(prepared.pixels)
+    if height is None or height <= target * 1.25:
+        return prepared
+    return resize(prepared, target / height)
+
+
+def enhance(pixels: np.ndarray) -> np.ndarray:
+    """Median denoise, contrast stretch and Otsu threshold, in place on pixels"""
+    import cv2
+
+    cv2.medianBlur(pixels, 3, dst=pixels)
+    cv2.convertScaleAbs(pixels, dst=pixels, alpha=1.2, beta=10)
+    cv2.threshold(pixels, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=pixels)
+    return pixels
+
+
+def prepare(source: ImageSource, max_side: int = MAX_SIDE, target_text_height: int = TARGET_TEXT_HEIGHT,
+            tiled_max_side: Optional[int] = None) -> PreparedImage:
+    """Decode, scale to the target text height and enhance, all on one buffer"""
+    prepared = fit_text_height(decode(source, max_side, tiled_max_side), target_text_height)
+    enhance(prepared.pixels)
+    return prepared
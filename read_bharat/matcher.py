@@ -0,0 +1,98 @@
+"""
+Longest-match trie compiled from a transliteration mapping table
+"""
+
+from typing import Dict, Mapping, Optional, Tuple
+
+# Terminal marker inside a trie node; never collides with a text character
+_VALUE = None
+
+
+class MappingTrie:
+    """Compiles a mapping dict once and converts text in a single left-to-right pass
+
+    Tables whose keys are all single codepoints are also compiled into a
+    str.maketrans table, so convert() runs entirely inside str.translate.
+    """
+
+    def __init__(self, mapping: Mapping[str, str]):
+        self._root: dict = {}
+        self.max_key_length = 0
+        # Whole keys too, so exact lookups are one hash probe instead of a walk
+        self._keys: Dict[str, str] = {key: value for key, value in mapping.items() if key}
+        for key, value in self._keys.items():
+            self._insert(key, value)
+
+        self.translation: Optional[Dict[int, str]] = None
+        if self.max_key_length == 1:
+            self.translation = str.maketrans(self._keys)
+
+    def _insert(self, key: str, value: str):
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_VALUE] = value
+        self.max_key_length = max(self.max_key_length, len(key))
+
+    def get(self, key: str) -> Optional[str]:
+        """Value of an exact key, or None"""
+        return self._keys.get(key)
+
+    def match(self, text: str, start: int = 0) -> Optional[Tuple[int, str]]:
+        """Return (end, value) of the longest key starting at `start`, or None"""
+        node = self._root
+        best = None
+        i = start
+        n = len(text)
+        while i < n:
+            node = node.get(text[i])
+            if node is None:
+                break
+            i += 1
+            value = node.get(_VALUE)
+            if value is not None:
+                best = (i, value)
+        return best
+
+    def convert(self, text: str, original: Optional[str] = None) -> str:
+        """Replace every longest match; unmapped characters are copied through
+
+        With original (same length as text, e.g. text before lowercasing),
+        keys are matched in text but unmapped characters come from original.
+        """
+        if original is None:
+            original = text
+        elif len(original) != len(text):
+            raise ValueError("original must be as long as text")
+        if self.translation is not None:
+            if original is text:
+                return text.translate(self.translation)
+            translation = self.translation
+            return "".join(translation.get(ord(k), o) for k, o in zip(text, original))
+
+        root = self._root
+        out = []
+        append = out.append
+        i = 0
+        n = len(text)
+        while i < n:
+            node = root
+            j = i
+            end = 0
+            value = None
+            while j < n:
+                node = node.get(text[j])
+                if node is None:
+                    break
+                j += 1
+                found = node.get(_VALUE)
+                if found is not None:
+                    end = j
+                    value = found
+            if value is None:
+                append(original[i])
+                i += 1
+            else:
+                append(value)
+                i = end
+        return "".join(out)
@@ -0,0 +1,465 @@
+"""
+Image processing and OCR engine for Indian scripts
+
+The OCR stack (easyocr and torch, OpenCV, pytesseract, numpy, PIL) is
+imported the first time an ImageProcessingEngine actually needs it, so the
+text-only path never pays for it. EasyOCR readers come from the process-wide
+pool in read_bharat.readers, so engines are cheap to create per request.
+Text is detected once per image by the pool's shared detector, and the boxes
+are handed to the recognizer of each script that needs to read them. Images
+larger than imaging.MAX_SIDE are read as overlapping tiles in parallel.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import detection
+from .readers import DETECTOR, READER_LANGUAGES, ReaderPool, shared_reader_pool
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .imaging import ImageSource, PreparedImage
+    from .tesseract import TesseractPool
+
+# In auto mode, regions the multi-script reader read below this confidence
+# are read again with the reader of the detected script
+RECHECK_CONFIDENCE = 0.5
+
+# Cascade: Tesseract words at or above this confidence are accepted, the
+# rest are read again by EasyOCR
+TESSERACT_ACCEPT_CONFIDENCE = 0.8
+
+
+@dataclass
+class OCRResult:
+    text: str
+    confidence: float
+    bounding_boxes: List[Tuple[int, int, int, int]]
+    script_detected: str
+    processing_time: int
+
+
+@dataclass
+class CascadeStats:
+    images: int = 0
+    regions: int = 0
+    escalated: int = 0
+    full_fallbacks: int = 0  # images where Tesseract found no text and EasyOCR read everything
+    tesseract_ms: float = 0.0
+    easyocr_ms: float = 0.0
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalated / self.regions if self.regions else 0.0
+
+
+class CascadeCounters:
+    """Thread-safe totals of the Tesseract → EasyOCR cascade"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = CascadeStats()
+
+    def record(self, stats: CascadeStats):
+        with self._lock:
+            total = self._stats
+            total.images += stats.images
+            total.regions += stats.regions
+            total.escalated += stats.escalated
+            total.full_fallbacks += stats.full_fallbacks
+            total.tesseract_ms += stats.tesseract_ms
+            total.easyocr_ms += stats.easyocr_ms
+
+    def snapshot(self) -> CascadeStats:
+        with self._lock:
+            return CascadeStats(**vars(self._stats))
+
+    def reset(self):
+        with self._lock:
+            self._stats = CascadeStats()
+
+
+# Process-wide cascade counters shared by every session
+cascade_counters = CascadeCounters()
+
+
+class TextRegions(NamedTuple):
+    """Boxes from the shared detector, in the form EasyOCR's recognize() takes"""
+    horizontal: list
+    free: list
+
+    def __bool__(self) -> bool:
+        return bool(self.horizontal or self.free)
+
+    def __len__(self) -> int:
+        return len(self.horizontal) + len(self.free)
+
+    def subset(self, indexes: List[int]) -> "TextRegions":
+        """Regions at the given positions of recognize() output (horizontal boxes come first)"""
+        split = len(self.horizontal)
+        return TextRegions(
+            [self.horizontal[i] for i in indexes if i < split],
+            [self.free[i - split] for i in indexes if i >= split],
+        )
+
+
+class ImageProcessingEngine:
+    """Advanced image processing and OCR engine for Indian scripts"""
+
+    # Tesseract availability is reported once per process
+    _tesseract_configured = False
+
+    def __init__(self, pool: Optional[ReaderPool] = None, recheck_confidence: float = RECHECK_CONFIDENCE,
+                 tiling: bool = True, tile_workers: Optional[int] = None,
+                 tesseract: Optional["TesseractPool"] = None, cascade: bool = True):
+        # Readers are built on first request and shared by every engine using the pool
+        self.pool = pool if pool is not None else shared_reader_pool
+        self._tesseract = tesseract
+        # Read with Tesseract first and escalate only uncertain regions to EasyOCR
+        self.cascade = cascade
+        self.last_cascade: Optional[CascadeStats] = None
+        self.recheck_confidence = recheck_confidence
+        # Keep panoramas (imaging.needs_tiling) at up to imaging.TILED_MAX_SIDE and read them in tiles
+        self.tiling = tiling
+        self.tile_workers = tile_workers
+
+    def reader(self, key: str) -> Optional[Any]:
+        """EasyOCR reader for a script, falling back to the multi-script reader"""
+        self._configure_tesseract()
+        reader = self.pool.get(key) if key in READER_LANGUAGES else None
+        return reader if reader is not None else self.pool.get("multi")
+
+    @property
+    def tesseract(self) -> "TesseractPool":
+        """Persistent Tesseract workers (process-wide unless one was given)"""
+        if self._tesseract is None:
+            from .tesseract import shared_tesseract_pool
+
+            self._tesseract = shared_tesseract_pool
+        return self._tesseract
+
+    def _configure_tesseract(self):
+        """Configure Tesseract OCR for Indian scripts"""
+        if ImageProcessingEngine._tesseract_configured:
+            return
+        ImageProcessingEngine._tesseract_configured = True
+        try:
+            backend = self.tesseract.backend
+            if backend:
+                print(f"✅ Tesseract OCR configured ({backend})")
+            else:
+                print("⚠️ Tesseract not found, using EasyOCR only")
+        except Exception as e:
+            print(f"⚠️ Tesseract configuration failed: {str(e)}")
+
+    def _find_tesseract_path(self) -> Optional[str]:
+        """Find Tesseract executable path"""
+        from .tesseract import find_tesseract
+
+        return find_tesseract()
+
+    def preprocess_image(self, image: "ImageSource") -> "PreparedImage":
+        """Decode once at reduced size and enhance in place for better OCR results
+
+        The returned pixels are what detection and recognition both
+        read; its scale maps boxes back to the original.
+        """
+        from . import imaging
+
+        return imaging.prepare(image, tiled_max_side=imaging.TILED_MAX_SIDE if self.tiling else None)
+
+    def detect_regions(self, img_array: "np.ndarray") -> TextRegions:
+        """Find text boxes once with the shared detector; every recognizer reads the same boxes"""
+        detector = self.pool.get(DETECTOR)
+        if detector is None:
+            raise Exception("No text detector available")
+        horizontal_list, free_list = detector.detect(img_array)
+        # detect() returns one list per image
+        return TextRegions(horizontal_list[0], free_list[0])
+
+    def recognize(self, img_array: "np.ndarray", regions: TextRegions, script: str, detail: int = 1) -> list:
+        """Recognize the detected regions with the reader for a script"""
+        if not regions:
+            return []
+        reader = self.reader(script)
+        if not reader:
+            raise Exception("No OCR reader available")
+        return reader.recognize(img_array, regions.horizontal, regions.free, detail=detail)
+
+    @staticmethod
+    def _script_of(texts: List[str]) -> str:
+        """Dominant Indian script of recognized texts"""
+        if texts:
+            detected_text = ' '.join(texts)
+
+            # Analyze detected text to determine script
+            counts = detection.count_scripts(detected_text)
+            detected_script = detection.dominant_script(counts, include_latin=False)
+            if detected_script:
+                return detected_script
+
+        return 'unknown'
+
+    def detect_script_from_regions(self, img_array: "np.ndarray", regions: TextRegions) -> str:
+        """Detect the script of already detected regions with the multi-script recognizer"""
+        try:
+            return self._script_of(self.recognize(img_array, regions, 'multi', detail=0))
+        except Exception as e:
+            print(f"⚠️ Script detection failed: {str(e)}")
+            return 'unknown'
+
+    def _recognize_auto(self, img_array: "np.ndarray", regions: TextRegions) -> Tuple[list, str]:
+        """Single pass for auto mode: keep confident multi-script results, re-read only the rest
+
+        Returns the recognize() results and the detected script.
+        """
+        results = self.recognize(img_array, regions, 'multi')
+        script = self._script_of([text for _, text, _ in results])
+        if script not in READER_LANGUAGES or len(results) != len(regions):
+            return results, script
+
+        uncertain = [i for i, (_, _, confidence) in enumerate(results) if confidence < self.recheck_confidence]
+        if not uncertain:
+            return results, script
+
+        rechecked = self.recognize(img_array, regions.subset(uncertain), script)
+        if len(rechecked) != len(uncertain):
+            return results, script
+        results = list(results)
+        for index, result in zip(uncertain, rechecked):
+            results[index] = result
+        print(f"🔁 Re-read {len(uncertain)}/{len(results)} low-confidence regions with the {script} reader")
+        return results, script
+
+    def detect_script_from_image(self, image: "ImageSource") -> str:
+        """Detect the script in the image"""
+        from . import imaging
+
+        try:
+            img_array = imaging.decode(image).pixels
+            return self.detect_script_from_regions(img_array, self.detect_regions(img_array))
+        except Exception as e:
+            print(f"⚠️ Script detection failed: {str(e)}")
+            return 'unknown'
+
+    def _read(self, img_array: "np.ndarray", target_script: str) -> Tuple[list, str]:
+        """Detect and recognize one image or tile; returns the recognize() results and the script"""
+        # Detect text once; script detection and recognition share the boxes
+        regions = self.detect_regions(img_array)
+
+        # Perform OCR (detail=1 gives bounding boxes)
+        if target_script == 'auto':
+            return self._recognize_auto(img_array, regions)
+        return self.recognize(img_array, regions, target_script), target_script
+
+    def _read_tiled(self, img_array: "np.ndarray", target_script: str) -> Tuple[list, str]:
+        """Read overlapping tiles in parallel and merge their boxes into one reading order"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        import numpy as np
+
+        from . import tiling
+
+        height, width = img_array.shape[:2]
+        tiles = tiling.tile_grid(height, width)
+        workers = self.tile_workers or min(len(tiles), os.cpu_count() or 1)
+
+        def read_tile(tile):
+            y0, y1, x0, x1 = tile
+            # Tiles are views into the prepared buffer, not copies
+            return self._read(img_array[y0:y1, x0:x1], target_script)
+
+        with ThreadPoolExecutor(workers) as executor:
+            tile_results = list(executor.map(read_tile, tiles))
+
+        results, boxes, origins = [], [], []
+        script_counts = {}
+        for tile, (tile_result, script) in zip(tiles, tile_results):
+            y0, _, x0, _ = tile
+            script_counts[script] = script_counts.get(script, 0) + len(tile_result)
+            for bbox, text, confidence in tile_result:
+                points = [[x + x0, y + y0] for x, y in bbox]
+                xs = [x for x, _ in points]
+                ys = [y for _, y in points]
+                results.append((points, text, confidence))
+                boxes.append((min(xs), min(ys), max(xs), max(ys)))
+                origins.append(tile)
+
+        script = max(script_counts, key=script_counts.get) if target_script == 'auto' else target_script
+        if not results:
+            return [], script
+
+        boxes = np.array(boxes, dtype=np.float64)
+        confidences = np.array([confidence for _, _, confidence in results])
+        # Words cut by a tile edge always lose to their whole copy from the neighbouring tile
+        whole = ~tiling.cut_flags(boxes, np.array(origins), height, width)
+
+        # A word wider than the overlap is cut in every tile: read the union of its pieces instead
+        pieces = tiling.cut_pieces(boxes, ~whole)
+        if pieces:
+            unions = TextRegions([[int(x0), int(x1), int(y0), int(y1)] for _, (x0, y0, x1, y1) in pieces], [])
+            reread = self.recognize(img_array, unions, script)
+            if len(reread) == len(pieces):
+                dropped = np.zeros(len(results), dtype=bool)
+                for members, _ in pieces:
+                    dropped[members] = True
+                results = [result for result, drop in zip(results, dropped) if not drop] + list(reread)
+                boxes = np.concatenate((boxes[~dropped], [union for _, union in pieces]))
+                confidences = np.concatenate((confidences[~dropped], [c for _, _, c in reread]))
+                whole = np.concatenate((whole[~dropped], np.ones(len(pieces), dtype=bool)))
+                print(f"🧩 Re-read {len(pieces)} cut word(s) whole from the full image")
+
+        keep = tiling.suppress_duplicates(boxes, confidences + whole)
+        keep = keep[tiling.reading_order(boxes[keep])]
+        print(f"🧩 Read {len(tiles)} tiles with {workers} workers, kept {len(keep)} of {len(results)} boxes")
+        return [results[i] for i in keep], script
+
+    def _read_easyocr(self, img_array: "np.ndarray", target_script: str) -> Tuple[list, str]:
+        """EasyOCR only; images too large for one pass are tiled"""
+        from . import imaging
+
+        if self.tiling and max(img_array.shape) > imaging.MAX_SIDE:
+            return self._read_tiled(img_array, target_script)
+        return self._read(img_array, target_script)
+
+    def _read_cascade(self, img_array: "np.ndarray", target_script: str) -> Tuple[list, str]:
+        """Tesseract first; regions below TESSERACT_ACCEPT_CONFIDENCE are re-read by EasyOCR
+
+        Escalated words keep their Tesseract boxes and go straight to the
+        EasyOCR recognizer, so the detection network is not run for them.
+        If Tesseract finds no text at all, the image is read by EasyOCR.
+        """
+        stats = CascadeStats(images=1)
+        stage_start = time.perf_counter()
+        try:
+            words = self.tesseract.read([img_array], target_script)[0]
+        except Exception as e:
+            print(f"⚠️ Tesseract failed, using EasyOCR only: {str(e)}")
+            words = []
+        stats.tesseract_ms = (time.perf_counter() - stage_start) * 1000
+
+        script = target_script
+        if script == 'auto':
+            script = self._script_of([text for _, text, _ in words])
+
+        stage_start = time.perf_counter()
+        if not words:
+            stats.full_fallbacks = 1
+            results, script = self._read_easyocr(img_array, target_script)
+        else:
+            results = list(words)
+            uncertain = [i for i, (_, _, confidence) in enumerate(words)
+                         if confidence < TESSERACT_ACCEPT_CONFIDENCE]
+            stats.regions = len(words)
+            if uncertain:
+                # Tesseract corners -> EasyOCR horizontal boxes (x_min, x_max, y_min, y_max)
+                boxes = [[words[i][0][0][0], words[i][0][2][0], words[i][0][0][1], words[i][0][2][1]]
+                         for i in uncertain]
+                reread = self.recognize(img_array, TextRegions(boxes, []), script if script != 'unknown' else 'multi')
+                if len(reread) == len(uncertain):
+                    for index, result in zip(uncertain, reread):
+                        results[index] = result
+                    stats.escalated = len(uncertain)
+        if stats.full_fallbacks or stats.escalated:
+            stats.easyocr_ms = (time.perf_counter() - stage_start) * 1000
+
+        self.last_cascade = stats
+        cascade_counters.record(stats)
+        print(f"🪜 Cascade: {stats.escalated}/{stats.regions} regions escalated, "
+              f"Tesseract {stats.tesseract_ms:.0f} ms, EasyOCR {stats.easyocr_ms:.0f} ms")
+        return results, script
+
+    @staticmethod
+    def _ocr_result(results: list, script: str, prepared: "PreparedImage", processing_time: int) -> OCRResult:
+        """OCRResult from (corner points, text, confidence) results on prepared pixels"""
+        # Extract text and confidence
+        extracted_text = ""
+        total_confidence = 0.0
+        bounding_boxes = []
+
+        for (bbox, text, confidence) in results:
+            extracted_text += text + " "
+            total_confidence += confidence
+            # Convert bbox to integer coordinates of the original image
+            bounding_boxes.append(tuple(prepared.to_original(v) for v in (bbox[0][0], bbox[0][1], bbox[2][0], bbox[2][1])))
+
+        extracted_text = extracted_text.strip()
+        avg_confidence = total_confidence / len(results) if results else 0.0
+
+        return OCRResult(
+            text=extracted_text,
+            confidence=avg_confidence,
+            bounding_boxes=bounding_boxes,
+            script_detected=script,
+            processing_time=processing_time
+        )
+
+    def extract_text_with_tesseract(self, images: Sequence["ImageSource"], target_script: str = 'auto') -> List[OCRResult]:
+        """Read a batch of images with the persistent Tesseract workers
+
+        With target_script='auto' the combined Indic model reads every image
+        and each result reports the script found in its text.
+        """
+        start_time = time.time()
+        prepared = [self.preprocess_image(image) for image in images]
+        pages = self.tesseract.read([p.pixels for p in prepared], target_script)
+        # Average time per image of the batch
+        processing_time = int((time.time() - start_time) * 1000 / max(1, len(images)))
+
+        results = []
+        for image, words in zip(prepared, pages):
+            script = target_script
+            if script == 'auto':
+                script = self._script_of([text for _, text, _ in words])
+            results.append(self._ocr_result(words, script, image, processing_time))
+        return results
+
+    def extract_text_from_image(self, image: "ImageSource", target_script: str = 'auto') -> OCRResult:
+        """Extract text from an image (PIL image, array, bytes, path or file) using OCR"""
+        start_time = time.time()
+
+        try:
+            # Preprocess image; every stage below reads this one buffer
+            prepared = self.preprocess_image(image)
+        except Exception as e:
+            print(f"❌ OCR processing failed: {str(e)}")
+            return OCRResult(
+                text="",
+                confidence=0.0,
+                bounding_boxes=[],
+                script_detected="error",
+                processing_time=int((time.time() - start_time) * 1000)
+            )
+        return self.extract_text_from_prepared(prepared, target_script, start_time)
+
+    def extract_text_from_prepared(self, prepared: "PreparedImage", target_script: str = 'auto',
+                                   start_time: Optional[float] = None) -> OCRResult:
+        """Extract text from an image already prepared by preprocess_image (e.g. to key a cache first)"""
+        start_time = time.time() if start_time is None else start_time
+
+        try:
+            img_array = prepared.pixels
+
+            if self.cascade and self.tesseract.available:
+                results, target_script = self._read_cascade(img_array, target_script)
+            else:
+                results, target_script = self._read_easyocr(img_array, target_script)
+
+            processing_time = int((time.time() - start_time) * 1000)
+            return self._ocr_result(results, target_script, prepared, processing_time)
+
+        except Exception as e:
+            processing_time = int((time.time() - start_time) * 1000)
+            print(f"❌ OCR processing failed: {str(e)}")
+
+            return OCRResult(
+                text="",
+                confidence=0.0,
+                bounding_boxes=[],
+                script_detected="error",
+                processing_time=processing_time
+            )
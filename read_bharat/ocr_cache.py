@@ -0,0 +1,271 @@
+"""
+Process-wide cache of OCR results keyed by image content
+
+Repeat uploads of the same sign skip decoding and OCR entirely. Entries
+are found three ways, cheapest first:
+
+- a digest of the uploaded file bytes (no decoding at all);
+- a digest of the decoded, prepared pixels, so the same picture saved
+  again with different metadata or container still hits;
+- optionally (off by default) a 64-bit difference hash (dHash) of the
+  prepared pixels, matched within a small Hamming distance, for
+  near-duplicates such as a re-compressed copy. Signs with the same layout
+  land within that distance too, so every candidate is confirmed against a
+  64x64 thumbnail of the stored image before it is returned.
+
+Each entry holds the OCRResult and the transliterations made from it. The
+cache is bounded by entry count and estimated bytes (least recently used
+entries go first) and entries expire after a TTL. numpy is imported by the
+hashing functions, so importing the cache (e.g. in a text-only session)
+does not load it.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .ocr import OCRResult
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 24 * 60 * 60.0
+
+# Perceptual hashes within this many differing bits (of 64) are candidate
+# near-duplicates when near-duplicate matching is turned on
+NEAR_DUPLICATE_DISTANCE = 4
+
+# A candidate is the same image only if no cell of the thumbnails differs by more than this
+THUMBNAIL_SIZE = 64
+THUMBNAIL_TOLERANCE = 24
+
+# Rough fixed cost of an entry beyond its text (objects, keys, boxes)
+_ENTRY_OVERHEAD = 512
+_BOX_BYTES = 64
+
+
+def file_digest(data: bytes) -> str:
+    """Digest of the uploaded file bytes"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def content_digest(pixels: "np.ndarray") -> str:
+    """Digest of decoded pixels and their shape"""
+    import numpy as np
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(pixels.shape).encode("ascii"))
+    digest.update(np.ascontiguousarray(pixels).data)
+    return digest.hexdigest()
+
+
+def _block_means(pixels: "np.ndarray", rows: int, columns: int) -> "np.ndarray":
+    """rows x columns grid of block means, via cumulative sums without resizing the image"""
+    import numpy as np
+
+    height, width = pixels.shape[:2]
+    row_edges = np.linspace(0, height, rows + 1, dtype=np.intp)
+    column_edges = np.linspace(0, width, columns + 1, dtype=np.intp)
+    totals = np.pad(pixels.astype(np.float64).cumsum(0).cumsum(1), ((1, 0), (1, 0)))
+    r0, r1 = row_edges[:-1, None], row_edges[1:, None]
+    c0, c1 = column_edges[None, :-1], column_edges[None, 1:]
+    sums = totals[r1, c1] - totals[r0, c1] - totals[r1, c0] + totals[r0, c0]
+    areas = np.maximum((r1 - r0) * (c1 - c0), 1)
+    return sums / areas
+
+
+def perceptual_hash(pixels: "np.ndarray") -> int:
+    """64-bit difference hash: sign of horizontal gradients on a 9x8 block-mean thumbnail"""
+    import numpy as np
+
+    means = _block_means(pixels, 8, 9)
+    bits = (means[:, 1:] > means[:, :-1]).ravel()
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+def thumbnail(pixels: "np.ndarray") -> "np.ndarray":
+    """THUMBNAIL_SIZE square of block means, used to confirm near-duplicate candidates"""
+    import numpy as np
+
+    return _block_means(pixels, THUMBNAIL_SIZE, THUMBNAIL_SIZE).round().astype(np.uint8)
+
+
+@dataclass
+class CachedOCR:
+    ocr: OCRResult
+    transliterations: Dict[str, str]
+    created: float = field(default_factory=time.time)
+
+    @property
+    def size(self) -> int:
+        text = len(self.ocr.text.encode("utf-8"))
+        text += sum(len(value.encode("utf-8")) for value in self.transliterations.values())
+        return _ENTRY_OVERHEAD + text + _BOX_BYTES * len(self.ocr.bounding_boxes)
+
+
+@dataclass
+class OCRCacheStats:
+    hits: int
+    near_hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.near_hits + self.misses
+        return (self.hits + self.near_hits) / lookups if lookups else 0.0
+
+
+@dataclass
+class ImageKey:
+    content: str
+    phash: Optional[int] = None
+    thumbnail: Optional["np.ndarray"] = None
+
+
+class OCRCache:
+    """Thread-safe LRU of OCR results, bounded by entries and bytes, with a TTL"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS, hash_distance: Optional[int] = None):
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("max_entries and max_bytes must be >= 0")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # Near-duplicate matching (e.g. NEAR_DUPLICATE_DISTANCE); None, the default, keeps exact keys only
+        self.hash_distance = hash_distance
+        self._entries: "OrderedDict[str, CachedOCR]" = OrderedDict()
+        self._phashes: Dict[str, int] = {}
+        self._thumbnails: Dict[str, "np.ndarray"] = {}
+        self._files: Dict[str, str] = {}  # file digest -> content digest
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._near_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def key(self, pixels: "np.ndarray") -> ImageKey:
+        """Content digest (and perceptual hash and thumbnail, if enabled) of prepared pixels"""
+        if self.hash_distance is None:
+            return ImageKey(content_digest(pixels))
+        return ImageKey(content_digest(pixels), perceptual_hash(pixels), thumbnail(pixels))
+
+    def get_file(self, data: bytes) -> Optional[CachedOCR]:
+        """Entry for previously seen file bytes, without decoding them"""
+        with self._lock:
+            content = self._files.get(file_digest(data))
+            entry = self._live(content) if content is not None else None
+            if entry is not None:
+                self._hits += 1
+            return entry
+
+    def get(self, key: ImageKey) -> Optional[CachedOCR]:
+        """Entry for the same pixels, or for a confirmed near-duplicate when perceptual hashing is on"""
+        with self._lock:
+            entry = self._live(key.content)
+            if entry is not None:
+                self._hits += 1
+                return entry
+            if key.phash is not None and key.thumbnail is not None and self._phashes:
+                entry = self._near_duplicate(key)
+                if entry is not None:
+                    self._near_hits += 1
+                    return entry
+            self._misses += 1
+            return None
+
+    def _near_duplicate(self, key: ImageKey) -> Optional[CachedOCR]:
+        """Closest entry within hash_distance whose thumbnail matches (caller holds the lock)"""
+        import numpy as np
+
+        contents = list(self._phashes)
+        hashes = np.fromiter((self._phashes[c] for c in contents), dtype=np.uint64, count=len(contents))
+        distances = np.unpackbits((hashes ^ np.uint64(key.phash)).view(np.uint8).reshape(-1, 8), axis=1).sum(1)
+        for index in np.argsort(distances, kind="stable"):
+            if distances[index] > self.hash_distance:
+                break
+            content = contents[index]
+            stored = self._thumbnails[content]
+            if stored.shape != key.thumbnail.shape:
+                continue
+            difference = np.abs(stored.astype(np.int16) - key.thumbnail.astype(np.int16)).max()
+            if difference <= THUMBNAIL_TOLERANCE:
+                return self._live(content)
+        return None
+
+    def put(self, key: ImageKey, entry: CachedOCR, data: Optional[bytes] = None):
+        """Store an entry, remembering the file bytes it came from"""
+        if self.max_entries == 0:
+            return
+        size = entry.size + (key.thumbnail.nbytes if key.thumbnail is not None else 0)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._drop(key.content)
+            self._entries[key.content] = entry
+            self._bytes += size
+            if key.phash is not None and key.thumbnail is not None:
+                self._phashes[key.content] = key.phash
+                self._thumbnails[key.content] = key.thumbnail
+            if data is not None:
+                self._files[file_digest(data)] = key.content
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _live(self, content: str) -> Optional[CachedOCR]:
+        """Entry if present and not expired, marked recently used (caller holds the lock)"""
+        entry = self._entries.get(content)
+        if entry is None:
+            return None
+        if time.time() - entry.created > self.ttl_seconds:
+            self._drop(content)
+            self._evictions += 1
+            return None
+        self._entries.move_to_end(content)
+        return entry
+
+    def _drop(self, content: str):
+        entry = self._entries.pop(content, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        self._phashes.pop(content, None)
+        stored = self._thumbnails.pop(content, None)
+        if stored is not None:
+            self._bytes -= stored.nbytes
+        for digest in [d for d, c in self._files.items() if c == content]:
+            del self._files[digest]
+
+    def clear(self):
+        """Drop every entry; statistics are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._phashes.clear()
+            self._thumbnails.clear()
+            self._files.clear()
+            self._bytes = 0
+
+    def stats(self) -> OCRCacheStats:
+        with self._lock:
+            return OCRCacheStats(self._hits, self._near_hits, self._misses, self._evictions,
+                                 len(self._entries), self._bytes, self.max_entries, self.max_bytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache shared by every session
+shared_ocr_cache = OCRCache()
+
@@ -0,0 +1,220 @@
+"""
+Process-wide pool of EasyOCR readers
+
+A reader loads neural-network weights, so it is built only the first time
+its script is requested and then shared by every session in the process.
+Readers that sit idle are dropped, and the least recently used ones are
+evicted when a new reader would push the pool past its memory budget.
+
+Text detection (CRAFT) is the same network for every language, so the pool
+holds one detector-only reader under the DETECTOR key and builds the
+per-script readers with recognizers only.
+"""
+
+import gc
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Optional configuration for the Streamlit apps
+MEMORY_MB_ENV = "READ_BHARAT_OCR_MEMORY_MB"
+IDLE_SECONDS_ENV = "READ_BHARAT_OCR_IDLE_SECONDS"
+
+DEFAULT_MEMORY_BYTES = 1024 * 1024 * 1024
+DEFAULT_IDLE_SECONDS = 15 * 60.0
+
+# EasyOCR languages of each reader
+READER_LANGUAGES: Dict[str, Tuple[str, ...]] = {
+    "devanagari": ("hi", "en"),
+    "tamil": ("ta", "en"),
+    "malayalam": ("ml", "en"),
+    "gurmukhi": ("pa", "en"),
+    "multi": ("hi", "ta", "ml", "pa", "en"),
+}
+
+# Key of the shared, detection-only reader
+DETECTOR = "detector"
+_DETECTOR_LANGUAGES = ("en",)
+
+# Languages the multi-script reader falls back to when the combination cannot be loaded
+_FALLBACK_LANGUAGES = ("en",)
+
+# Size assumed for a reader whose weights cannot be inspected
+_UNKNOWN_READER_BYTES = 100 * 1024 * 1024
+
+
+def _build_easyocr_reader(languages: Tuple[str, ...], detector: bool, recognizer: bool):
+    import easyocr
+
+    return easyocr.Reader(list(languages), detector=detector, recognizer=recognizer)
+
+
+def reader_bytes(reader: Any) -> int:
+    """Bytes held by a reader's detector and recognizer weights"""
+    total = 0
+    for name in ("detector", "recognizer"):
+        network = getattr(reader, name, None)
+        parameters = getattr(network, "parameters", None)
+        if parameters is None:
+            continue
+        total += sum(p.numel() * p.element_size() for p in parameters())
+    return total or _UNKNOWN_READER_BYTES
+
+
+@dataclass
+class ReaderPoolStats:
+    hits: int
+    builds: int
+    evictions: int
+    readers: List[str]
+    bytes: int
+    max_bytes: int
+
+
+@dataclass
+class _Entry:
+    reader: Any
+    languages: Tuple[str, ...]
+    bytes: int
+    last_used: float
+
+
+class ReaderPool:
+    """Thread-safe, lazily built OCR readers with idle and memory-budget eviction"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BYTES, idle_seconds: float = DEFAULT_IDLE_SECONDS,
+                 factory: Callable[[Tuple[str, ...], bool, bool], Any] = _build_easyocr_reader):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds
+        self._factory = factory
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        # One lock per reader key, so two sessions never load the same weights twice
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._hits = 0
+        self._builds = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "ReaderPool":
+        """Pool configured from READ_BHARAT_OCR_MEMORY_MB and READ_BHARAT_OCR_IDLE_SECONDS"""
+        memory_mb = os.environ.get(MEMORY_MB_ENV)
+        idle_seconds = os.environ.get(IDLE_SECONDS_ENV)
+        return cls(
+            max_bytes=int(float(memory_mb) * 1024 * 1024) if memory_mb else DEFAULT_MEMORY_BYTES,
+            idle_seconds=float(idle_seconds) if idle_seconds else DEFAULT_IDLE_SECONDS,
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Reader for a script key (see READER_LANGUAGES) or DETECTOR, built on first request
+
+        Script readers only recognize; run detection with the DETECTOR reader.
+        Returns None if the reader cannot be built.
+        """
+        if key != DETECTOR and key not in READER_LANGUAGES:
+            raise KeyError(f"no OCR reader for {key!r}")
+        self.evict_idle()
+
+        entry = self._touch(key)
+        if entry is not None:
+            return entry.reader
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            # Another session may have finished building it while we waited
+            entry = self._touch(key)
+            if entry is not None:
+                return entry.reader
+            entry = self._build(key)
+            if entry is None:
+                return None
+            with self._lock:
+                self._make_room(entry.bytes)
+                self._entries[key] = entry
+                self._builds += 1
+            return entry.reader
+
+    def _touch(self, key: str) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_used = time.monotonic()
+                self._hits += 1
+            return entry
+
+    def _build(self, key: str) -> Optional[_Entry]:
+        detector = key == DETECTOR
+        languages = _DETECTOR_LANGUAGES if detector else READER_LANGUAGES[key]
+        start_time = time.time()
+        try:
+            reader = self._factory(languages, detector, not detector)
+        except Exception as e:
+            if key != "multi":
+                print(f"⚠️ OCR reader for {key} failed to load: {str(e)}")
+                return None
+            # Fallback to a basic reader
+            print(f"⚠️ OCR initialization warning: {str(e)}")
+            languages = _FALLBACK_LANGUAGES
+            try:
+                reader = self._factory(languages, False, True)
+            except Exception:
+                print("❌ Failed to initialize OCR engines")
+                return None
+        size = reader_bytes(reader)
+        print(f"✅ OCR reader for {key} loaded in {time.time() - start_time:.1f}s ({size / 1024 / 1024:.0f} MB)")
+        return _Entry(reader, languages, size, time.monotonic())
+
+    def _make_room(self, size: int):
+        """Evict least recently used readers until size more bytes fit (caller holds the lock)"""
+        evicted = False
+        while self._entries and sum(e.bytes for e in self._entries.values()) + size > self.max_bytes:
+            key = min(self._entries, key=lambda k: self._entries[k].last_used)
+            del self._entries[key]
+            self._evictions += 1
+            evicted = True
+        if evicted:
+            gc.collect()
+
+    def evict_idle(self) -> int:
+        """Drop readers unused for idle_seconds; returns how many were evicted"""
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            idle = [key for key, entry in self._entries.items() if entry.last_used < cutoff]
+            for key in idle:
+                del self._entries[key]
+            self._evictions += len(idle)
+        if idle:
+            gc.collect()
+        return len(idle)
+
+    def clear(self):
+        """Drop every reader; statistics are kept"""
+        with self._lock:
+            self._entries.clear()
+        gc.collect()
+
+    def stats(self) -> ReaderPoolStats:
+        with self._lock:
+            return ReaderPoolStats(
+                hits=self._hits,
+                builds=self._builds,
+                evictions=self._evictions,
+                readers=sorted(self._entries),
+                bytes=sum(e.bytes for e in self._entries.values()),
+                max_bytes=self.max_bytes,
+            )
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide pool shared by every ImageProcessingEngine that is not given its own
+shared_reader_pool = ReaderPool.from_env()
@@ -0,0 +1,106 @@
+"""
+Static routing plan for transliteration requests
+
+Every (source, target, quality mode) combination is resolved to one route
+when the app starts, so a request goes straight to the converter that serves
+it instead of trying a path and falling back when it returns nothing.
+Per-route counters show how often each path is taken.
+"""
+
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Iterable, Tuple
+
+from .detection import INDIAN_SCRIPTS
+
+QUALITY_MODES = ("fast", "balanced", "high")
+
+# Sources a request can arrive with (detect_script also yields latin and unknown)
+SOURCES = INDIAN_SCRIPTS + ("latin", "unknown")
+
+# Quality modes allowed to wait on the remote API
+API_QUALITY_MODES = ("balanced", "high")
+
+
+class Route(str, Enum):
+    SAME_SCRIPT = "same_script"
+    ENGLISH_TO_DEVANAGARI = "english_to_devanagari"
+    ENGLISH = "english"
+    API = "api"
+    CROSS_SCRIPT = "cross_script"
+    MIXED_SCRIPT = "mixed_script"  # chosen per request from the script runs, not planned
+
+
+RouteKey = Tuple[str, str, str]
+
+
+def _value(script) -> str:
+    return str(getattr(script, "value", script))
+
+
+def build_route_table(api_pairs: Iterable[Tuple[str, str]] = (),
+                      api_modes: Iterable[str] = API_QUALITY_MODES) -> Dict[RouteKey, Route]:
+    """Resolve the route of every (source, target, quality mode) once"""
+    api_pairs = {(_value(source), _value(target)) for source, target in api_pairs}
+    api_modes = set(api_modes)
+    table = {}
+    for source in SOURCES:
+        for target in INDIAN_SCRIPTS:
+            for mode in QUALITY_MODES:
+                if source == target:
+                    route = Route.SAME_SCRIPT
+                elif source == "latin" and target == "devanagari":
+                    route = Route.ENGLISH_TO_DEVANAGARI
+                elif (source, target) in api_pairs and mode in api_modes:
+                    route = Route.API
+                elif source == "latin":
+                    route = Route.ENGLISH
+                else:
+                    route = Route.CROSS_SCRIPT
+                table[(source, target, mode)] = route
+    return table
+
+
+def resolve(table: Dict[RouteKey, Route], source: str, target: str, quality_mode: str) -> Route:
+    """Look up the planned route; unplanned combinations take the local cross-script path"""
+    return table.get((_value(source), _value(target), quality_mode), Route.CROSS_SCRIPT)
+
+
+@dataclass
+class RouteStats:
+    calls: int = 0
+    failures: int = 0
+    total_ms: float = 0.0
+
+    @property
+    def average_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class RouteCounters:
+    """Thread-safe per-route call, failure and latency counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Route, RouteStats] = {}
+
+    def record(self, route: Route, duration_ms: float, failed: bool = False):
+        with self._lock:
+            stats = self._stats.setdefault(route, RouteStats())
+            stats.calls += 1
+            stats.total_ms += duration_ms
+            if failed:
+                stats.failures += 1
+
+    def snapshot(self) -> Dict[Route, RouteStats]:
+        with self._lock:
+            return {route: RouteStats(s.calls, s.failures, s.total_ms) for route, s in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide counters shared by every session
+route_counters = RouteCounters()
@@ -0,0 +1,43 @@
+"""
+Unicode block layout of the supported Indian scripts
+"""
+
+from enum import Enum
+from typing import Dict
+
+
+# Script Types (matching React app structure)
+class Script(str, Enum):
+    DEVANAGARI = "devanagari"
+    TAMIL = "tamil"
+    MALAYALAM = "malayalam"
+    GURMUKHI = "gurmukhi"
+
+# First codepoint of each script's 128-codepoint Unicode block
+SCRIPT_BLOCKS: Dict[str, int] = {
+    "devanagari": 0x0900,
+    "gurmukhi": 0x0A00,
+    "tamil": 0x0B80,
+    "malayalam": 0x0D00,
+}
+
+# Native digits zero..nine sit at the same offset in every block
+DIGIT_OFFSET = 0x66
+
+
+def native_digits(script: str) -> str:
+    """Return the ten native digits of a script, or ASCII digits for 'latin'"""
+    if script not in SCRIPT_BLOCKS:
+        return "0123456789"
+    base = SCRIPT_BLOCKS[script] + DIGIT_OFFSET
+    return "".join(chr(base + d) for d in range(10))
+
+
+def digit_mapping(target: str) -> Dict[str, str]:
+    """Map the native digits of every other script onto the target script's digits"""
+    target_digits = native_digits(target)
+    mapping = {}
+    for script in SCRIPT_BLOCKS:
+        if script != target:
+            mapping.update(zip(native_digits(script), target_digits))
+    return mapping
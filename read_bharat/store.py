@@ -0,0 +1,185 @@
+"""
+Persistent on-disk transliteration result store (SQLite, WAL mode)
+
+Results survive restarts and deploys and are shared by every worker process
+on the host. Rows are keyed by normalized text, source and target script and
+the mapping-table version, so editing the tables invalidates old results.
+Rows of other versions are never read; they age out through the LRU
+eviction, or can be dropped once a deploy is complete:
+
+    python -m read_bharat.store --prune [PATH]   # PATH defaults to $READ_BHARAT_RESULT_DB
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from typing import List, Optional
+
+from .tables import table_version
+
+# Optional configuration for the Streamlit apps
+DB_PATH_ENV = "READ_BHARAT_RESULT_DB"
+DB_MAX_MB_ENV = "READ_BHARAT_RESULT_DB_MAX_MB"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Re-stamp a row's access time at most this often (seconds), so hot reads stay read-only
+_TOUCH_INTERVAL = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    text     TEXT NOT NULL,
+    source   TEXT NOT NULL,
+    target   TEXT NOT NULL,
+    version  TEXT NOT NULL,
+    result   TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (text, source, target, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Cache-key form of an input: NFC, trimmed, whitespace collapsed"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _script_key(script) -> str:
+    return str(getattr(script, "value", script))
+
+
+class TransliterationStore:
+    """SQLite-backed result store, safe for concurrent readers across processes"""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, version: Optional[str] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version or table_version()
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._writes_since_evict = 0
+
+        conn = self._connection()
+        with conn:
+            # Rows of other table versions are kept: during a rolling deploy
+            # processes on the old tables still read and write their own rows
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> Optional["TransliterationStore"]:
+        """Open the store configured by READ_BHARAT_RESULT_DB, or None when unset"""
+        path = os.environ.get(DB_PATH_ENV)
+        if not path:
+            return None
+        max_mb = os.environ.get(DB_MAX_MB_ENV)
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        return cls(path, max_bytes=max_bytes)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def get(self, text: str, source: str, target: str) -> Optional[str]:
+        """Return the stored result, or None on a miss"""
+        key = (normalize_text(text), _script_key(source), _script_key(target), self.version)
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT result, accessed FROM results WHERE text = ? AND source = ? AND target = ? AND version = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        if now - row[1] > _TOUCH_INTERVAL:
+            try:
+                conn.execute(
+                    "UPDATE results SET accessed = ? WHERE text = ? AND source = ? AND target = ? AND version = ?",
+                    (now,) + key,
+                )
+            except sqlite3.OperationalError:
+                pass  # another process holds the write lock; the stamp can wait
+        return row[0]
+
+    def put(self, text: str, source: str, target: str, result: str):
+        """Store a result and evict the least recently used rows beyond max_bytes"""
+        normalized = normalize_text(text)
+        size = len(normalized.encode("utf-8")) + len(result.encode("utf-8")) + 64
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (text, source, target, version, result, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (normalized, _script_key(source), _script_key(target), self.version, result, size, time.time()),
+            )
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= 100:
+                self._writes_since_evict = 0
+                self.evict()
+
+    def evict(self):
+        """Delete least recently used rows until the stored payload fits max_bytes"""
+        conn = self._connection()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Trim to 90% so eviction does not run on every subsequent write
+        excess = total - int(self.max_bytes * 0.9)
+        with conn:
+            cutoff = conn.execute(
+                "SELECT accessed FROM (SELECT accessed, SUM(size) OVER (ORDER BY accessed) AS running "
+                "FROM results) WHERE running >= ? LIMIT 1",
+                (excess,),
+            ).fetchone()
+            if cutoff is not None:
+                conn.execute("DELETE FROM results WHERE accessed <= ?", (cutoff[0],))
+
+    def prune_versions(self) -> int:
+        """Delete rows written with other mapping tables; returns the number deleted"""
+        with self._write_lock:
+            conn = self._connection()
+            with conn:
+                return conn.execute("DELETE FROM results WHERE version != ?", (self.version,)).rowcount
+
+    def stats(self) -> dict:
+        conn = self._connection()
+        rows, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {"rows": rows, "bytes": size, "max_bytes": self.max_bytes, "version": self.version}
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Prune rows of old table versions once every process runs the current tables"""
+    args = sys.argv[1:] if argv is None else argv
+    paths = [arg for arg in args if not arg.startswith("--")]
+    path = paths[0] if paths else os.environ.get(DB_PATH_ENV)
+    if "--prune" not in args or not path:
+        print(f"Usage: python -m read_bharat.store --prune [PATH]  (PATH defaults to ${DB_PATH_ENV})")
+        return 2
+    store = TransliterationStore(path)
+    try:
+        deleted = store.prune_versions()
+    finally:
+        store.close()
+    print(f"✅ Pruned {deleted:,} rows of old table versions from {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Process-wide registry of the transliteration mapping tables
+
+Mapping tables are the read-only MappedTable views of the memory-mapped
+artifact (read_bharat.artifact), so import decodes nothing and its cost does
+not grow with the tables. The hot paths do not walk the mapped arrays, which
+needs a bisect per character: compiled() decodes a table into a dict
+MappingTrie the first time it is used, once per process. That trade-off gives
+up part of the artifact's RSS goal: a worker holds a private dict and trie
+for every table its engines use (pages of unused tables stay shared page cache).
+The remaining tables are built once at import and frozen with MappingProxyType.
+Engines only hold references; constructing one costs O(1) after the first.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Tuple
+
+from . import akshara, artifact
+from .artifact import MappedTable
+from .matcher import MappingTrie
+from .scripts import Script
+
+
+def _freeze(table: Any) -> Any:
+    """Recursively wrap dicts in read-only MappingProxyType views"""
+    if isinstance(table, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in table.items()})
+    return table
+
+
+# Mapping tables, compiled from read_bharat/data/*.tsv and memory-mapped read-only
+ARTIFACT = artifact.load()
+
+TAMIL_TO_DEVANAGARI = ARTIFACT["tamil_to_devanagari"]
+# Letters that route a Tamil word through the direct Devanagari table
+TAMIL_TO_DEVANAGARI_INITIALS = TAMIL_TO_DEVANAGARI.initials()
+
+ENGLISH_TO_DEVANAGARI = ARTIFACT["english_to_devanagari"]
+ENGLISH_TO_TAMIL = ARTIFACT["english_to_tamil"]
+ENGLISH_TO_MALAYALAM = ARTIFACT["english_to_malayalam"]
+ENGLISH_TO_GURMUKHI = ARTIFACT["english_to_gurmukhi"]
+
+# Basic Devanagari-to-script approximations used when cross-script conversion fails
+PHONETIC_APPROXIMATION = _freeze({
+    Script.TAMIL: ARTIFACT["devanagari_to_tamil_approx"],
+    Script.MALAYALAM: ARTIFACT["devanagari_to_malayalam_approx"],
+    Script.GURMUKHI: ARTIFACT["devanagari_to_gurmukhi_approx"],
+})
+
+# Native-script to English pronunciation (native digits read back as ASCII)
+DEVANAGARI_TO_ENGLISH = ARTIFACT["devanagari_to_english"]
+TAMIL_TO_ENGLISH = ARTIFACT["tamil_to_english"]
+MALAYALAM_TO_ENGLISH = ARTIFACT["malayalam_to_english"]
+GURMUKHI_TO_ENGLISH = ARTIFACT["gurmukhi_to_english"]
+
+# Tourist phrases by category
+TOURIST_PHRASES = _freeze({
+    "greetings": {
+        "Hello": {
+            Script.DEVANAGARI: "नमस्ते",
+            Script.TAMIL: "வணக்கம்",
+            Script.MALAYALAM: "നമസ്കാരം",
+            Script.GURMUKHI: "ਸਤ ਸ੍ਰੀ ਅਕਾਲ"
+        },
+        "Thank you": {
+            Script.DEVANAGARI: "धन्यवाद",
+            Script.TAMIL: "நன்றி",
+            Script.MALAYALAM: "നന്ദി",
+            Script.GURMUKHI: "ਧੰਨਵਾਦ"
+        },
+        "Please": {
+            Script.DEVANAGARI: "कृपया",
+            Script.TAMIL: "தயவுசெய்து",
+            Script.MALAYALAM: "ദയവായി",
+            Script.GURMUKHI: "ਕਿਰਪਾ ਕਰਕੇ"
+        },
+        "Excuse me": {
+            Script.DEVANAGARI: "माफ कीजिए",
+            Script.TAMIL: "மன்னிக்கவும்",
+            Script.MALAYALAM: "ക്ഷമിക്കണം",
+            Script.GURMUKHI: "ਮਾਫ ਕਰਨਾ"
+        }
+    },
+    "directions": {
+        "Where is...?": {
+            Script.DEVANAGARI: "कहाँ है...?",
+            Script.TAMIL: "எங்கே இருக்கிறது...?",
+            Script.MALAYALAM: "എവിടെയാണ്...?",
+            Script.GURMUKHI: "ਕਿੱਥੇ ਹੈ...?"
+        },
+        "Left": {
+            Script.DEVANAGARI: "बाएं",
+            Script.TAMIL: "இடது",
+            Script.MALAYALAM: "ഇടത്",
+            Script.GURMUKHI: "ਖੱਬੇ"
+        },
+        "Right": {
+            Script.DEVANAGARI: "दाएं",
+            Script.TAMIL: "வலது",
+            Script.MALAYALAM: "വലത്",
+            Script.GURMUKHI: "ਸੱਜੇ"
+        },
+        "Straight": {
+            Script.DEVANAGARI: "सीधे",
+            Script.TAMIL: "நேராக",
+            Script.MALAYALAM: "നേരെ",
+            Script.GURMUKHI: "ਸਿੱਧਾ"
+        }
+    },
+    "food": {
+        "Water": {
+            Script.DEVANAGARI: "पानी",
+            Script.TAMIL: "தண்ணீர்",
+            Script.MALAYALAM: "വെള്ളം",
+            Script.GURMUKHI: "ਪਾਣੀ"
+        },
+        "Food": {
+            Script.DEVANAGARI: "खाना",
+            Script.TAMIL: "உணவு",
+            Script.MALAYALAM: "ഭക്ഷണം",
+            Script.GURMUKHI: "ਖਾਣਾ"
+        },
+        "Restaurant": {
+            Script.DEVANAGARI: "रेस्तरां",
+            Script.TAMIL: "உணவகம்",
+            Script.MALAYALAM: "റെസ്റ്റോറന്റ്",
+            Script.GURMUKHI: "ਰੈਸਟੋਰੈਂਟ"
+        }
+    },
+    "emergency": {
+        "Help!": {
+            Script.DEVANAGARI: "मदद!",
+            Script.TAMIL: "உதவி!",
+            Script.MALAYALAM: "സഹായം!",
+            Script.GURMUKHI: "ਮਦਦ!"
+        },
+        "Call police": {
+            Script.DEVANAGARI: "पुलिस को बुलाओ",
+            Script.TAMIL: "காவல்துறையை அழைக்கவும்",
+            Script.MALAYALAM: "പോലീസിനെ വിളിക്കുക",
+            Script.GURMUKHI: "ਪੁਲਿਸ ਨੂੰ ਬੁਲਾਓ"
+        },
+        "Hospital": {
+            Script.DEVANAGARI: "अस्पताल",
+            Script.TAMIL: "மருத்துவமனை",
+            Script.MALAYALAM: "ആശുപത്രി",
+            Script.GURMUKHI: "ਹਸਪਤਾਲ"
+        }
+    },
+    "transport": {
+        "Taxi": {
+            Script.DEVANAGARI: "टैक्सी",
+            Script.TAMIL: "டாக்ஸி",
+            Script.MALAYALAM: "ടാക്സി",
+            Script.GURMUKHI: "ਟੈਕਸੀ"
+        },
+        "Bus": {
+            Script.DEVANAGARI: "बस",
+            Script.TAMIL: "பஸ்",
+            Script.MALAYALAM: "ബസ്",
+            Script.GURMUKHI: "ਬੱਸ"
+        },
+        "Train": {
+            Script.DEVANAGARI: "रेलगाड़ी",
+            Script.TAMIL: "ரயில்",
+            Script.MALAYALAM: "ട്രെയിൻ",
+            Script.GURMUKHI: "ਰੇਲਗੱਡੀ"
+        }
+    },
+    "shopping": {
+        "How much?": {
+            Script.DEVANAGARI: "कितना?",
+            Script.TAMIL: "எவ்வளவு?",
+            Script.MALAYALAM: "എത്ര?",
+            Script.GURMUKHI: "ਕਿੰਨਾ?"
+        },
+        "Cheap": {
+            Script.DEVANAGARI: "सस्ता",
+            Script.TAMIL: "மலிவான",
+            Script.MALAYALAM: "ചെലവുകുറഞ്ഞ",
+            Script.GURMUKHI: "ਸਸਤਾ"
+        },
+        "Expensive": {
+            Script.DEVANAGARI: "महंगा",
+            Script.TAMIL: "விலையான",
+            Script.MALAYALAM: "അതിവിപുലമായ",
+            Script.GURMUKHI: "ਮਹਿੰਗਾ"
+        }
+    }
+})
+
+
+# Artifact tables decoded in this process, by table name; never evicted
+_decoded: Dict[str, MappingTrie] = {}
+
+# Ad-hoc mappings (anything not in the artifact) keep at most this many compiled tries
+COMPILED_CACHE_SIZE = 32
+
+_compiled: "OrderedDict[int, Tuple[Mapping[str, str], MappingTrie]]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compiled(mapping: Mapping[str, str]) -> MappingTrie:
+    """Return the shared compiled trie for a mapping table, compiling it on first use"""
+    if isinstance(mapping, MappedTable):
+        trie = _decoded.get(mapping.name)
+        if trie is None:
+            with _compiled_lock:
+                trie = _decoded.get(mapping.name)
+                if trie is None:
+                    trie = _decoded[mapping.name] = MappingTrie(mapping)
+        return trie
+    with _compiled_lock:
+        cached = _compiled.get(id(mapping))
+        if cached is not None and cached[0] is mapping:
+            _compiled.move_to_end(id(mapping))
+            return cached[1]
+    trie = MappingTrie(mapping)
+    with _compiled_lock:
+        _compiled[id(mapping)] = (mapping, trie)
+        while len(_compiled) > COMPILED_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return trie
+
+
+def table_key(mapping: Mapping[str, str]) -> Hashable:
+    """Identifies a mapping's contents, e.g. in word cache keys: the table name, or a content hash"""
+    if isinstance(mapping, MappedTable):
+        return mapping.name
+    return hash(frozenset(mapping.items()))
+
+
+@functools.lru_cache(maxsize=None)
+def table_version() -> str:
+    """Short hash identifying the current tables; persisted results are keyed by it"""
+    import hashlib
+
+    digest = hashlib.sha256(ARTIFACT.digest)
+    digest.update(akshara.table_fingerprint().encode("ascii"))
+    return digest.hexdigest()[:16]
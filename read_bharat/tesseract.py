@@ -0,0 +1,233 @@
+"""
+Persistent Tesseract backend for Indian scripts
+
+pytesseract starts a new tesseract process, and loads the traineddata
+again, for every image it reads. On small sign crops that startup costs
+more than the recognition. TesseractPool keeps the cost per batch instead:
+
+- with tesserocr installed (requirements.txt pulls it in on Linux, where
+  it ships wheels), long-lived worker processes each hold one TessBaseAPI
+  per language, created once by the pool initializer with the Indic
+  traineddata (hin, tam, mal, pan and the combined "multi" language)
+  loaded, and images are sent to them in batches;
+- otherwise (e.g. on Windows) each batch is one tesseract CLI run over a
+  list file. The OCR cascade reads one image at a time, so there this
+  still starts a process, and loads the traineddata, per image.
+
+Words come back as EasyOCR-style (corner points, text, confidence 0..1)
+tuples, so they fit the same OCRResult assembly as the EasyOCR readers.
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Tesseract language of each script key (see readers.READER_LANGUAGES)
+TESSERACT_LANGUAGES: Dict[str, str] = {
+    "devanagari": "hin",
+    "tamil": "tam",
+    "malayalam": "mal",
+    "gurmukhi": "pan",
+    "multi": "hin+tam+mal+pan+eng",
+}
+
+# Loaded by every worker when it starts, including the combination used when the script is unknown
+PRELOAD_LANGUAGES = ("hin", "tam", "mal", "pan", TESSERACT_LANGUAGES["multi"])
+
+# Page segmentation: a single uniform block of text, as on a sign
+DEFAULT_PSM = 6
+
+# Images sent to a worker at a time
+DEFAULT_BATCH_SIZE = 16
+
+_COMMON_PATHS = [
+    r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+    r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+    '/usr/bin/tesseract',
+    '/usr/local/bin/tesseract',
+]
+
+Word = Tuple[List[List[int]], str, float]
+
+
+def find_tesseract() -> Optional[str]:
+    """Find Tesseract executable path"""
+    found = shutil.which("tesseract")
+    if found:
+        return found
+    for path in _COMMON_PATHS:
+        if Path(path).exists():
+            return path
+    return None
+
+
+def _grayscale(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 3:
+        image = image[..., :3].mean(axis=2)
+    return np.ascontiguousarray(image, dtype=np.uint8)
+
+
+def _corners(x1: int, y1: int, x2: int, y2: int) -> List[List[int]]:
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+# Worker process state (tesserocr backend), built once by the pool initializer
+_apis: Dict[str, Any] = {}
+_psm = DEFAULT_PSM
+
+
+def _init_worker(languages: Sequence[str], psm: int):
+    global _psm
+    _psm = psm
+    for language in languages:
+        _api(language)
+
+
+def _api(language: str):
+    api = _apis.get(language)
+    if api is None:
+        from tesserocr import PyTessBaseAPI
+
+        api = _apis[language] = PyTessBaseAPI(lang=language, psm=_psm)
+    return api
+
+
+def _read_batch_api(images: List[np.ndarray], language: str) -> List[List[Word]]:
+    from tesserocr import RIL, iterate_level
+
+    api = _api(language)
+    pages = []
+    for image in images:
+        height, width = image.shape
+        api.SetImageBytes(image.tobytes(), width, height, 1, width)
+        api.Recognize()
+        words = []
+        iterator = api.GetIterator()
+        if iterator is not None:
+            for word in iterate_level(iterator, RIL.WORD):
+                text = (word.GetUTF8Text(RIL.WORD) or "").strip()
+                if text:
+                    words.append((_corners(*word.BoundingBox(RIL.WORD)), text, word.Confidence(RIL.WORD) / 100))
+        pages.append(words)
+    return pages
+
+
+def _write_pgm(path: str, image: np.ndarray):
+    height, width = image.shape
+    with open(path, "wb") as handle:
+        handle.write(b"P5 %d %d 255\n" % (width, height))
+        handle.write(image.tobytes())
+
+
+def parse_tsv(tsv: str, pages: int) -> List[List[Word]]:
+    """Words per page from tesseract's TSV output"""
+    words: List[List[Word]] = [[] for _ in range(pages)]
+    for line in tsv.splitlines()[1:]:
+        fields = line.split("\t")
+        # level 5 rows are words
+        if len(fields) < 12 or fields[0] != "5" or not fields[11].strip():
+            continue
+        page = int(fields[1]) - 1
+        left, top, width, height = (int(v) for v in fields[6:10])
+        if 0 <= page < pages:
+            words[page].append((_corners(left, top, left + width, top + height), fields[11].strip(),
+                                max(0.0, float(fields[10])) / 100))
+    return words
+
+
+def _read_batch_cli(binary: str, images: List[np.ndarray], language: str, psm: int) -> List[List[Word]]:
+    with tempfile.TemporaryDirectory(prefix="read_bharat_tesseract_") as directory:
+        paths = []
+        for index, image in enumerate(images):
+            path = os.path.join(directory, f"{index}.pgm")
+            _write_pgm(path, image)
+            paths.append(path)
+        listing = os.path.join(directory, "images.txt")
+        with open(listing, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(paths) + "\n")
+        completed = subprocess.run(
+            [binary, listing, "stdout", "-l", language, "--psm", str(psm), "tsv"],
+            capture_output=True, check=True,
+        )
+    return parse_tsv(completed.stdout.decode("utf-8"), len(images))
+
+
+class TesseractPool:
+    """Long-lived Tesseract workers fed with batches of images"""
+
+    def __init__(self, workers: Optional[int] = None, languages: Sequence[str] = PRELOAD_LANGUAGES,
+                 psm: int = DEFAULT_PSM, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.languages = tuple(languages)
+        self.psm = psm
+        self.batch_size = batch_size
+        self._backend: Optional[str] = None
+        self._binary: Optional[str] = None
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> Optional[str]:
+        """'tesserocr', 'cli', or None when Tesseract is not installed"""
+        if self._backend is None:
+            if importlib.util.find_spec("tesserocr") is not None:
+                self._backend = "tesserocr"
+            else:
+                self._binary = find_tesseract()
+                self._backend = "cli" if self._binary else ""
+        return self._backend or None
+
+    @property
+    def available(self) -> bool:
+        return self.backend is not None
+
+    def _pool(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.backend == "tesserocr":
+                    # Workers start once and keep their traineddata loaded
+                    self._executor = ProcessPoolExecutor(
+                        self.workers, initializer=_init_worker, initargs=(self.languages, self.psm)
+                    )
+                else:
+                    # Each batch is its own tesseract run; threads just wait on it
+                    self._executor = ThreadPoolExecutor(self.workers)
+            return self._executor
+
+    def read(self, images: Sequence[np.ndarray], script: str) -> List[List[Word]]:
+        """Words (corner points, text, confidence) of each image, in order"""
+        if not self.available:
+            raise RuntimeError("Tesseract is not installed")
+        if not images:
+            return []
+        language = TESSERACT_LANGUAGES.get(script, TESSERACT_LANGUAGES["multi"])
+        images = [_grayscale(image) for image in images]
+        batches = [images[i:i + self.batch_size] for i in range(0, len(images), self.batch_size)]
+
+        pool = self._pool()
+        if self.backend == "tesserocr":
+            futures = [pool.submit(_read_batch_api, batch, language) for batch in batches]
+        else:
+            futures = [pool.submit(_read_batch_cli, self._binary, batch, language, self.psm) for batch in batches]
+        return [words for future in futures for words in future.result()]
+
+    def close(self):
+        """Stop the workers; the next read starts new ones"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+# Process-wide pool shared by every ImageProcessingEngine that is not given its own
+shared_tesseract_pool = TesseractPool()
@@ -0,0 +1,161 @@
+"""
+Tiling and box merging for OCR of very large images
+
+Panoramas and hoardings are read as overlapping tiles so memory is bounded
+by the tile size and tiles can be recognized in parallel. A word that
+straddles a tile edge is found twice, once whole and once cut; the merge
+keeps one box per word with a greedy non-maximum suppression over a
+vectorized overlap matrix that prefers uncut, confident boxes, then sorts
+the survivors into lines and reading order. A word wider than the
+horizontal overlap is cut in every tile; cut_pieces() finds its pieces so
+the union can be read again from the whole image.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+# Tile side and overlaps in pixels of the prepared image. The vertical
+# overlap is taller than a text line (see imaging.TARGET_TEXT_HEIGHT, 40), so
+# every line is whole in at least one tile; the horizontal one is wider than
+# most words at that height. Wider boxes are cut in every tile (cut_pieces).
+TILE_SIZE = 1024
+TILE_OVERLAP = 128
+TILE_OVERLAP_X = 320
+
+# Two boxes are the same word when their intersection covers this share of the smaller one
+DUPLICATE_OVERLAP = 0.6
+
+# Boxes whose vertical centers differ by less than this share of the median
+# box height are on the same line
+LINE_TOLERANCE = 0.5
+
+Tile = Tuple[int, int, int, int]  # (y0, y1, x0, x1)
+
+
+def _starts(length: int, tile: int, overlap: int) -> List[int]:
+    if length <= tile:
+        return [0]
+    step = tile - overlap
+    starts = list(range(0, length - tile, step))
+    starts.append(length - tile)
+    return starts
+
+
+def tile_grid(height: int, width: int, tile: int = TILE_SIZE, overlap: int = TILE_OVERLAP,
+              overlap_x: int = TILE_OVERLAP_X) -> List[Tile]:
+    """Overlapping tiles covering an image; edge tiles are shifted inwards to keep full size"""
+    if overlap >= tile or overlap_x >= tile:
+        raise ValueError("overlap must be smaller than the tile size")
+    return [
+        (y, min(height, y + tile), x, min(width, x + tile))
+        for y in _starts(height, tile, overlap)
+        for x in _starts(width, tile, overlap_x)
+    ]
+
+
+def cut_flags(boxes: np.ndarray, tiles: np.ndarray, height: int, width: int, margin: int = 2) -> np.ndarray:
+    """True for boxes touching an edge of their tile that is not an edge of the image
+
+    boxes: (N, 4) x_min, y_min, x_max, y_max in image coordinates;
+    tiles: (N, 4) y0, y1, x0, x1 of the tile each box came from.
+    """
+    x_min, y_min, x_max, y_max = boxes.T
+    y0, y1, x0, x1 = tiles.T
+    return (
+        ((x_min <= x0 + margin) & (x0 > 0))
+        | ((x_max >= x1 - margin) & (x1 < width))
+        | ((y_min <= y0 + margin) & (y0 > 0))
+        | ((y_max >= y1 - margin) & (y1 < height))
+    )
+
+
+def cut_pieces(boxes: np.ndarray, cut: np.ndarray, same_line: float = 0.5,
+               threshold: float = DUPLICATE_OVERLAP) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Groups of cut boxes that are pieces of one word, with the union box of each group
+
+    Cut boxes overlapping each other horizontally and sharing more than
+    same_line of the smaller height are linked into groups. A group is left
+    out when an uncut box already covers its union by more than threshold,
+    since suppress_duplicates() keeps that whole copy. Returns (indexes,
+    union) pairs, union as x_min, y_min, x_max, y_max.
+    """
+    pieces = np.flatnonzero(cut)
+    if len(pieces) < 2:
+        return []
+    x_min, y_min, x_max, y_max = boxes[pieces].T.astype(np.float64)
+    width = np.minimum(x_max[:, None], x_max[None, :]) - np.maximum(x_min[:, None], x_min[None, :])
+    height = np.minimum(y_max[:, None], y_max[None, :]) - np.maximum(y_min[:, None], y_min[None, :])
+    heights = np.maximum(y_max - y_min, 1)
+    linked = (width > 0) & (height > same_line * np.minimum(heights[:, None], heights[None, :]))
+
+    # Connected components: every piece takes the smallest label it is linked to until none changes
+    labels = np.arange(len(pieces))
+    while True:
+        spread = np.minimum(labels, np.where(linked, labels[None, :], len(pieces)).min(axis=1))
+        if (spread == labels).all():
+            break
+        labels = spread
+
+    whole = boxes[~cut].astype(np.float64)
+    groups = []
+    for label in np.unique(labels):
+        members = pieces[labels == label]
+        if len(members) < 2:
+            continue
+        group = boxes[members]
+        union = np.array([group[:, 0].min(), group[:, 1].min(), group[:, 2].max(), group[:, 3].max()])
+        if len(whole):
+            width = np.clip(np.minimum(whole[:, 2], union[2]) - np.maximum(whole[:, 0], union[0]), 0, None)
+            height = np.clip(np.minimum(whole[:, 3], union[3]) - np.maximum(whole[:, 1], union[1]), 0, None)
+            area = max((union[2] - union[0]) * (union[3] - union[1]), 1)
+            if (width * height / area > threshold).any():
+                continue
+        groups.append((members, union))
+    return groups
+
+
+def suppress_duplicates(boxes: np.ndarray, scores: np.ndarray, threshold: float = DUPLICATE_OVERLAP) -> np.ndarray:
+    """Indexes of the boxes to keep, highest score first
+
+    Greedy NMS over a precomputed overlap matrix (intersection over the
+    smaller area): boxes are visited by score and a box is dropped when a
+    box already kept covers it by more than threshold. A dropped box never
+    suppresses others, so in a chain A > B > C where only neighbours
+    overlap, A and C are both kept.
+    """
+    if len(boxes) == 0:
+        return np.zeros(0, dtype=np.intp)
+    order = np.argsort(-scores, kind="stable")
+    ranked = boxes[order].astype(np.float64)
+    x_min, y_min, x_max, y_max = ranked.T
+    area = np.maximum(x_max - x_min, 1) * np.maximum(y_max - y_min, 1)
+
+    width = np.clip(np.minimum(x_max[:, None], x_max[None, :]) - np.maximum(x_min[:, None], x_min[None, :]), 0, None)
+    height = np.clip(np.minimum(y_max[:, None], y_max[None, :]) - np.maximum(y_min[:, None], y_min[None, :]), 0, None)
+    overlap = width * height / np.minimum(area[:, None], area[None, :])
+
+    covers = overlap > threshold
+    suppressed = np.zeros(len(ranked), dtype=bool)
+    kept = []
+    for i in range(len(ranked)):
+        if not suppressed[i]:
+            kept.append(i)
+            suppressed[i + 1:] |= covers[i, i + 1:]
+    return order[kept]
+
+
+def reading_order(boxes: np.ndarray, tolerance: float = LINE_TOLERANCE) -> np.ndarray:
+    """Indexes of boxes sorted into lines top to bottom, each line left to right"""
+    if len(boxes) == 0:
+        return np.zeros(0, dtype=np.intp)
+    x_min, y_min, x_max, y_max = boxes.T.astype(np.float64)
+    centers = (y_min + y_max) / 2
+    heights = np.maximum(y_max - y_min, 1)
+
+    by_center = np.argsort(centers, kind="stable")
+    gaps = np.diff(centers[by_center])
+    line_starts = np.concatenate(([0], gaps > tolerance * np.median(heights)))
+    lines = np.empty(len(boxes), dtype=np.intp)
+    lines[by_center] = np.cumsum(line_starts)
+    return np.lexsort((x_min, lines))
@@ -6,10 +6,11 @@ Working version without duplicates
 
 import streamlit as st
 import time
-import re
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
+from read_bharat import AdvancedTransliterationEngine as SharedTransliterationEngine
+from read_bharat import detection
 
 # Page configuration
 st.set_page_config(
@@ -163,184 +164,22 @@ SCRIPTS = {
     }
 }
 
-# Advanced Transliteration Engine (EXACT from React app)
+# Advanced Transliteration Engine: mapping tables come from the shared read_bharat registry
 class AdvancedTransliterationEngine:
     def __init__(self):
-        # COMPLETE Tamil to Devanagari mapping (from your React app)
-        self.tamil_to_devanagari_map = {
-            # Vowels
-            'அ': 'अ', 'ஆ': 'आ', 'இ': 'इ', 'ஈ': 'ई', 'உ': 'उ', 'ஊ': 'ऊ',
-            'எ': 'ए', 'ஏ': 'ऐ', 'ஐ': 'ऐ', 'ஒ': 'ओ', 'ஓ': 'औ', 'ஔ': 'औ',
-            
-            # Consonants
-            'க': 'क', 'ங': 'ङ', 'ச': 'च', 'ஞ': 'ञ', 'ட': 'ट', 'ண': 'ण',
-            'த': 'त', 'ந': 'न', 'ப': 'प', 'ம': 'म', 'ய': 'य', 'ர': 'र',
-            'ல': 'ल', 'வ': 'व', 'ழ': 'ष', 'ள': 'ळ', 'ற': 'र', 'ன': 'न',
-            
-            # Special characters
-            'ஸ': 'स', 'ஶ': 'श', 'ஜ': 'ज', 'ஹ': 'ह',
-            
-            # Complete combinations (from your React app)
-            'கா': 'का', 'கி': 'कि', 'கீ': 'की', 'கு': 'कु', 'கூ': 'कू',
-            'கே': 'के', 'கை': 'कै', 'கோ': 'को', 'கௌ': 'कौ',
-            'தா': 'ता', 'தி': 'ति', 'தீ': 'ती', 'து': 'तु', 'தூ': 'तू',
-            'தே': 'ते', 'தை': 'तै', 'தோ': 'तो', 'தௌ': 'तौ',
-            'நா': 'ना', 'நி': 'नि', 'நீ': 'नी', 'நு': 'नु', 'நூ': 'नू',
-            'நே': 'ने', 'நை': 'नै', 'நோ': 'नो', 'நௌ': 'नौ',
-            'மா': 'मा', 'மி': 'मि', 'மீ': 'मी', 'மு': 'मु', 'மூ': 'मू',
-            'மே': 'मे', 'மை': 'मै', 'மோ': 'मो', 'மௌ': 'मौ',
-            'வா': 'वा', 'வி': 'वि', 'வீ': 'वी', 'வு': 'वु', 'வூ': 'वू',
-            'வே': 'वे', 'வை': 'वै', 'வோ': 'वो', 'வௌ': 'वौ',
-            'பா': 'पा', 'பி': 'पि', 'பீ': 'पी', 'பு': 'पु', 'பூ': 'पू',
-            'பே': 'पे', 'பை': 'पै', 'போ': 'पो', 'பௌ': 'पौ',
-            'லா': 'ला', 'லி': 'लि', 'லீ': 'ली', 'லு': 'लु', 'லூ': 'लू',
-            'லே': 'ले', 'லै': 'लै', 'லோ': 'लो', 'லௌ': 'लौ',
-            'ரா': 'रा', 'ரி': 'रि', 'ரீ': 'री', 'ரு': 'रु', 'ரூ': 'रू',
-            'ரே': 'रे', 'ரै': 'रै', 'ரோ': 'रो', 'ரௌ': 'रौ',
-            # Common words
-            'ஹரே': 'हरे', 'பாபா': 'बाबा', 'மாமா': 'मामा'
-        }
-        
-        # Tamil to Malayalam mapping
-        self.tamil_to_malayalam_map = {
-            'அ': 'അ', 'ஆ': 'ആ', 'இ': 'ഇ', 'ஈ': 'ഈ', 'உ': 'ഉ', 'ஊ': 'ഊ',
-            'எ': 'എ', 'ஏ': 'ഏ', 'ஐ': 'ഐ', 'ஒ': 'ഒ', 'ஓ': 'ഓ', 'ஔ': 'ഔ',
-            'க': 'ക', 'ங': 'ങ', 'ச': 'ച', 'ஞ': 'ഞ', 'ட': 'ട', 'ண': 'ണ',
-            'த': 'ത', 'ந': 'ന', 'ப': 'പ', 'ம': 'മ', 'ய': 'യ', 'ர': 'ര',
-            'ல': 'ല', 'வ': 'വ', 'ழ': 'ഴ', 'ள': 'ള', 'ற': 'റ', 'ன': 'ൻ',
-            'ஸ': 'സ', 'ஶ': 'ശ', 'ஜ': 'ജ', 'ஹ': 'ഹ',
-            # Words
-            'ஹரே': 'ഹരേ', 'பாபா': 'ബാബാ', 'மாமா': 'മാമാ'
-        }
-        
-        # Tamil to Gurmukhi mapping
-        self.tamil_to_gurmukhi_map = {
-            'அ': 'ਅ', 'ஆ': 'ਆ', 'இ': 'ਇ', 'ஈ': 'ਈ', 'உ': 'ਉ', 'ஊ': 'ਊ',
-            'எ': 'ਏ', 'ஏ': 'ਏ', 'ஐ': 'ਐ', 'ஒ': 'ਓ', 'ஓ': 'ਔ', 'ஔ': 'ਔ',
-            'க': 'ਕ', 'ங': 'ਙ', 'ச': 'ਚ', 'ஞ': 'ਞ', 'ட': 'ਟ', 'ண': 'ਣ',
-            'த': 'ਤ', 'ந': 'ਨ', 'ப': 'ਪ', 'ம': 'ਮ', 'ய': 'ਯ', 'ர': 'ਰ',
-            'ல': 'ਲ', 'வ': 'ਵ', 'ழ': 'ਸ਼', 'ள': 'ਲ਼', 'ற': 'ਰ', 'ன': 'ਨ',
-            'ஸ': 'ਸ', 'ஶ': 'ਸ਼', 'ஜ': 'ਜ', 'ஹ': 'ਹ',
-            # Words
-            'ஹரே': 'ਹਰੇ', 'பாபா': 'ਬਾਬਾ', 'மாமா': 'ਮਾਮਾ'
-        }
-        
-        # English to all scripts
-        self.english_to_devanagari = {
-            'hare': 'हरे', 'baba': 'बाबा', 'mama': 'मामा',
-            'hello': 'हैलो', 'namaste': 'नमस्ते', 'thank': 'धन्य', 'you': 'वाद',
-            'please': 'कृपया', 'water': 'पानी', 'food': 'खाना', 'help': 'सहायता'
-        }
-        
-        self.english_to_tamil = {
-            'hare': 'ஹரே', 'baba': 'பாபா', 'mama': 'மாமா',
-            'hello': 'ஹலோ', 'namaste': 'நமஸ்தே'
-        }
-        
-        self.english_to_malayalam = {
-            'hare': 'ഹരേ', 'baba': 'ബാബാ', 'mama': 'മാമാ',
-            'hello': 'ഹലോ', 'namaste': 'നമസ്തേ'
-        }
-        
-        self.english_to_gurmukhi = {
-            'hare': 'ਹਰੇ', 'baba': 'ਬਾਬਾ', 'mama': 'ਮਾਮਾ',
-            'hello': 'ਹਲੋ', 'namaste': 'ਨਮਸਤੇ'
-        }
+        self.engine = SharedTransliterationEngine()
 
     def detect_script(self, text: str) -> str:
-        if not text.strip():
-            return "unknown"
-        
-        devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
-        tamil_chars = len(re.findall(r'[\u0B80-\u0BFF]', text))
-        malayalam_chars = len(re.findall(r'[\u0D00-\u0D7F]', text))
-        gurmukhi_chars = len(re.findall(r'[\u0A00-\u0A7F]', text))
-        latin_chars = len(re.findall(r'[a-zA-Z]', text))
-        
-        script_counts = {
-            Script.DEVANAGARI: devanagari_chars,
-            Script.TAMIL: tamil_chars,
-            Script.MALAYALAM: malayalam_chars,
-            Script.GURMUKHI: gurmukhi_chars,
-            'latin': latin_chars
-        }
-        
-        detected = max(script_counts.items(), key=lambda x: x[1])
-        return detected[0] if detected[1] > 0 else "latin"
-
-    def tamil_to_devanagari_direct(self, text: str) -> str:
-        """Direct Tamil to Devanagari conversion using complete mapping"""
-        result = ""
-        i = 0
-        while i < len(text):
-            # Try 3-character combinations first
-            if i <= len(text) - 3:
-                three_char = text[i:i+3]
-                if three_char in self.tamil_to_devanagari_map:
-                    result += self.tamil_to_devanagari_map[three_char]
-                    i += 3
-                    continue
-            
-            # Try 2-character combinations
-            if i <= len(text) - 2:
-                two_char = text[i:i+2]
-                if two_char in self.tamil_to_devanagari_map:
-                    result += self.tamil_to_devanagari_map[two_char]
-                    i += 2
-                    continue
-            
-            # Single character mapping
-            char = text[i]
-            if char in self.tamil_to_devanagari_map:
-                result += self.tamil_to_devanagari_map[char]
-            else:
-                result += char
-            i += 1
-        
-        return result
+        detected = detection.detect_script(text)
+        return Script(detected) if detected in detection.INDIAN_SCRIPTS else detected
 
     def transliterate_words(self, text: str, source_script: str, target_script: str) -> str:
         """Transliterate by words and characters"""
-        words = text.strip().split()
-        result_words = []
-        
-        for word in words:
-            word_lower = word.lower()
-            
-            # Try word-level mapping first
-            if source_script == 'latin' and target_script == Script.DEVANAGARI:
-                if word_lower in self.english_to_devanagari:
-                    result_words.append(self.english_to_devanagari[word_lower])
-                    continue
-            elif source_script == 'latin' and target_script == Script.TAMIL:
-                if word_lower in self.english_to_tamil:
-                    result_words.append(self.english_to_tamil[word_lower])
-                    continue
-            elif source_script == 'latin' and target_script == Script.MALAYALAM:
-                if word_lower in self.english_to_malayalam:
-                    result_words.append(self.english_to_malayalam[word_lower])
-                    continue
-            elif source_script == 'latin' and target_script == Script.GURMUKHI:
-                if word_lower in self.english_to_gurmukhi:
-                    result_words.append(self.english_to_gurmukhi[word_lower])
-                    continue
-            
-            # Character by character conversion
-            converted_word = ""
-            if source_script == Script.TAMIL and target_script == Script.DEVANAGARI:
-                converted_word = self.tamil_to_devanagari_direct(word)
-            elif source_script == Script.TAMIL and target_script == Script.MALAYALAM:
-                for char in word:
-                    converted_word += self.tamil_to_malayalam_map.get(char, char)
-            elif source_script == Script.TAMIL and target_script == Script.GURMUKHI:
-                for char in word:
-                    converted_word += self.tamil_to_gurmukhi_map.get(char, char)
-            else:
-                converted_word = word
-            
-            result_words.append(converted_word)
-        
-        return " ".join(result_words)
+        if source_script == 'latin':
+            return self.engine.transliterate(text, target_script)
+        if source_script in detection.INDIAN_SCRIPTS:
+            return self.engine.cross_script_transliterate(text.strip(), source_script, target_script)
+        return text.strip()
 
     def transliterate(self, text: str, source_script: str, target_script: str) -> TransliterationResult:
         if source_script == target_script:
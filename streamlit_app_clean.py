@@ -8,10 +8,10 @@ import streamlit as st
 import requests
 import json
 import time
-import re
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from read_bharat import AdvancedTransliterationEngine
 
 # Page configuration
 st.set_page_config(
@@ -329,187 +329,6 @@ SCRIPTS = {
     }
 }
 
-# Advanced Transliteration Engine (Exact replica from React app)
-class AdvancedTransliterationEngine:
-    """Advanced transliteration engine matching the React app implementation"""
-    
-    def __init__(self):
-        # Enhanced Tamil to Devanagari mapping (from your React app)
-        self.tamil_to_devanagari_map = {
-            # Vowels
-            'அ': 'अ', 'ஆ': 'आ', 'இ': 'इ', 'ஈ': 'ई', 'உ': 'उ', 'ஊ': 'ऊ',
-            'எ': 'ए', 'ஏ': 'ऐ', 'ஐ': 'ऐ', 'ஒ': 'ओ', 'ஓ': 'औ', 'ஔ': 'औ',
-            
-            # Consonants
-            'க': 'क', 'ங': 'ङ', 'ச': 'च', 'ஞ': 'ञ', 'ட': 'ट', 'ண': 'ण',
-            'த': 'त', 'ந': 'न', 'ப': 'प', 'ம': 'म', 'ய': 'य', 'ர': 'र',
-            'ல': 'ल', 'வ': 'व', 'ழ': 'ष', 'ள': 'ळ', 'ற': 'र', 'ன': 'न',
-            
-            # Special characters
-            'ஸ': 'स', 'ஶ': 'श', 'ஜ': 'ज', 'ஹ': 'ह',
-            
-            # Common combinations (matching React app)
-            'கா': 'का', 'கி': 'कि', 'கீ': 'की', 'கு': 'कु', 'கூ': 'कू',
-            'தா': 'ता', 'தி': 'ति', 'தீ': 'ती', 'து': 'तु', 'தூ': 'तू',
-            'நா': 'ना', 'நி': 'नि', 'நீ': 'नी', 'நு': 'नु', 'நூ': 'नू',
-            'மா': 'मा', 'மி': 'मि', 'மீ': 'मी', 'மு': 'मु', 'மூ': 'मू',
-            'வா': 'वा', 'வி': 'वि', 'வீ': 'वी', 'வு': 'वु', 'வூ': 'वू',
-            # Extended combinations
-            'கே': 'के', 'கை': 'कै', 'கோ': 'को', 'கௌ': 'कौ',
-            'தே': 'ते', 'தை': 'तै', 'தோ': 'तो', 'தௌ': 'तौ',
-            'நே': 'ने', 'நை': 'नै', 'நோ': 'नो', 'நௌ': 'नौ',
-            'மே': 'मे', 'மை': 'मै', 'மோ': 'मो', 'மௌ': 'मौ',
-            'வே': 'वे', 'வை': 'वै', 'வோ': 'वो', 'வௌ': 'वौ'
-        }
-        
-        # English to Devanagari mapping
-        self.english_to_devanagari_map = {
-            # Basic consonants
-            'ka': 'क', 'kha': 'ख', 'ga': 'ग', 'gha': 'घ', 'nga': 'ङ',
-            'cha': 'च', 'chha': 'छ', 'ja': 'ज', 'jha': 'झ', 'nya': 'ञ',
-            'ta': 'ट', 'tha': 'ठ', 'da': 'ड', 'dha': 'ढ', 'na': 'ण',
-            'th': 'त', 'thh': 'थ', 'dh': 'द', 'dhh': 'ध', 'n': 'न',
-            'pa': 'प', 'pha': 'फ', 'ba': 'ब', 'bha': 'भ', 'ma': 'म',
-            'ya': 'य', 'ra': 'र', 'la': 'ल', 'va': 'व', 'wa': 'व',
-            'sha': 'श', 'shha': 'ष', 'sa': 'स', 'ha': 'ह',
-            
-            # Vowels
-            'a': 'अ', 'aa': 'आ', 'i': 'इ', 'ee': 'ई', 'u': 'उ', 'oo': 'ऊ',
-            'ri': 'ऋ', 'e': 'ए', 'ai': 'ऐ', 'o': 'ओ', 'au': 'औ',
-            
-            # Numbers
-            '0': '०', '1': '१', '2': '२', '3': '३', '4': '४',
-            '5': '५', '6': '६', '7': '७', '8': '८', '9': '९',
-            
-            # Common words
-            'hello': 'हैलो', 'namaste': 'नमस्ते', 'dhanyawad': 'धन्यवाद',
-            'mumbai': 'मुंबई', 'delhi': 'दिल्ली'
-        }
-
-    def detect_script(self, text: str) -> str:
-        """Detect the script of input text (matching React app logic)"""
-        if not text.strip():
-            return "unknown"
-        
-        # Count characters from different scripts
-        devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
-        tamil_chars = len(re.findall(r'[\u0B80-\u0BFF]', text))
-        malayalam_chars = len(re.findall(r'[\u0D00-\u0D7F]', text))
-        gurmukhi_chars = len(re.findall(r'[\u0A00-\u0A7F]', text))
-        latin_chars = len(re.findall(r'[a-zA-Z]', text))
-        
-        # Determine dominant script
-        script_counts = {
-            Script.DEVANAGARI: devanagari_chars,
-            Script.TAMIL: tamil_chars,
-            Script.MALAYALAM: malayalam_chars,
-            Script.GURMUKHI: gurmukhi_chars,
-            'latin': latin_chars
-        }
-        
-        detected = max(script_counts.items(), key=lambda x: x[1])
-        return detected[0] if detected[1] > 0 else "latin"
-
-    def tamil_to_devanagari_direct(self, text: str) -> str:
-        """Direct Tamil to Devanagari conversion (matching React app)"""
-        result = ""
-        i = 0
-        while i < len(text):
-            # Try 2-character combinations first
-            if i < len(text) - 1:
-                two_char = text[i:i+2]
-                if two_char in self.tamil_to_devanagari_map:
-                    result += self.tamil_to_devanagari_map[two_char]
-                    i += 2
-                    continue
-            
-            # Single character mapping
-            char = text[i]
-            if char in self.tamil_to_devanagari_map:
-                result += self.tamil_to_devanagari_map[char]
-            else:
-                result += char
-            i += 1
-        
-        return result
-
-    def english_to_devanagari(self, text: str) -> str:
-        """Convert English to Devanagari (matching React app)"""
-        # Simple word-based conversion for now
-        words = text.lower().split()
-        result_words = []
-        
-        for word in words:
-            if word in self.english_to_devanagari_map:
-                result_words.append(self.english_to_devanagari_map[word])
-            else:
-                # Character by character conversion for unknown words
-                converted = ""
-                i = 0
-                while i < len(word):
-                    # Try 3-character combinations first
-                    if i <= len(word) - 3:
-                        three_char = word[i:i+3]
-                        if three_char in self.english_to_devanagari_map:
-                            converted += self.english_to_devanagari_map[three_char]
-                            i += 3
-                            continue
-                    
-                    # Try 2-character combinations
-                    if i <= len(word) - 2:
-                        two_char = word[i:i+2]
-                        if two_char in self.english_to_devanagari_map:
-                            converted += self.english_to_devanagari_map[two_char]
-                            i += 2
-                            continue
-                    
-                    # Single character
-                    char = word[i]
-                    if char in self.english_to_devanagari_map:
-                        converted += self.english_to_devanagari_map[char]
-                    else:
-                        converted += char
-                    i += 1
-                
-                result_words.append(converted if converted else word)
-        
-        return " ".join(result_words)
-
-    def cross_script_transliterate(self, text: str, source_script: str, target_script: str) -> str:
-        """Cross-script transliteration (matching React app logic)"""
-        # Direct mappings for specific combinations
-        if source_script == Script.TAMIL and target_script == Script.DEVANAGARI:
-            return self.tamil_to_devanagari_direct(text)
-        
-        # Basic phonetic approximation for other combinations
-        return self.phonetic_approximation(text, source_script, target_script)
-
-    def phonetic_approximation(self, text: str, source: str, target: str) -> str:
-        """Basic phonetic approximation (matching React app)"""
-        # Simplified phonetic mapping
-        if target == Script.TAMIL:
-            basic_mapping = {
-                'क': 'க', 'ख': 'க', 'ग': 'க', 'घ': 'க',
-                'च': 'ச', 'छ': 'ச', 'ज': 'ஜ', 'झ': 'ஜ',
-                'ट': 'ட', 'ठ': 'ட', 'ड': 'ட', 'ढ': 'ட',
-                'त': 'த', 'थ': 'த', 'द': 'த', 'ध': 'த',
-                'न': 'ந', 'प': 'ப', 'फ': 'ப', 'ब': 'ப', 'भ': 'ப',
-                'म': 'ம', 'य': 'ய', 'र': 'ர', 'ल': 'ல', 'व': 'வ',
-                'श': 'ஶ', 'ष': 'ஷ', 'स': 'ஸ', 'ह': 'ஹ'
-            }
-        else:
-            # Default fallback
-            return text
-        
-        result = ""
-        for char in text:
-            if char in basic_mapping:
-                result += basic_mapping[char]
-            else:
-                result += char
-        
-        return result
-
 class AdvancedTextProcessor:
     """Text processing utilities (matching React app)"""
     
@@ -6,10 +6,11 @@ Working version without duplicates
 
 import streamlit as st
 import time
-import re
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
+from read_bharat import AdvancedTransliterationEngine as SharedTransliterationEngine
+from read_bharat import detection
 
 # Page configuration
 st.set_page_config(
@@ -163,61 +164,31 @@ SCRIPTS = {
     }
 }
 
-# Transliteration Engine
+# Transliteration Engine: mapping tables come from the shared read_bharat registry
 class SimpleTransliterationEngine:
     def __init__(self):
-        # Tamil to Devanagari mapping
-        self.tamil_to_devanagari = {
-            'அ': 'अ', 'ஆ': 'आ', 'இ': 'इ', 'ஈ': 'ई', 'உ': 'उ', 'ஊ': 'ऊ',
-            'எ': 'ए', 'ஏ': 'ऐ', 'ஐ': 'ऐ', 'ஒ': 'ओ', 'ஓ': 'औ', 'ஔ': 'औ',
-            'க': 'क', 'ங': 'ङ', 'ச': 'च', 'ஞ': 'ञ', 'ட': 'ट', 'ண': 'ण',
-            'த': 'त', 'ந': 'न', 'ப': 'प', 'ம': 'म', 'ய': 'य', 'ர': 'र',
-            'ல': 'ल', 'வ': 'व', 'ழ': 'ष', 'ள': 'ळ', 'ற': 'र', 'ன': 'न',
-            'ஸ': 'स', 'ஶ': 'श', 'ஜ': 'ज', 'ஹ': 'ह'
-        }
-        
-        # English to Devanagari
-        self.english_to_devanagari = {
-            'namaste': 'नमस्ते', 'hello': 'हैलो', 'thank': 'धन्य', 'you': 'वाद',
-            'please': 'कृपया', 'water': 'पानी', 'food': 'खाना', 'help': 'सहायता'
-        }
+        self.engine = SharedTransliterationEngine()
 
     def detect_script(self, text: str) -> str:
-        if not text.strip():
-            return "unknown"
-        
-        devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
-        tamil_chars = len(re.findall(r'[\u0B80-\u0BFF]', text))
-        malayalam_chars = len(re.findall(r'[\u0D00-\u0D7F]', text))
-        gurmukhi_chars = len(re.findall(r'[\u0A00-\u0A7F]', text))
-        latin_chars = len(re.findall(r'[a-zA-Z]', text))
-        
-        script_counts = {
-            Script.DEVANAGARI: devanagari_chars,
-            Script.TAMIL: tamil_chars,
-            Script.MALAYALAM: malayalam_chars,
-            Script.GURMUKHI: gurmukhi_chars,
-            'latin': latin_chars
-        }
-        
-        detected = max(script_counts.items(), key=lambda x: x[1])
-        return detected[0] if detected[1] > 0 else "latin"
+        detected = detection.detect_script(text)
+        return Script(detected) if detected in detection.INDIAN_SCRIPTS else detected
 
     def transliterate(self, text: str, source_script: str, target_script: str) -> TransliterationResult:
         if source_script == target_script:
             return TransliterationResult(text, 0.95, "same_script")
-        
+
         if source_script == Script.TAMIL and target_script == Script.DEVANAGARI:
-            result = ""
-            for char in text:
-                result += self.tamil_to_devanagari.get(char, char)
+            result = self.engine.tamil_to_devanagari_direct(text)
             return TransliterationResult(result, 0.9, "direct_mapping")
-        
-        if source_script == 'latin' and target_script == Script.DEVANAGARI:
-            words = text.lower().split()
-            result = " ".join([self.english_to_devanagari.get(word, word) for word in words])
-            return TransliterationResult(result, 0.8, "english_to_devanagari")
-        
+
+        if source_script == 'latin':
+            result = self.engine.transliterate(text, target_script)
+            return TransliterationResult(result, 0.8, f"english_to_{target_script.value}")
+
+        if source_script in detection.INDIAN_SCRIPTS:
+            result = self.engine.cross_script_transliterate(text, source_script, target_script)
+            return TransliterationResult(result, 0.8, "cross_script")
+
         # Basic phonetic approximation
         return TransliterationResult(f"[{SCRIPTS[target_script]['name']} conversion]", 0.6, "phonetic")
 
@@ -0,0 +1,54 @@
+import io
+import random
+import unicodedata
+
+from read_bharat.__main__ import iter_blocks, safe_split
+
+WORDS = ["नमस्ते", "प्रधानमंत्री", "क्ष", "வணக்கம்", "ਧੰਨਵਾਦ", "കൊച്ചി", "hello", "क़िला", "र्‍य"]
+JOINERS = "‌‍"
+
+
+def splits_cluster(head: str, tail: str) -> bool:
+    """True if head + tail cut at len(head) lands inside a grapheme cluster"""
+    if not head or not tail:
+        return False
+    return (
+        unicodedata.category(tail[0]) in ("Mn", "Mc", "Me")
+        or tail[0] in JOINERS
+        or unicodedata.combining(head[-1]) == 9
+        or head[-1] in JOINERS
+    )
+
+
+def test_safe_split_prefers_the_last_newline():
+    text = "नमस्ते भारत\nप्रधान"
+    assert text[:safe_split(text)] == "नमस्ते भारत\n"
+
+
+def test_safe_split_falls_back_to_whitespace():
+    text = "नमस्ते प्रधानमंत्री"
+    assert text[:safe_split(text)] == "नमस्ते "
+
+
+def test_safe_split_cuts_between_clusters():
+    for text in ["प्रधानमंत्री", "வணக்கம்", "ਧੰਨਵਾਦ", "കൊച്ചി", "क़िला"]:
+        cut = safe_split(text)
+        assert 0 < cut < len(text)
+        assert not splits_cluster(text[:cut], text[cut:]), (text, cut)
+
+
+def test_single_cluster_is_not_split():
+    for text in ["क्ष", "कि", "र्‍य", "க்ஷ"]:
+        assert safe_split(text) == 0
+
+
+def test_iter_blocks_reassembles_the_input_on_cluster_boundaries():
+    rng = random.Random(4)
+    separators = [" ", "  ", "\n", "\t", ""]
+    text = "".join(rng.choice(WORDS) + rng.choice(separators) for _ in range(2000))
+    for chunk_chars in (1, 2, 3, 7, 64, 1000):
+        for lines in (False, True):
+            blocks = list(iter_blocks(io.StringIO(text), chunk_chars, lines))
+            assert "".join(blocks) == text
+            for head, tail in zip(blocks, blocks[1:]):
+                assert not splits_cluster(head, tail), (chunk_chars, lines, head[-3:], tail[:3])
@@ -0,0 +1,43 @@
+import random
+import re
+
+from read_bharat import akshara, bulk, direct
+from read_bharat.scripts import SCRIPT_BLOCKS
+
+# Every codepoint of the four script blocks, plus Latin, digits, punctuation and whitespace
+POOL = [chr(code) for base in SCRIPT_BLOCKS.values() for code in range(base, base + 128)] + list("ab.1\x00 \n\t")
+
+_WHITESPACE = re.compile(r"(\s+)")
+
+
+def random_strings(seed: int, count: int, max_length: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(POOL) for _ in range(rng.randint(0, max_length)))
+
+
+def ir(text: str, target: str) -> str:
+    """Reference: parse into aksharas and render, word by word"""
+    return "".join(
+        piece if not piece or piece.isspace() else akshara.render(akshara.parse(piece), target)
+        for piece in _WHITESPACE.split(text)
+    )
+
+
+def test_direct_tables_match_the_ir():
+    for text in random_strings(seed=1, count=3000, max_length=10):
+        for word in text.split():
+            for target in SCRIPT_BLOCKS:
+                assert direct.convert_word(word, target) == ir(word, target), (word, target)
+
+
+def test_bulk_converter_matches_the_ir():
+    for text in random_strings(seed=2, count=3000, max_length=15):
+        for target in SCRIPT_BLOCKS:
+            assert bulk.convert(text, target) == ir(text, target), (text, target)
+
+
+def test_bulk_converter_matches_the_ir_on_a_long_document():
+    text = " ".join(random_strings(seed=3, count=2000, max_length=8))
+    for target in SCRIPT_BLOCKS:
+        assert bulk.convert(text, target) == ir(text, target)
@@ -0,0 +1,15 @@
+from read_bharat import AdvancedTransliterationEngine
+from read_bharat.matcher import MappingTrie
+
+
+def test_unmapped_letters_keep_their_case():
+    trie = MappingTrie({"oa": "ஒஅ", "m": "ம"})
+    assert trie.convert("mg road", "MG Road") == "மG Rஒஅd"
+
+
+def test_engine_only_lowercases_the_lookup_key():
+    engine = AdvancedTransliterationEngine()
+    lower = engine.transliterate("namaste", "devanagari")
+    assert engine.transliterate("Namaste", "devanagari") == lower
+    converted = engine.transliterate("Namaste XYZ", "devanagari")
+    assert converted.startswith(lower) and converted.endswith("XYZ")
@@ -0,0 +1,14 @@
+import subprocess
+import sys
+
+
+def test_text_session_modules_do_not_import_numpy():
+    # The Streamlit app imports these at the top; numpy should load only for images
+    code = (
+        "import sys\n"
+        "from read_bharat import detection, engine, ocr, ocr_cache, readers, routing, store\n"
+        "from read_bharat.engine import AdvancedTransliterationEngine\n"
+        "AdvancedTransliterationEngine().transliterate('namaste', 'tamil')\n"
+        "assert 'numpy' not in sys.modules, 'numpy imported'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
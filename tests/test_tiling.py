@@ -0,0 +1,55 @@
+import numpy as np
+
+from read_bharat import tiling
+
+
+def test_suppressed_box_does_not_suppress_the_next_in_a_chain():
+    # A overlaps B and B overlaps C, but A and C are apart: B goes, C stays
+    boxes = np.array([
+        [0, 0, 100, 20],    # A
+        [70, 0, 170, 20],   # B
+        [140, 0, 240, 20],  # C
+    ])
+    scores = np.array([0.9, 0.8, 0.7])
+    keep = tiling.suppress_duplicates(boxes, scores, threshold=0.25)
+    assert sorted(keep.tolist()) == [0, 2]
+
+
+def test_duplicate_from_neighbouring_tile_is_dropped():
+    boxes = np.array([[10, 10, 60, 30], [12, 10, 60, 30], [200, 10, 250, 30]])
+    scores = np.array([0.6, 0.9, 0.5])
+    assert tiling.suppress_duplicates(boxes, scores).tolist() == [1, 2]
+
+
+def test_word_wider_than_the_overlap_is_read_as_one_union():
+    # Three tiles across a 2000 px wide strip; the word spans 800 px, wider than TILE_OVERLAP_X
+    tiles = tiling.tile_grid(200, 2000, tile=1024, overlap=128, overlap_x=256)
+    word = (600, 80, 1400, 120)
+    boxes, origins = [], []
+    for tile in tiles:
+        y0, y1, x0, x1 = tile
+        piece = (max(word[0], x0), word[1], min(word[2], x1), word[3])
+        if piece[0] < piece[2]:
+            boxes.append(piece)
+            origins.append(tile)
+    boxes = np.array(boxes, dtype=np.float64)
+    cut = tiling.cut_flags(boxes, np.array(origins), 200, 2000)
+    assert cut.all() and (boxes[:, 2] - boxes[:, 0] < word[2] - word[0]).all()
+
+    pieces = tiling.cut_pieces(boxes, cut)
+    assert len(pieces) == 1
+    members, union = pieces[0]
+    assert sorted(members.tolist()) == list(range(len(boxes)))
+    assert union.tolist() == list(word)
+
+
+def test_cut_word_with_a_whole_copy_is_left_to_suppression():
+    boxes = np.array([[900, 10, 1024, 40], [900, 10, 1100, 40], [780, 10, 1100, 40]], dtype=np.float64)
+    cut = np.array([True, True, False])
+    assert tiling.cut_pieces(boxes, cut) == []
+
+
+def test_pieces_on_different_lines_are_not_joined():
+    boxes = np.array([[600, 10, 1024, 40], [768, 10, 1200, 40], [600, 100, 1024, 130]], dtype=np.float64)
+    pieces = tiling.cut_pieces(boxes, np.ones(3, dtype=bool))
+    assert [members.tolist() for members, _ in pieces] == [[0, 1]]